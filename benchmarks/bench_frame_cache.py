@@ -0,0 +1,89 @@
+import io
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import frame_cache  # noqa: E402
+from bench_sheet_fetch import roster_csv  # noqa: E402
+from dashboard_data import ROSTER_SKIPROWS, clean_roster  # noqa: E402
+
+
+def timed(fn):
+    start = time.perf_counter()
+    out = fn()
+    return out, (time.perf_counter() - start) * 1000
+
+
+# ---------------- EVICTION ----------------
+def check_eviction():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        df = clean_roster(pd.read_csv(io.StringIO(roster_csv(2_000)), skiprows=ROSTER_SKIPROWS))
+        frame_cache.put("roster", "a", df, cache_dir)
+        size = frame_cache.entries(cache_dir)[0][1]
+        time.sleep(0.01)
+        frame_cache.put("roster", "b", df, cache_dir)
+        time.sleep(0.01)
+        frame_cache.put("jobs", "c", df, cache_dir, max_bytes=int(size * 2.5))
+        names = [p.name for p, _, _ in frame_cache.entries(cache_dir)]
+        assert names == ["roster-b.arrow", "jobs-c.arrow"], names
+        frame_cache.purge(cache_dir, "jobs")
+        assert [p.name for p, _, _ in frame_cache.entries(cache_dir)] == ["roster-b.arrow"]
+    print("✅ LRU eviction and purge OK")
+
+
+def check_concurrent_puts(writers=4, puts=30):
+    # Loads of the same sheet version racing to fill the cache all succeed
+    # and leave one readable file; a cache dir that can't be written doesn't
+    # fail the put
+    df = clean_roster(pd.read_csv(io.StringIO(roster_csv(2_000)), skiprows=ROSTER_SKIPROWS))
+    with tempfile.TemporaryDirectory() as cache_dir:
+        results, errors = [], []
+
+        def put():
+            for _ in range(puts):
+                try:
+                    results.append(frame_cache.put("roster", "same", df, cache_dir))
+                except Exception as e:
+                    errors.append(e)
+
+        threads = [threading.Thread(target=put) for _ in range(writers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert not errors, f"{len(errors)} of {writers * puts} puts raised, e.g. {errors[0]!r}"
+        assert all(results) and sorted(p.name for p in Path(cache_dir).iterdir()) == ["roster-same.arrow"]
+        frame_cache._memory.clear()
+        pd.testing.assert_frame_equal(frame_cache.get("roster", "same", cache_dir), df)
+
+        blocked = Path(cache_dir) / "not-a-dir"
+        blocked.write_text("")
+        assert frame_cache.put("roster", "blocked", df, blocked) is False
+        pd.testing.assert_frame_equal(frame_cache.get("roster", "blocked", blocked), df)  # still in memory
+    print(f"✅ {writers} concurrent puts × {puts} of one version, none raised; an unwritable dir is skipped")
+
+
+# ---------------- BENCHMARK ----------------
+def bench(n_rows):
+    raw = roster_csv(n_rows).encode()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cleaned, parse_ms = timed(lambda: clean_roster(pd.read_csv(io.BytesIO(raw), skiprows=ROSTER_SKIPROWS)))
+        frame_cache.put("roster", "bench", cleaned, cache_dir)
+        frame_cache._memory.clear()
+        from_disk, mmap_ms = timed(lambda: frame_cache.get("roster", "bench", cache_dir))
+        _, memory_ms = timed(lambda: frame_cache.get("roster", "bench", cache_dir))
+        pd.testing.assert_frame_equal(from_disk, cleaned)
+    print(f"{n_rows:>7} rows  parse + clean {parse_ms:8.1f} ms | mmap Feather {mmap_ms:7.1f} ms | in-process {memory_ms:6.2f} ms")
+
+
+if __name__ == "__main__":
+    check_eviction()
+    check_concurrent_puts()
+    for n in [1_000, 10_000, 100_000]:
+        bench(n)
@@ -0,0 +1,145 @@
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_match_scoring import make_candidates, make_jobs  # noqa: E402
+from match_cache import MatchCache  # noqa: E402
+from match_scoring import top_k_matches  # noqa: E402
+from salary import add_salary_columns  # noqa: E402
+
+
+# ---------------- EDITS ----------------
+def tick_week(candidates, jobs, rng):
+    candidates = candidates.copy()
+    row = rng.integers(len(candidates))
+    candidates.loc[candidates.index[row], "Week"] = candidates["Week"].iloc[row] + 1
+    return candidates, jobs
+
+
+def add_job(candidates, jobs, rng):
+    # Usually a second opening with the same account/title/city as an existing one
+    new = jobs.iloc[[rng.integers(len(jobs))]].copy()
+    new["Salary Mid"] = rng.choice([60000.0, 75000.0, 90000.0])
+    return candidates, pd.concat([jobs, new], ignore_index=True)
+
+
+def drop_job(candidates, jobs, rng):
+    return candidates, jobs.drop(jobs.index[rng.integers(len(jobs))]).reset_index(drop=True)
+
+
+def shuffle_jobs(candidates, jobs, rng):
+    return candidates, jobs.iloc[rng.permutation(len(jobs))].reset_index(drop=True)
+
+
+def add_candidate(candidates, jobs, rng):
+    new = candidates.iloc[[rng.integers(len(candidates))]].copy()
+    new["MIT Name"] = f"Candidate new {rng.integers(1_000_000)}"
+    new["VERT"] = "AVI"
+    return pd.concat([new, candidates], ignore_index=True), jobs
+
+
+def drop_candidate(candidates, jobs, rng):
+    return candidates.drop(candidates.index[rng.integers(len(candidates))]), jobs
+
+
+def retype_note(candidates, jobs, rng):
+    # Same text, different type: only the row hash can tell these apart
+    candidates = candidates.copy()
+    candidates["Week"] = candidates["Week"].astype(object)
+    candidates.loc[candidates.index[0], "Week"] = str(candidates["Week"].iloc[0])
+    return candidates, jobs
+
+
+def add_column(candidates, jobs, rng):
+    candidates = candidates.copy()
+    candidates["Background"] = rng.choice(["Amazon ops", "retail"], size=len(candidates))
+    return candidates, jobs
+
+
+EDITS = [tick_week, add_job, drop_job, shuffle_jobs, add_candidate, drop_candidate, retype_note, add_column]
+
+
+# ---------------- PARITY ----------------
+def check_parity(steps=200, n_candidates=120, n_jobs=60, k=3, seed=0):
+    rng = np.random.default_rng(seed)
+    candidates = add_salary_columns(make_candidates(n_candidates))
+    jobs = add_salary_columns(make_jobs(n_jobs))
+    cache = MatchCache()
+    for step in range(steps):
+        edit = EDITS[rng.integers(len(EDITS) - 2)] if step % 25 else EDITS[step // 25 % len(EDITS)]
+        candidates, jobs = edit(candidates, jobs, rng)
+        if candidates["Week"].dtype == object and rng.random() < 0.5:
+            candidates["Week"] = pd.to_numeric(candidates["Week"])
+        pd.testing.assert_frame_equal(
+            cache.top_k(candidates, jobs, k=k, chunk_pairs=500), top_k_matches(candidates, jobs, k=k)
+        )
+    print(f"✅ Incremental top-{k} identical to a full recompute over {steps} edits "
+          f"({cache.full_recomputes} full recomputes)")
+
+
+def check_size_cap(n_candidates=120, n_jobs=60, k=3):
+    # Above max_pairs nothing is cached; back under it, the cache starts over
+    rng = np.random.default_rng(2)
+    candidates = add_salary_columns(make_candidates(n_candidates))
+    jobs = add_salary_columns(make_jobs(n_jobs))
+    cache = MatchCache(max_pairs=n_candidates * n_jobs)
+    cache.top_k(candidates, jobs, k)
+    candidates, jobs = add_job(candidates, jobs, rng)
+    pd.testing.assert_frame_equal(cache.top_k(candidates, jobs, k), top_k_matches(candidates, jobs, k))
+    assert cache._packed is None and not cache.last_update["cached"]
+    candidates, jobs = drop_job(candidates, jobs, rng)
+    pd.testing.assert_frame_equal(cache.top_k(candidates, jobs, k), top_k_matches(candidates, jobs, k))
+    assert cache.last_update["cached"] and cache.full_recomputes == 2
+    print("✅ Above max_pairs the cache falls back to top_k_matches and holds nothing")
+
+
+# ---------------- BENCHMARK ----------------
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def peak_mb(fn):
+    # Peak MB allocated while fn ran (traced separately: tracemalloc slows pandas)
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def bench(n_candidates, n_jobs, k=3):
+    rng = np.random.default_rng(1)
+    candidates = add_salary_columns(make_candidates(n_candidates))
+    jobs = add_salary_columns(make_jobs(n_jobs))
+    cache, traced = MatchCache(), MatchCache()  # same calls, one timed and one traced
+    first = timed(lambda: cache.top_k(candidates, jobs, k))
+    first_mb = peak_mb(lambda: traced.top_k(candidates, jobs, k))
+    print(f"{n_candidates:>6}×{n_jobs:<5} {'first load':<13} {first:6.3f}s peak {first_mb:5.1f} MB "
+          f"| cache holds {cache._packed.nbytes / 1e6:.1f} MB")
+
+    for edit in [tick_week, add_job, shuffle_jobs]:
+        candidates, jobs = edit(candidates, jobs, rng)
+        incremental = timed(lambda: cache.top_k(candidates, jobs, k))
+        incremental_mb = peak_mb(lambda: traced.top_k(candidates, jobs, k))
+        full = timed(lambda: top_k_matches(candidates, jobs, k))
+        full_mb = peak_mb(lambda: top_k_matches(candidates, jobs, k))
+        update = cache.last_update
+        print(f"{n_candidates:>6}×{n_jobs:<5} {edit.__name__:<13} {incremental:6.3f}s peak {incremental_mb:5.1f} MB "
+              f"({update['pairs rescored']:>8} of {update['pairs total']} pairs) "
+              f"| full {full:6.3f}s peak {full_mb:5.1f} MB")
+
+
+if __name__ == "__main__":
+    check_parity()
+    check_size_cap()
+    bench(1_000, 500)
+    bench(5_000, 2_000)
+    bench(10_000, 2_000)
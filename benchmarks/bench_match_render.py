@@ -0,0 +1,105 @@
+import json
+import logging
+import os
+import sys
+import warnings
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import dashboard_data  # noqa: E402
+from segments import MATCH_PAGE_SIZE  # noqa: E402
+from synthetic_data import jobs_csv, roster_csv  # noqa: E402
+import streamlit as st  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+# ==========================================================
+# MATCH BREAKDOWN RENDERING
+# ----------------------------------------------------------
+# Runs app.py headless (AppTest) on synthetic rosters of growing size and
+# counts what the Placement Readiness Breakdown puts on the page in each
+# view: one dataframe for "All matches", at most MATCH_PAGE_SIZE expanders
+# for "By candidate". The old layout drew one expander (and k + 1 markdown
+# elements) per candidate.
+# ==========================================================
+
+APP_PATH = str(ROOT / "app.py")
+TOP_K = 3
+
+
+class SpanLog(logging.Handler):
+    # Collects app.py's timing spans by stage
+    def __init__(self):
+        super().__init__()
+        self.spans = {}
+
+    def emit(self, record):
+        event = json.loads(record.getMessage())
+        if event["event"] == "span":
+            self.spans[event["stage"]] = event["ms"]
+
+
+def run_app(n, m):
+    # AppTest on n candidates / m jobs (blank weeks included); the loaders are
+    # swapped for the synthetic frames, no sheet cache or snapshot involved
+    roster = dashboard_data.clean_roster(dashboard_data.parse_sheet(roster_csv(n), dashboard_data.ROSTER_SKIPROWS))
+    jobs = dashboard_data.clean_jobs(dashboard_data.parse_sheet(jobs_csv(m), dashboard_data.JOBS_SKIPROWS))
+    dashboard_data.load_data = lambda *a, **k: roster.copy()
+    dashboard_data.load_jobs_data = lambda *a, **k: jobs.copy()
+    st.cache_resource.clear()  # the sheet cache outlives an AppTest
+    at = AppTest.from_file(APP_PATH, default_timeout=600).run()
+    assert not at.exception, at.exception
+    return at
+
+
+def match_table(at):
+    return next(d.value for d in at.dataframe if "Candidate" in d.value.columns)
+
+
+# ---------------- VIEWS ----------------
+def check_views(spans, n=2_000, m=200):
+    at = run_app(n, m)
+    table = match_table(at)
+    seeking = table["Candidate"].nunique()
+    assert len(table) == TOP_K * seeking and not len(at.expander)
+    assert (table.groupby("Candidate", sort=False)["Rank"].apply(list) == [list(range(1, TOP_K + 1))] * seeking).all()
+
+    at.radio[0].set_value("By candidate").run()
+    assert len(at.expander) == MATCH_PAGE_SIZE, len(at.expander)
+    first_page = [e.label for e in at.expander]
+    assert first_page[0].split(" — ")[0][2:] == table["Candidate"].iloc[0]  # same candidate order as the table
+
+    pages = -(-seeking // MATCH_PAGE_SIZE)
+    at.number_input[0].set_value(pages).run()
+    assert len(at.expander) == seeking - (pages - 1) * MATCH_PAGE_SIZE
+
+    at.text_input[0].set_value(table["Candidate"].iloc[5][-4:]).run()
+    assert 1 <= len(at.expander) <= MATCH_PAGE_SIZE and at.number_input[0].value == 1
+    at.text_input[0].set_value("no such candidate").run()
+    assert not len(at.expander) and not at.exception
+    print(f"✅ {seeking} candidates: one {len(table)}-row table, {pages} pages of {MATCH_PAGE_SIZE} cards, "
+          "search resets to page 1")
+
+
+# ---------------- BENCHMARK ----------------
+def bench(spans, sizes=(500, 2_000, 8_000), m=300):
+    print(f"{'candidates':>10} {'seeking':>8} | {'old layout':>19} | {'All matches':>22} | {'By candidate':>22}")
+    for n in sizes:
+        at = run_app(n, m)
+        seeking = match_table(at)["Candidate"].nunique()
+        table_ms = spans["match_render"]
+        at.radio[0].set_value("By candidate").run()
+        cards = len(at.expander)
+        print(f"{n:>10} {seeking:>8} | {seeking:>6} expanders {seeking * (TOP_K + 1):>6} md"
+              f" | 1 table {table_ms:8.1f} ms render | {cards:>3} cards {spans['match_render']:8.1f} ms render")
+
+
+if __name__ == "__main__":
+    warnings.filterwarnings("ignore")
+    os.environ["DASHBOARD_TIMING_LOG"] = "INFO"
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    spans = SpanLog()
+    logging.getLogger("mit_dashboard.timing").addHandler(spans)  # timing.configure_logging() then adds none
+    check_views(spans.spans)
+    bench(spans.spans)
@@ -0,0 +1,97 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import legacy  # noqa: E402
+from match_scoring import match_table  # noqa: E402
+from salary import SALARY_MID  # noqa: E402
+
+# ---------------- SYNTHETIC DATA ----------------
+CITIES = [("Dallas", "TX"), ("Austin", "TX"), ("Seattle", "WA"), ("Atlanta", "GA"),
+          ("Chicago", "IL"), ("Phoenix", "AZ"), ("Denver", "CO"), ("Miami", "FL")]
+VERTS = ["AVI", "M&D", "EDU", "RBC", "DEF", "", None]
+JOB_SALARIES = ["$70,000", "70k-75k", "72,000 – 80,000", "68_74k", "85000", "", "TBD", "90k—95k"]
+
+
+def make_candidates(n, seed=0):
+    rng = np.random.default_rng(seed)
+    city = rng.integers(len(CITIES), size=n)
+    week = rng.choice([np.nan, 0, 1, 2, 3, 4, 5, 6, 7, 9, 12, 2.3, 4.7, 5.5], size=n)
+    return pd.DataFrame({
+        "MIT Name": [f"Candidate {i}" for i in range(n)],
+        "Location": [
+            f"{CITIES[k][0]}, {CITIES[k][1]}" if r < 0.6 else CITIES[k][0] if r < 0.9 else None
+            for k, r in zip(city, rng.random(n))
+        ],
+        "Week": week,
+        "Salary": rng.choice([np.nan, 65000, 70000, 72500, 80000, 0], size=n),
+        "Status": rng.choice(["training", "unassigned", "free agent discussing opportunity"], size=n),
+        "VERT": rng.choice(np.array(VERTS, dtype=object), size=n),
+        "Confidence": rng.choice(np.array(["High", "Moderate", "low", "", None], dtype=object), size=n),
+        "Notes": rng.choice(np.array(["Amazon site lead", "aviation", "retail", None], dtype=object), size=n),
+    })
+
+
+def make_jobs(n, seed=1):
+    rng = np.random.default_rng(seed)
+    city = rng.integers(len(CITIES), size=n)
+    return pd.DataFrame({
+        "Account": rng.choice(["Boeing", "Amazon", "Delta", ""], size=n),
+        "Job Title": rng.choice(["Site Manager", "Ops Manager", ""], size=n),
+        "City": [CITIES[k][0] for k in city],
+        "State": [CITIES[k][1] if r > 0.1 else "" for k, r in zip(city, rng.random(n))],
+        "VERT": rng.choice(["AVI", "M&D", "EDU", "RBC", ""], size=n),
+        "Salary": rng.choice(JOB_SALARIES, size=n),
+    })
+
+
+def with_salary_mid(df):
+    # Old SalaryMid column for the legacy loop, same values under the new name
+    df = df.copy()
+    df["SalaryRange"] = df["Salary"].apply(legacy.parse_salary)
+    df["SalaryMid"] = df["SalaryRange"].apply(legacy.midpoint)
+    df[SALARY_MID] = pd.to_numeric(df["SalaryMid"], errors="coerce")
+    return df
+
+
+# ---------------- PARITY ----------------
+def check_parity(n_candidates=300, n_jobs=150):
+    candidates = with_salary_mid(make_candidates(n_candidates))
+    jobs = with_salary_mid(make_jobs(n_jobs))
+    expected = legacy.match_results(candidates, jobs)
+    actual = match_table(candidates, jobs)
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+    print(f"✅ Parity OK on {n_candidates}×{n_jobs} pairs")
+
+
+# ---------------- BENCHMARK ----------------
+def bench(n_candidates, n_jobs, run_legacy=False):
+    candidates = with_salary_mid(make_candidates(n_candidates))
+    jobs = with_salary_mid(make_jobs(n_jobs))
+
+    start = time.perf_counter()
+    match_table(candidates, jobs)
+    vectorized = time.perf_counter() - start
+    line = f"{n_candidates:>6}×{n_jobs:<5} vectorized {vectorized:8.3f}s"
+
+    if run_legacy:
+        start = time.perf_counter()
+        legacy.match_results(candidates, jobs)
+        line += f" | iterrows {time.perf_counter() - start:8.3f}s"
+    print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the candidate×job match scoring")
+    parser.add_argument("--legacy", action="store_true", help="also time the original iterrows loop (slow)")
+    args = parser.parse_args()
+
+    check_parity()
+    bench(1_000, 1_000, run_legacy=args.legacy)
+    bench(10_000, 2_000)
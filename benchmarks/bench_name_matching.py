@@ -0,0 +1,99 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from name_matching import DEFAULT_THRESHOLD, match_names, similarity  # noqa: E402
+
+# ---------------- SYNTHETIC NAMES ----------------
+ONSETS = ["", "b", "br", "ch", "d", "j", "k", "l", "m", "n", "p", "r", "s", "sh", "t", "th", "v", "w", "z"]
+VOWELS = ["a", "e", "i", "o", "u", "ai", "ee", "ia", "ou", "y"]
+CODAS = ["", "", "n", "r", "s", "l", "m", "nd", "rt", "x", "ck"]
+
+
+def make_names(n, seed):
+    # "first [middle] last" names from random syllables, a fifth of them with a
+    # one-letter typo
+    rng = np.random.default_rng(seed)
+
+    def word(syllables):
+        return "".join(rng.choice(ONSETS) + rng.choice(VOWELS) + rng.choice(CODAS) for _ in range(syllables))
+
+    names = []
+    for _ in range(n):
+        parts = [word(rng.integers(1, 3)), word(1) if rng.random() < 0.2 else "", word(rng.integers(1, 4))]
+        name = " ".join(p for p in parts if p)
+        if rng.random() < 0.2:
+            k = rng.integers(len(name))
+            name = name[:k] + rng.choice(list("abcdefghijklmnopqrstuvwxyz")) + name[k + 1:]
+        names.append(name)
+    return names
+
+
+def all_pairs(left, right):
+    # The original nested loop, keeping every score
+    rows = [(i, j, similarity(a, b)) for i, a in enumerate(left) for j, b in enumerate(right)]
+    return pd.DataFrame(rows, columns=["Left", "Right", "Similarity"])
+
+
+# ---------------- PARITY ----------------
+def check_bundled():
+    # The two lists compare_active_mit_only.py fuzzy-matches, as last written
+    root = Path(__file__).resolve().parent.parent
+    left = pd.read_csv(root / "only_in_combined.csv")["Only in Combined"].fillna("").tolist()
+    right = pd.read_csv(root / "only_in_active.csv")["Only in Active"].fillna("").tolist()
+    scored = all_pairs(left, right)
+    expected = scored[scored["Similarity"] >= DEFAULT_THRESHOLD].reset_index(drop=True)
+    pd.testing.assert_frame_equal(match_names(left, right), expected, check_dtype=False)
+    print(f"✅ Same pairs as the all-pairs loop on the bundled lists ({len(left)}×{len(right)}, {len(expected)} pairs)")
+
+
+def check_parity(n=400):
+    left, right = make_names(n, 0), make_names(n, 1)
+    # Near duplicates of left names so every threshold has pairs to find
+    rng = np.random.default_rng(4)
+    for name in left[:150]:
+        k = rng.integers(len(name))
+        right.append(name[:k] + rng.choice(list("aeiou ")) + name[k + rng.integers(0, 2):])
+    left += ["", "a", "shaquille thomas", "ab"]
+    right += ["", "b", "shaquille thompson", "ba"]
+    scored = all_pairs(left, right)
+    thresholds = [DEFAULT_THRESHOLD, 0.6, 0.9, 1.0, 0.0]
+    for threshold in thresholds:
+        expected = scored[scored["Similarity"] >= threshold].reset_index(drop=True)
+        pd.testing.assert_frame_equal(match_names(left, right, threshold), expected, check_dtype=False)
+    found = (scored["Similarity"] >= DEFAULT_THRESHOLD).sum()
+    print(f"✅ Same pairs as the all-pairs loop on {len(left)}×{len(right)} names at {len(thresholds)} "
+          f"thresholds ({found} pairs at {DEFAULT_THRESHOLD})")
+
+
+# ---------------- BENCHMARK ----------------
+def bench(n, threshold):
+    left, right = make_names(n, 2), make_names(n, 3)
+    start = time.perf_counter()
+    found = match_names(left, right, threshold)
+    elapsed = time.perf_counter() - start
+
+    # All-pairs time extrapolated from a 200-name sample of the left side
+    start = time.perf_counter()
+    for a in left[:200]:
+        for b in right:
+            similarity(a, b)
+    loop = (time.perf_counter() - start) * n / 200
+    print(f"{n:>6}×{n:<6} t={threshold}  indexed {elapsed:7.2f}s ({len(found)} pairs) | all pairs ~{loop:7.1f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the indexed fuzzy name matcher")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    check_bundled()
+    check_parity()
+    bench(1_000, args.threshold)
+    bench(10_000, args.threshold)
@@ -0,0 +1,81 @@
+import os
+import warnings
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import compare_active_mit_only as reconciler  # noqa: E402
+from bench_name_matching import make_names  # noqa: E402
+from bench_reconciler import COLS, make_rosters  # noqa: E402
+from name_matching import match_names, match_names_parallel  # noqa: E402
+
+warnings.filterwarnings("ignore", module="openpyxl")  # unsupported extension notices
+
+WORKER_COUNTS = [1, 2, 4, 8]
+
+
+# ---------------- PARITY ----------------
+def check_frames():
+    left, right = make_names(600, 1), make_names(700, 2)
+    pairs = {}
+    for threshold in [0.6, 0.78]:
+        serial = match_names(left, right, threshold)
+        pairs[threshold] = len(serial)
+        for workers, shards in [(2, 4), (3, 1), (4, 500)]:
+            parallel = match_names_parallel(left, right, threshold, workers=workers, shards_per_worker=shards)
+            pd.testing.assert_frame_equal(parallel, serial)
+    pd.testing.assert_frame_equal(match_names_parallel([], right, workers=2), match_names([], right))
+    pd.testing.assert_frame_equal(match_names_parallel(left[:3], right, workers=4), match_names(left[:3], right))
+    print(f"✅ Sharded matches identical to match_names() ({pairs[0.6]} pairs at 0.6, {pairs[0.78]} at 0.78; "
+          f"1-500 shards per worker)")
+
+
+def assert_same_outputs(combined, active, cols, worker_counts):
+    # Serial and pooled reconciliations write the same bytes
+    with tempfile.TemporaryDirectory() as tmp:
+        serial_dir = Path(tmp) / "serial"
+        serial_dir.mkdir()
+        reconciler.write_outputs(reconciler.reconcile(combined, active, cols), serial_dir)
+        for workers in worker_counts:
+            out_dir = Path(tmp) / f"workers{workers}"
+            out_dir.mkdir()
+            reconciler.write_outputs(reconciler.reconcile(combined, active, cols, workers=workers), out_dir)
+            for path in serial_dir.iterdir():
+                assert (out_dir / path.name).read_bytes() == path.read_bytes(), f"{path.name} differs"
+
+
+def check_outputs(n=3_000):
+    combined, active, cols = reconciler.load_inputs(ROOT / reconciler.COMBINED_PATH, ROOT / reconciler.EXCEL_PATH)
+    assert_same_outputs(combined, active, cols, [2, 3])
+    combined, active = make_rosters(n)
+    assert_same_outputs(combined, active, COLS, [2, 4])
+    print(f"✅ Reconciler outputs byte-identical with 1-4 workers on the bundled inputs and {n}-row rosters")
+
+
+# ---------------- BENCHMARK ----------------
+def bench(n):
+    left, right = make_names(n, 1), make_names(n, 2)
+    start = time.perf_counter()
+    match_names(left, right)
+    serial = time.perf_counter() - start
+    line = [f"{n:>6}×{n:<6} serial {serial:6.2f}s"]
+    for workers in WORKER_COUNTS:
+        start = time.perf_counter()
+        match_names_parallel(left, right, workers=workers)
+        elapsed = time.perf_counter() - start
+        line.append(f"{workers} workers {elapsed:6.2f}s (×{serial / elapsed:4.2f})")
+    print(" | ".join(line))
+
+
+if __name__ == "__main__":
+    check_frames()
+    check_outputs()
+    print(f"CPUs available: {len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()}")
+    for n in [3_000, 10_000]:
+        bench(n)
@@ -0,0 +1,137 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from pipeline_io import SUFFIXES, read_frame, typed_path, write_frame  # noqa: E402
+
+SITES = ["Ford", "Delta", "Intel", "Tesla", "Amazon", "Boeing", "Pfizer", "Nike"]
+CITIES = ["Detroit, MI", "Queens, NY", "Hillsboro, OR", "Fremont, CA", "Seattle, WA", "Austin, TX"]
+
+
+# ---------------- SYNTHETIC COMBINED ROSTER ----------------
+def make_combined(n, seed=0):
+    # Same columns as combined_mit_data.csv; Week mixes numbers and "N/A"
+    # like the real merge output, start dates are midnight timestamps
+    rng = np.random.default_rng(seed)
+    offers = rng.random(n) < 0.3
+    weeks = rng.integers(1, 13, n).astype(object)
+    weeks[offers] = 0
+    weeks[rng.random(n) < 0.05] = "N/A"
+    start = pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 700, n), unit="D")
+    start = pd.Series(start).where(rng.random(n) > 0.02)
+    return pd.DataFrame({
+        "MIT Name": [f"Trainee {i} {chr(65 + i % 26)}son" for i in range(n)],
+        "Week": weeks,
+        "Start date": start,
+        "Training Site": np.array(SITES, dtype=object)[rng.integers(0, len(SITES), n)],
+        "Location": np.array(CITIES, dtype=object)[rng.integers(0, len(CITIES), n)],
+        "Status": np.where(offers, "Offer Accepted", "N/A").astype(object),
+        "Level": np.where(rng.random(n) < 0.2, "SMIT", "OM").astype(object),
+        "Vert": "N/A",
+        "Source": np.where(offers, "Offer Accepted", "Active Roster").astype(object),
+    })
+
+
+# ---------------- PARITY ----------------
+def check_round_trip(tmp):
+    df = make_combined(2_000)
+    csv_path = Path(tmp) / "combined.csv"
+    write_frame(df, csv_path, "csv")
+    reference = csv_path.read_bytes()
+    assert not pd.api.types.is_datetime64_any_dtype(read_frame(csv_path, "csv")["Start date"])
+    for fmt in ["feather", "parquet"]:
+        write_frame(df, csv_path, fmt)
+        assert csv_path.read_bytes() == reference, f"{fmt}: CSV export differs"
+        typed = [p.name for p in Path(tmp).iterdir() if p.suffix in SUFFIXES.values()]
+        assert typed == [typed_path(csv_path, fmt).name], f"{fmt}: typed files {typed}"
+        back = read_frame(csv_path, fmt)
+        assert str(back["Start date"].dtype).startswith("datetime64"), f"{fmt}: dates read as text"
+        pd.testing.assert_series_equal(back["Start date"], df["Start date"], check_dtype=False)
+        weeks = df["Week"].map(lambda v: v if pd.isna(v) else str(v))
+        assert back["Week"].tolist() == weeks.tolist(), f"{fmt}: mixed Week column not kept as text"
+        for col in ["MIT Name", "Training Site", "Status", "Vert"]:  # "N/A" text stays text
+            assert back[col].tolist() == df[col].tolist(), f"{fmt}: {col} differs"
+    write_frame(df, csv_path, "csv")
+    assert not any(p.suffix in (".arrow", ".parquet") for p in Path(tmp).iterdir()), "stale typed file left"
+    print("✅ CSV export identical in every format; typed files keep dates as datetime64 and text as written")
+
+
+def check_pipeline(tmp):
+    # CSV exports of the extract and merge stages are byte-identical whichever
+    # format the stages hand each other
+    exports = {}
+    for fmt in SUFFIXES:
+        work = Path(tmp) / fmt
+        work.mkdir()
+        for book in ROOT.glob("*.xlsx"):
+            (work / book.name).symlink_to(book)
+        subprocess.run([sys.executable, str(ROOT / "run_pipeline.py"), "--dir", str(work), "--format", fmt],
+                       capture_output=True, check=True)
+        exports[fmt] = {name: (work / name).read_bytes() for name in
+                        ["active_roster_unplaced.csv", "offer_accepted_candidates.csv", "combined_mit_data.csv"]}
+    assert exports["feather"] == exports["csv"] and exports["parquet"] == exports["csv"], "pipeline exports differ"
+    print("✅ Pipeline CSV exports identical with csv, feather and parquet intermediates")
+
+
+NO_PYARROW_CHECK = """
+import os, sys
+sys.modules["pyarrow"] = None  # as if pyarrow weren't installed
+sys.path.insert(0, {root!r})
+from pipeline_io import pipeline_format
+assert pipeline_format() == "csv"
+for fmt, env in [("parquet", None), (None, "feather")]:
+    os.environ["PIPELINE_FORMAT"] = env or ""
+    try:
+        pipeline_format(fmt)
+        raise AssertionError(f"{{fmt or env}} silently fell back")
+    except ValueError as e:
+        assert "pyarrow" in str(e), e
+"""
+
+
+def check_without_pyarrow():
+    # CSV needs nothing extra; asking for feather/parquet without pyarrow is
+    # an error rather than a quiet CSV run
+    subprocess.run([sys.executable, "-c", NO_PYARROW_CHECK.format(root=str(ROOT))], check=True,
+                   env={k: v for k, v in os.environ.items() if k != "PIPELINE_FORMAT"})
+    print("✅ Without pyarrow: csv by default, an explicit feather/parquet raises")
+
+
+# ---------------- BENCHMARK ----------------
+def bench(n, tmp):
+    # write = what a stage pays (the CSV export plus, if any, the typed file);
+    # read = what the next stage pays
+    df = make_combined(n, seed=n)
+    csv_path = Path(tmp) / f"bench_{n}.csv"
+    line = [f"{n:>9,} rows"]
+    for fmt in SUFFIXES:
+        start = time.perf_counter()
+        write_frame(df, csv_path, fmt)
+        written = time.perf_counter() - start
+        start = time.perf_counter()
+        back = read_frame(csv_path, fmt)
+        read = time.perf_counter() - start
+        size = (typed_path(csv_path, fmt) or csv_path).stat().st_size / 2**20
+        dates = "typed" if str(back["Start date"].dtype).startswith("datetime64") else "text"
+        line.append(f"{fmt}: write {written:5.2f}s read {read:5.2f}s {size:5.1f} MiB, dates {dates}")
+    print(" | ".join(line))
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        check_round_trip(tmp)
+    with tempfile.TemporaryDirectory() as tmp:
+        check_pipeline(tmp)
+    check_without_pyarrow()
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in [100_000, 1_000_000]:
+            bench(n, tmp)
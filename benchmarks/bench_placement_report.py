@@ -0,0 +1,95 @@
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from dashboard_data import JOBS_SKIPROWS, ROSTER_SKIPROWS, clean_jobs, clean_roster, parse_sheet  # noqa: E402
+from match_cache import MatchCache  # noqa: E402
+from placement_report import build_report, main, report_records  # noqa: E402
+from segments import READY, match_candidates, match_table, order_matches, segment_roster  # noqa: E402
+from synthetic_data import jobs_csv, roster_csv  # noqa: E402
+
+AS_OF = pd.Timestamp("2025-06-02")
+IMPORT_CHECK = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start, sorted({{m.split('.')[0] for m in sys.modules}} & {{'streamlit', 'plotly'}}))
+"""
+
+
+def frames(n, m):
+    roster = clean_roster(parse_sheet(roster_csv(n, as_of=AS_OF), ROSTER_SKIPROWS), AS_OF)
+    return roster, clean_jobs(parse_sheet(jobs_csv(m), JOBS_SKIPROWS))
+
+
+# ---------------- PARITY ----------------
+def check_parity(n=3_000, m=400):
+    # The report holds the same matches the dashboard shows
+    roster, jobs = frames(n, m)
+    report = build_report(roster, jobs)
+    dashboard = MatchCache().top_k(match_candidates(segment_roster(roster)), jobs, k=3)
+    pd.testing.assert_frame_equal(report.drop(columns="Stage"), dashboard)
+    # ...and labels each candidate's stage the way the match views do
+    shown = match_table(order_matches(dashboard)).groupby("Candidate")["Stage"].first()
+    stages = report.groupby("Candidate")["Stage"].first()
+    pd.testing.assert_series_equal(stages, shown.loc[stages.index])
+    week_six = report.loc[report["Week"] == 6, "Stage"]
+    assert len(week_six) and (week_six == READY).all()
+    records = report_records(report)
+    assert len(records) == report["Candidate"].nunique() and all(len(r["matches"]) == 3 for r in records)
+    empty = build_report(roster, jobs.iloc[:0])
+    assert empty.empty and "Stage" in empty.columns
+    print(f"✅ Report rows and stages identical to the dashboard's top-3 ({len(records)} candidates)")
+
+
+def check_cli(tmp):
+    tmp = Path(tmp)
+    (tmp / "roster.csv").write_bytes(roster_csv(500, as_of=AS_OF))
+    (tmp / "jobs.csv").write_bytes(jobs_csv(80))
+    outputs = {}
+    for suffix in ["csv", "json", "parquet"]:
+        out = tmp / f"report.{suffix}"
+        main(["--roster", str(tmp / "roster.csv"), "--jobs", str(tmp / "jobs.csv"), "--as-of", str(AS_OF.date()),
+              "-k", "2", "--output", str(out)])
+        outputs[suffix] = out
+    csv, parquet = pd.read_csv(outputs["csv"]), pd.read_parquet(outputs["parquet"])
+    assert len(csv) == len(parquet) and csv["Candidate"].tolist() == parquet["Candidate"].tolist()
+    records = json.loads(outputs["json"].read_text())
+    assert sum(len(r["matches"]) for r in records) == len(csv)
+    print("✅ CLI writes the same report as CSV, JSON and Parquet")
+
+
+def check_imports():
+    # Fresh interpreters: the CLI path never imports Streamlit or Plotly
+    for module in ["placement_report", "placement_report, streamlit, plotly.express"]:
+        out = subprocess.run([sys.executable, "-c", IMPORT_CHECK.format(module=module)], cwd=ROOT,
+                             capture_output=True, text=True, check=True).stdout.split(maxsplit=1)
+        print(f"   import {module:<46} {float(out[0]):5.2f}s  ui modules loaded: {out[1].strip()}")
+    out = subprocess.run([sys.executable, "-c", IMPORT_CHECK.format(module="placement_report")], cwd=ROOT,
+                         capture_output=True, text=True, check=True).stdout
+    assert out.strip().endswith("[]"), out
+
+
+# ---------------- BENCHMARK ----------------
+def bench(n, m):
+    roster, jobs = frames(n, m)
+    start = time.perf_counter()
+    report = build_report(roster, jobs)
+    print(f"{n:>8} candidates × {m:>5} jobs  build_report {time.perf_counter() - start:6.2f}s  ({len(report)} rows)")
+
+
+if __name__ == "__main__":
+    check_parity()
+    with tempfile.TemporaryDirectory() as tmp:
+        check_cli(tmp)
+    check_imports()
+    for n, m in [(10_000, 1_000), (100_000, 3_000)]:
+        bench(n, m)
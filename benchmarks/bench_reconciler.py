@@ -0,0 +1,147 @@
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import compare_active_mit_only as reconciler  # noqa: E402
+import legacy  # noqa: E402
+from bench_name_matching import make_names  # noqa: E402
+
+COLS = {"name": "trainee name", "program": "training program", "start": "start date", "site": "site"}
+
+
+# ---------------- REGRESSION ----------------
+def check_committed_outputs():
+    # Reruns the reconciler on the bundled inputs and compares with the CSVs
+    # committed next to it. Row order follows set iteration in the script, so
+    # lines are compared sorted.
+    combined, active_mit, cols = reconciler.load_inputs(
+        ROOT / reconciler.COMBINED_PATH, ROOT / reconciler.EXCEL_PATH
+    )
+    outputs = reconciler.reconcile(combined, active_mit, cols)
+    checked = []
+    with tempfile.TemporaryDirectory() as out_dir:
+        reconciler.write_outputs(outputs, out_dir)
+        for name in outputs:
+            committed = ROOT / name
+            if not committed.exists():
+                continue
+            new_lines = sorted((Path(out_dir) / name).read_text().splitlines())
+            assert new_lines == sorted(committed.read_text().splitlines()), f"{name} differs"
+            checked.append(name)
+    print(f"✅ Reconciler output matches the committed {', '.join(checked)}")
+
+
+def check_duplicates():
+    combined = pd.DataFrame({"MIT Name": ["Ana Lee", "ana  lee", "Bo Kim"], "Start date": ["2025-01-06"] * 3,
+                             "Training Site": ["Dallas", "Austin", "Reno"]})
+    active = pd.DataFrame({"trainee name": ["Ana Lee", "Bo Kim", "BO KIM"], "training program": ["MIT"] * 3,
+                           "start date": pd.to_datetime(["2025-01-06"] * 3), "site": ["Dallas", "Reno", "Ogden"]})
+    outputs = reconciler.reconcile(combined, active, COLS)
+    merged = outputs["merged_dashboard_ready.csv"].set_index("MIT Name")
+    assert merged.loc["Ana Lee", "Training Site"] == "Dallas"  # first combined row wins
+    assert merged.loc["Bo Kim", "Active Site"] == "Reno"  # first active row wins
+    dupes = outputs["duplicate_names_review.csv"]
+    assert dupes.groupby("Roster")["Row"].apply(list).to_dict() == {"Active": [1, 2], "Combined": [0, 1]}
+    print("✅ Duplicate clean names keep their first row and are listed for review")
+
+
+MESSY_DATES = ["2025-03-31", "2025-03-31 00:00:00", "03/31/2025", pd.Timestamp("2025-03-31 14:00"),
+               pd.Timestamp("2025-04-01"), "", "TBD", None, np.nan, pd.NaT, 20250331, "31 March 2025",
+               "2025-02-30", "2025-03-31 25:00:00", " 2025-03-31", "2025-03-31T08:00:00-05:00",
+               pd.Timestamp("2025-03-31 23:30", tz="US/Pacific")]
+MESSY_SITES = ["Dallas", " dallas ", "Dallas Love Field", "AUSTIN", "Reno", "", None, np.nan, 7, "las"]
+
+
+def check_confirmation(n_pairs=5_000):
+    # Vectorized date/site checks against the old per-pair helpers
+    rng = np.random.default_rng(0)
+    dates = np.empty(len(MESSY_DATES), dtype=object)
+    dates[:] = MESSY_DATES
+    sites = np.empty(len(MESSY_SITES), dtype=object)
+    sites[:] = MESSY_SITES
+    d1, d2 = dates[rng.integers(len(dates), size=n_pairs)], dates[rng.integers(len(dates), size=n_pairs)]
+    s1, s2 = sites[rng.integers(len(sites), size=n_pairs)], sites[rng.integers(len(sites), size=n_pairs)]
+
+    same_date = reconciler.normalize_dates(d1) == reconciler.normalize_dates(d2)
+    assert same_date.tolist() == [legacy.date_equalish(a, b) for a, b in zip(d1, d2)]
+    # Datetime columns take the direct path
+    excel = pd.Series(pd.to_datetime(["2025-03-31 14:00", None, "2025-04-01 00:00"]))
+    as_objects = pd.Series(list(excel), dtype=object)
+    assert (reconciler.normalize_dates(excel) == reconciler.normalize_dates(as_objects)).tolist() == [True, False, True]
+    same_site = reconciler.sites_overlap(reconciler.normalize_sites(s1), reconciler.normalize_sites(s2))
+    assert same_site.tolist() == [legacy.site_equalish(a, b) for a, b in zip(s1, s2)]
+    print(f"✅ Date/site confirmation matches the per-pair checks on {n_pairs} messy pairs")
+
+
+# ---------------- BENCHMARK ----------------
+def bench_confirmation(n_pairs):
+    combined, active = make_rosters(n_pairs)
+    c_dates, a_dates = combined["Start date"].to_numpy(), active["start date"].to_numpy()
+    c_sites, a_sites = combined["Training Site"].to_numpy(), active["site"].to_numpy()
+
+    start = time.perf_counter()
+    for a, b, c, d in zip(c_dates, a_dates, c_sites, a_sites):
+        legacy.date_equalish(a, b) or legacy.site_equalish(c, d)
+    per_pair = time.perf_counter() - start
+
+    start = time.perf_counter()
+    same_date = reconciler.normalize_dates(c_dates) == reconciler.normalize_dates(a_dates)
+    same_site = reconciler.sites_overlap(reconciler.normalize_sites(c_sites), reconciler.normalize_sites(a_sites))
+    same_date | same_site
+    vectorized = time.perf_counter() - start
+    print(f"{n_pairs:>7} pairs confirmation: per pair {per_pair:6.2f}s | normalized once {vectorized:6.3f}s")
+
+
+def make_rosters(n, seed=0):
+    rng = np.random.default_rng(seed)
+    names = make_names(2 * n, seed)
+    dates = pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 700, size=2 * n), unit="D")
+    sites = rng.choice(["Dallas", "Austin", "Reno", "Ogden", "Tampa"], size=2 * n)
+    combined = pd.DataFrame({"MIT Name": names[:n], "Start date": dates[:n].astype(str),
+                             "Training Site": sites[:n], "Status": "Training"})
+    # Half the active names are the combined ones, some with a one-letter typo
+    active_names = [name if rng.random() < 0.8 else name[:-1] + "x" for name in names[: n // 2]] + names[n + n // 2:]
+    active = pd.DataFrame({"trainee name": active_names, "training program": "MIT",
+                           "start date": dates[: n // 2].append(dates[n + n // 2:]), "site": sites[:n]})
+    return combined, active
+
+
+def bench(n):
+    combined, active = make_rosters(n)
+    combined["CleanName"] = combined["MIT Name"].apply(reconciler.clean_name)
+    lookups = combined["CleanName"].sample(min(n, 2_000), random_state=0).tolist()
+
+    start = time.perf_counter()
+    for name in lookups:
+        combined[combined["CleanName"] == name].iloc[0]
+    masked = (time.perf_counter() - start) / len(lookups)
+
+    start = time.perf_counter()
+    first, _ = reconciler.name_index(combined)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    first.iloc[first.index.get_indexer(lookups)]
+    indexed = (time.perf_counter() - start) / len(lookups)
+
+    start = time.perf_counter()
+    reconciler.reconcile(combined.drop(columns="CleanName"), active, COLS)
+    total = time.perf_counter() - start
+    print(f"{n:>7} rows  row lookup: mask {masked * 1e6:8.1f} µs | index {indexed * 1e6:5.2f} µs "
+          f"(built once in {build:5.2f}s)  full reconcile {total:6.2f}s")
+
+
+if __name__ == "__main__":
+    check_committed_outputs()
+    check_duplicates()
+    check_confirmation()
+    for n in [1_000, 10_000, 30_000]:
+        bench(n)
+    for n in [1_000, 10_000]:
+        bench_confirmation(n)
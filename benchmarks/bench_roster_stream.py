@@ -0,0 +1,128 @@
+import datetime as dt
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from workbook_ingest import MIT_PROGRAMS, iter_roster_batches, read_roster  # noqa: E402
+
+warnings.filterwarnings("ignore", module="openpyxl")  # unsupported extension notices
+
+MASTER_ROSTER = ROOT / "Copy of 2025 Leadership Development (NLT + MIT) Program Master Roster.xlsx"
+SHEETS = ["Active Roster", "Graduated Roster"]
+PROGRAMS = ["MIT", "SMIT", "NLT", "LDP", "Intern", None]
+PROGRAM_WEIGHTS = [0.15, 0.05, 0.35, 0.25, 0.15, 0.05]
+N_EXTRA_COLUMNS = 44  # the master roster is about 50 columns wide
+COLUMNS = ["trainee name", "training program", "training start date", "ops account- location"]
+
+
+# ---------------- SYNTHETIC MASTER ROSTER ----------------
+def make_master_roster(path, n_rows, seed=0):
+    # Both roster sheets with n_rows trainees each, a fifth of them MIT / SMIT
+    rng = np.random.default_rng(seed)
+    book = openpyxl.Workbook(write_only=True)
+    extra = [f"Checklist item {k}" for k in range(N_EXTRA_COLUMNS)]
+    for sheet in SHEETS:
+        ws = book.create_sheet(sheet)
+        ws.append(["Program Notes", "Training Program", "Training Start Date", "Trainee Name",
+                   "Ops Account- Location", "Salary"] + extra)
+        programs = rng.choice(len(PROGRAMS), size=n_rows, p=PROGRAM_WEIGHTS)
+        for i in range(n_rows):
+            day = dt.datetime(2021, 1, 4) + dt.timedelta(weeks=int(rng.integers(0, 250)))
+            ws.append([f"Week {i % 12}", PROGRAMS[programs[i]], day, f"Trainee {sheet[0]}{i}",
+                       f"Account {i % 300} - City", "80000" if i % 4 else 75000]
+                      + [day if k % 3 == 0 else bool(k % 2) for k in range(N_EXTRA_COLUMNS)])
+    book.save(path)
+
+
+# ---------------- PARITY ----------------
+def old_filtered(path, sheet):
+    df = pd.read_excel(path, sheet_name=sheet)
+    df.columns = df.columns.str.strip().str.lower()
+    return df[df["training program"].astype(str).str.upper().isin(["MIT", "SMIT"])]
+
+
+def assert_same_values(new, old, label):
+    # Rows kept and values agree; kept rows are typed on their own, so a column
+    # of numeric text can come back as numbers
+    assert new.index.tolist() == old.index.tolist(), f"{label}: rows differ"
+    for col in new.columns:
+        for x, y in zip(new[col].tolist(), old[col].tolist()):
+            same = (pd.isna(x) and pd.isna(y)) or x == y or str(x) == str(y)
+            assert same, f"{label} {col}: {x!r} != {y!r}"
+
+
+def check_parity(path, label):
+    for sheet in SHEETS:
+        full = pd.read_excel(path, sheet_name=sheet)
+        full.columns = full.columns.str.strip().str.lower()
+        pd.testing.assert_frame_equal(read_roster(path, sheet), full)
+        old = old_filtered(path, sheet)
+        columns = [c for c in COLUMNS if c in old.columns]
+        new = read_roster(path, sheet, MIT_PROGRAMS, columns)
+        assert_same_values(new, old[columns], label)
+        batches = list(iter_roster_batches(path, sheet, MIT_PROGRAMS, columns, batch_rows=7))
+        assert max(len(b) for b in batches) <= 7
+        assert_same_values(pd.concat(batches), new, label)
+    print(f"✅ {label}: full sheets identical to pd.read_excel, MIT / SMIT rows identical to the old filter")
+
+
+# ---------------- PEAK MEMORY ----------------
+def run_mode(mode, path):
+    # Runs in a child process so ru_maxrss is this mode's peak only
+    start = time.perf_counter()
+    if mode == "read_excel":  # compare_active_mit_only.py before
+        old_filtered(path, "Active Roster")
+    elif mode == "stream":
+        read_roster(path, "Active Roster", MIT_PROGRAMS, COLUMNS)
+    elif mode == "both sheets":  # compare_rosters.py before
+        xl = pd.ExcelFile(path)
+        for sheet in SHEETS:
+            xl.parse(sheet)
+    elif mode == "both streamed":
+        for sheet in SHEETS:
+            for batch in iter_roster_batches(path, sheet, MIT_PROGRAMS, ["trainee name"]):
+                batch["trainee name"].tolist()
+    elapsed = time.perf_counter() - start
+    print(f"{resource.getrusage(resource.RUSAGE_SELF).ru_maxrss} {elapsed}")
+
+
+def measure(mode, path):
+    out = subprocess.run([sys.executable, __file__, "--mode", mode, str(path)],
+                         capture_output=True, text=True, check=True).stdout.split()
+    return int(out[0]) / 1024, float(out[1])  # MiB (ru_maxrss is in KiB on Linux), seconds
+
+
+def bench(path, n_rows):
+    baseline, _ = measure("none", path)
+    line = [f"{n_rows:>7} rows/sheet  (imports alone {baseline:5.0f} MiB)"]
+    for old, new in [("read_excel", "stream"), ("both sheets", "both streamed")]:
+        old_rss, old_time = measure(old, path)
+        new_rss, new_time = measure(new, path)
+        line.append(f"{old}: {old_rss:5.0f} MiB {old_time:5.1f}s -> {new_rss:5.0f} MiB {new_time:5.1f}s")
+    print(" | ".join(line))
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--mode"]:
+        run_mode(sys.argv[2], sys.argv[3])
+        sys.exit()
+    check_parity(MASTER_ROSTER, "Bundled master roster")
+    with tempfile.TemporaryDirectory() as tmp:
+        small = Path(tmp) / "small.xlsx"
+        make_master_roster(small, 400)
+        check_parity(small, "Synthetic 400-row roster")
+        for n_rows in [10_000, 40_000]:
+            path = Path(tmp) / f"master_{n_rows}.xlsx"
+            make_master_roster(path, n_rows)
+            bench(path, n_rows)
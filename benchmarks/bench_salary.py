@@ -0,0 +1,90 @@
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import legacy  # noqa: E402
+from salary import SALARY_HIGH, SALARY_LOW, SALARY_MID, parse_salaries, parse_salary  # noqa: E402
+
+DASHES = ["-", "–", "—", "_", " - ", " – "]
+
+
+def random_salaries(n, seed=0):
+    # Mix of every format seen in the sheets plus junk and edge cases
+    rng = np.random.default_rng(seed)
+    out = []
+    for _ in range(n):
+        kind = rng.integers(9)
+        a, b = int(rng.integers(40, 140)), int(rng.integers(40, 140))
+        if kind == 0:
+            out.append(f"${a * 1000:,}")
+        elif kind == 1:
+            out.append(f"{a}k{rng.choice(DASHES)}{b}K")
+        elif kind == 2:
+            out.append(f"${a * 1000:,}{rng.choice(DASHES)}${b * 1000:,}")
+        elif kind == 3:
+            out.append(str(rng.choice(["", "TBD", "N/A", "nan", "inf", "1e5", "--", "70-75-80", "-70000", " 72.5k ", "70 000"])))
+        elif kind == 4:
+            out.append(float(a * 1000) if rng.random() < 0.8 else np.nan)
+        elif kind == 5:
+            out.append(None)
+        elif kind == 6:
+            out.append(f"{a}.{b}k")
+        elif kind == 7:
+            out.append(f"  ${a},{b:03d}  ")
+        else:
+            out.append(int(a * 1000))
+    return pd.Series(out, dtype=object)
+
+
+def legacy_columns(values):
+    parsed = values.apply(legacy.parse_salary)
+    low = parsed.map(lambda v: v[0] if isinstance(v, tuple) else v).astype(float)
+    high = parsed.map(lambda v: v[1] if isinstance(v, tuple) else v).astype(float)
+    mid = parsed.apply(legacy.midpoint).astype(float)
+    return low, high, mid
+
+
+# ---------------- PROPERTY CHECK ----------------
+def check_against_legacy(n=50_000):
+    values = random_salaries(n)
+    new = parse_salaries(values)
+    low, high, mid = legacy_columns(values)
+
+    # Anything the old parser read must come out identical. The only inputs
+    # it rejected that now parse are numbers with spaces in them ("70 000"),
+    # which the roster cleaning already accepted.
+    known = mid.notna() | low.notna()
+    for col, expected in [(SALARY_LOW, low), (SALARY_HIGH, high), (SALARY_MID, mid)]:
+        np.testing.assert_array_equal(new.loc[known, col].to_numpy(), expected[known].to_numpy())
+    gained = new[SALARY_MID].notna() & ~known
+    assert values[gained].astype(str).str.contains(" ").all(), values[gained].unique()
+
+    # The vectorized path agrees with the scalar parser everywhere
+    scalar = values.map(parse_salary)
+    np.testing.assert_array_equal(
+        new[SALARY_LOW].to_numpy(), scalar.map(lambda v: v[0] if v else np.nan).to_numpy(dtype=float)
+    )
+    print(f"✅ Salary parser matches the old parser on {n} random values ({int(gained.sum())} newly parsed)")
+
+
+# ---------------- THROUGHPUT ----------------
+def bench(n):
+    values = random_salaries(n, seed=1)
+    start = time.perf_counter()
+    parse_salaries(values)
+    vectorized = time.perf_counter() - start
+    start = time.perf_counter()
+    legacy_columns(values)
+    old = time.perf_counter() - start
+    print(f"{n:>9} values  parse_salaries {n / vectorized / 1e6:6.2f} M/s | parse_salary + midpoint {n / old / 1e6:6.2f} M/s")
+
+
+if __name__ == "__main__":
+    check_against_legacy()
+    for n in [10_000, 100_000, 1_000_000]:
+        bench(n)
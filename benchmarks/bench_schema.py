@@ -0,0 +1,85 @@
+import io
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import legacy  # noqa: E402
+from bench_match_scoring import with_salary_mid  # noqa: E402
+from dashboard_data import JOBS_SKIPROWS, ROSTER_SKIPROWS, clean_jobs, clean_roster  # noqa: E402
+from match_scoring import match_table  # noqa: E402
+from schema import memory_report  # noqa: E402
+from segments import match_candidates, segment_roster  # noqa: E402
+
+AS_OF = pd.Timestamp("2025-06-02")
+SITES = ["Dallas, TX", "Austin, TX", "Seattle, WA", "Atlanta, GA", "Chicago, IL"]
+
+
+def roster_csv(n, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "MIT Name": [f"Candidate {i}" for i in range(n)],
+        "Training Site": rng.choice(SITES + [""], size=n),
+        "Location": rng.choice(SITES + ["Dallas", ""], size=n),
+        "Week ": rng.choice(["", "1", "4", "7", "12"], size=n),
+        "Start date": (AS_OF - pd.to_timedelta(rng.integers(-30, 200, size=n), unit="D")).strftime("%m/%d/%Y"),
+        "Salary": rng.choice(["$70,000", "$72,500", "80000", ""], size=n),
+        "Level": rng.choice(["MIT", "SMIT", ""], size=n),
+        "Status": rng.choice(["Training", "Unassigned", "Offer Pending", "Free Agent Discussing Opportunity"], size=n),
+        "VERT": rng.choice(["AVI", "M&D", "EDU", ""], size=n),
+    })
+    return ("Training info\n" + df.to_csv(index=False)).encode()
+
+
+def jobs_csv(n, seed=1):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "Account": rng.choice(["Boeing", "Amazon", "Delta", ""], size=n),
+        "Job Title": rng.choice(["Site Manager", "Ops Manager", ""], size=n),
+        "City": rng.choice(["Dallas", "Austin", "Seattle", ""], size=n),
+        "State": rng.choice(["TX", "WA", ""], size=n),
+        "VERT": rng.choice(["AVI", "M&D", "EDU", ""], size=n),
+        "Salary": rng.choice(["$70,000", "70k-75k", ""], size=n),
+        "Openings": rng.integers(1, 4, size=n),
+        "Unnamed: 8": "",
+    })
+    return ("\n" * JOBS_SKIPROWS + df.to_csv(index=False)).encode()
+
+
+def parse(body, skiprows):
+    return pd.read_csv(io.BytesIO(body), skiprows=skiprows, header=0)
+
+
+def check_scoring_parity(n_candidates=300, n_jobs=100):
+    raw_roster, raw_jobs = roster_csv(n_candidates), jobs_csv(n_jobs)
+
+    old_roster = legacy.clean_roster(parse(raw_roster, ROSTER_SKIPROWS), AS_OF)
+    old_candidates = old_roster[old_roster["Status"].isin(["training", "unassigned", "free agent discussing opportunity"])]
+    expected = legacy.match_results(
+        with_salary_mid(old_candidates.dropna(subset=["MIT Name"])),
+        with_salary_mid(legacy.clean_jobs(parse(raw_jobs, JOBS_SKIPROWS))),
+    )
+
+    roster = segment_roster(clean_roster(parse(raw_roster, ROSTER_SKIPROWS), AS_OF))
+    actual = match_table(match_candidates(roster), clean_jobs(parse(raw_jobs, JOBS_SKIPROWS)))
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+    print(f"✅ Match scores unchanged on typed frames ({n_candidates}×{n_jobs})")
+
+
+def report(n):
+    for name, body, skiprows, old_clean, new_clean in [
+        ("roster", roster_csv(n), ROSTER_SKIPROWS, lambda df: legacy.clean_roster(df, AS_OF), lambda df: clean_roster(df, AS_OF)),
+        ("jobs", jobs_csv(n), JOBS_SKIPROWS, legacy.clean_jobs, clean_jobs),
+    ]:
+        before = old_clean(parse(body, skiprows))
+        after = new_clean(parse(body, skiprows))
+        print(f"\n📦 {name}, {n} rows")
+        print(memory_report(before, after).to_string())
+
+
+if __name__ == "__main__":
+    check_scoring_parity()
+    report(100_000)
@@ -0,0 +1,85 @@
+import json
+import logging
+import os
+import sys
+import tempfile
+import warnings
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import segments  # noqa: E402
+from synthetic_data import jobs_csv, roster_csv  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+# ==========================================================
+# SECTION STATE ACROSS REFRESHES
+# ----------------------------------------------------------
+# Clicks 🔄 Refresh Data in a headless app.py after changing nothing, the
+# jobs sheet only, and the roster only, and counts how often the roster
+# sections and the match sections are rebuilt. Each is rebuilt only when a
+# sheet it reads changed; the rerun totals show what the cache saves.
+# ==========================================================
+
+APP_PATH = str(ROOT / "app.py")
+
+
+class Counting:
+    # Wraps a segments class so building it is counted
+    def __init__(self, cls):
+        self.cls = cls
+        self.builds = 0
+
+    def __call__(self, *args):
+        self.builds += 1
+        return self.cls(*args)
+
+
+class Reruns(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.totals = []
+
+    def emit(self, record):
+        event = json.loads(record.getMessage())
+        if event["event"] == "rerun":
+            self.totals.append(event)
+
+
+def main(n=3_000, m=400):
+    roster_builds, match_builds = Counting(segments.RosterSections), Counting(segments.MatchSections)
+    segments.RosterSections, segments.MatchSections = roster_builds, match_builds  # app.py imports these
+    reruns = Reruns()
+    logging.getLogger("mit_dashboard.timing").addHandler(reruns)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        roster, jobs = Path(tmp) / "roster.csv", Path(tmp) / "jobs.csv"
+        roster.write_bytes(roster_csv(n, seed=0))
+        jobs.write_bytes(jobs_csv(m, seed=1))
+        os.environ["ROSTER_SHEET_SOURCE"], os.environ["JOBS_SHEET_SOURCE"] = str(roster), str(jobs)
+        at = AppTest.from_file(APP_PATH, default_timeout=600).run()
+        steps = [
+            ("first load", None, (1, 1)),
+            ("refresh, nothing changed", lambda: None, (0, 0)),
+            ("refresh, jobs changed", lambda: jobs.write_bytes(jobs_csv(m + 20, seed=2)), (0, 1)),
+            ("refresh, roster changed", lambda: roster.write_bytes(roster_csv(n + 50, seed=3)), (1, 1)),
+        ]
+        for label, change, expected in steps:
+            if change is not None:
+                roster_builds.builds = match_builds.builds = 0
+                change()
+                at.button[0].click().run()
+            assert not at.exception, at.exception
+            built = (roster_builds.builds, match_builds.builds)
+            assert built == expected, f"{label}: built {built}, expected {expected}"
+            print(f"{label:<26} roster sections built {built[0]} | match sections built {built[1]} "
+                  f"| rerun {reruns.totals[-1]['ms']:7.1f} ms")
+        assert at.metric[1].value == str(m + 20)
+    print("✅ Refresh rebuilds only the sections whose sheet changed")
+
+
+if __name__ == "__main__":
+    warnings.filterwarnings("ignore")
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    main()
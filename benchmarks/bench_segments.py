@@ -0,0 +1,64 @@
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import legacy  # noqa: E402
+from segments import (  # noqa: E402
+    IN_TRAINING,
+    OFFER_PENDING,
+    READY,
+    match_candidates,
+    pipeline_metrics,
+    segment_roster,
+    stage_rows,
+)
+
+STATUSES = ["training", "unassigned", "free agent discussing opportunity", "offer pending",
+            "offer accepted", "position identified", "placed", "nan"]
+
+
+def make_roster(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "MIT Name": np.where(rng.random(n) < 0.02, None, [f"Candidate {i}" for i in range(n)]),
+        "Week": rng.choice([np.nan, -1, 0, 1, 3, 5.5, 6, 7, 10, 20], size=n),
+        "Status": rng.choice(STATUSES, size=n),
+    })
+
+
+def check_parity(n=20_000):
+    df = make_roster(n)
+    expected = legacy.dashboard_segments(df)
+    segmented = segment_roster(df)
+    assert pipeline_metrics(segmented) == expected["metrics"], (pipeline_metrics(segmented), expected["metrics"])
+    for stage, key in [(READY, "ready_df"), (IN_TRAINING, "in_training_df"), (OFFER_PENDING, "offer_pending_df")]:
+        pd.testing.assert_frame_equal(stage_rows(segmented, stage)[df.columns], expected[key])
+    pd.testing.assert_frame_equal(match_candidates(segmented)[df.columns], expected["candidates_df"])
+    print(f"✅ Segment parity OK on {n} rows")
+
+
+def bench(n):
+    df = make_roster(n)
+    start = time.perf_counter()
+    segmented = segment_roster(df)
+    pipeline_metrics(segmented)
+    for stage in [READY, IN_TRAINING, OFFER_PENDING]:
+        stage_rows(segmented, stage)
+    match_candidates(segmented)
+    vectorized = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    legacy.dashboard_segments(df)
+    lambdas = (time.perf_counter() - start) * 1000
+    print(f"{n:>8} rows  segment pass {vectorized:8.1f} ms | per-element lambdas {lambdas:8.1f} ms")
+
+
+if __name__ == "__main__":
+    check_parity()
+    for n in [1_000, 10_000, 100_000]:
+        bench(n)
@@ -0,0 +1,213 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sheet_cache import SheetCache  # noqa: E402
+
+TTL = 60
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class Loader:
+    # Returns self.value, raises self.error when set, and blocks on `gate`
+    # while it is cleared; counts calls and how many ran at once
+    def __init__(self, value):
+        self.value = value
+        self.error = None
+        self.gate = threading.Event()
+        self.gate.set()
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            self.gate.wait(5)
+            if self.error is not None:
+                raise self.error
+            return self.value
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out waiting for the background refresh")
+        time.sleep(0.005)
+
+
+def idle(cache, key):
+    return lambda: not cache._entries[key].refreshing
+
+
+# ---------------- SCENARIOS ----------------
+def check_fresh_and_stale():
+    clock, loader = Clock(), Loader("v1")
+    cache = SheetCache(ttl=TTL, clock=clock)
+    assert cache.get("roster", loader)[0] == "v1" and loader.calls == 1
+    assert cache.get("roster", loader)[0] == "v1" and loader.calls == 1  # fresh hit, no fetch
+
+    # Stale: the old value is served at once, the refetch runs behind it
+    clock.now += TTL
+    loader.value = "v2"
+    loader.gate.clear()
+    value, _ = cache.get("roster", loader)
+    assert value == "v1" and cache.stats()["stale_hits"] == 1
+    assert cache.get("roster", loader)[0] == "v1"  # still refreshing: no second thread
+    loader.gate.set()
+    wait_for(lambda: cache._entries["roster"].value == "v2")
+    assert cache.get("roster", loader)[0] == "v2" and loader.calls == 2
+    print("✅ Fresh hits skip the loader; stale hits serve the old value and refresh in the background")
+
+
+def check_invalidate():
+    clock, loader = Clock(), Loader("v1")
+    cache = SheetCache(ttl=TTL, clock=clock)
+    cache.get("roster", loader)
+    loader.value = "v2"
+    cache.invalidate()
+    value, entry = cache.get("roster", loader)  # well within the ttl
+    assert value == "v2" and loader.calls == 2 and not entry.invalidated
+    print("✅ invalidate() forces a foreground refetch")
+
+
+def check_failed_refetch():
+    clock, loader = Clock(), Loader("v1")
+    cache = SheetCache(ttl=TTL, clock=clock)
+    cache.get("roster", loader)
+
+    # Foreground (after invalidate): the last good value comes back with the error
+    loader.error = OSError("sheet down")
+    cache.invalidate()
+    value, entry = cache.get("roster", loader)
+    assert value == "v1" and entry.last_error is loader.error and cache.stats()["refresh_failures"] == 1
+
+    # Background (stale): still the last good value, and no retry until another ttl
+    clock.now += TTL
+    assert cache.get("roster", loader)[0] == "v1"
+    wait_for(idle(cache, "roster"))
+    calls = loader.calls
+    assert cache.get("roster", loader)[0] == "v1" and cache.stats()["refresh_failures"] == 2
+    assert loader.calls == calls
+
+    # Recovery replaces the value and clears the error
+    loader.error = None
+    loader.value = "v2"
+    clock.now += TTL
+    cache.get("roster", loader)
+    wait_for(lambda: cache._entries["roster"].value == "v2")
+    assert cache._entries["roster"].last_error is None
+    print("✅ A failed refetch keeps serving the last good snapshot")
+
+
+def check_cold_start():
+    # No snapshot on disk and the loader fails: the loader's error is raised
+    loader = Loader("v1")
+    loader.error = OSError("sheet down")
+    cache = SheetCache(ttl=TTL, clock=Clock())
+    for fallback in [None, lambda: None, lambda: 1 / 0]:
+        try:
+            cache.get("roster", loader, fallback=fallback)
+            raise AssertionError("expected the loader error")
+        except OSError as e:
+            assert e is loader.error
+
+    # With a snapshot, it is served straight away and revalidated behind it
+    loader = Loader("network")
+    loader.gate.clear()
+    cache = SheetCache(ttl=TTL, clock=Clock())
+    value, _ = cache.get("roster", loader, fallback=lambda: "snapshot")
+    assert value == "snapshot"
+    loader.gate.set()
+    wait_for(lambda: cache._entries["roster"].value == "network")
+    print("✅ A cold start with no snapshot raises the loader error; a snapshot is served while it revalidates")
+
+
+def check_failed_cold_load_backoff():
+    # While a sheet with no snapshot is down, the loader runs once per ttl,
+    # not on every get(); Refresh (invalidate) retries at once
+    clock, loader = Clock(), Loader("v1")
+    loader.error = OSError("sheet down")
+    cache = SheetCache(ttl=TTL, clock=clock)
+    for _ in range(5):
+        try:
+            cache.get("roster", loader)
+            raise AssertionError("expected the loader error")
+        except OSError as e:
+            assert e is loader.error
+    assert loader.calls == 1
+    clock.now += TTL
+    for _ in range(3):
+        try:
+            cache.get("roster", loader)
+        except OSError:
+            pass
+    assert loader.calls == 2
+    cache.invalidate()
+    loader.error = None
+    assert cache.get("roster", loader)[0] == "v1" and loader.calls == 3
+
+    # A snapshot that appears during the outage is served instead of the error
+    loader = Loader("network")
+    loader.error = OSError("sheet down")
+    cache = SheetCache(ttl=TTL, clock=clock)
+    snapshot = [None]
+    try:
+        cache.get("jobs", loader, fallback=lambda: snapshot[0])
+        raise AssertionError("expected the loader error")
+    except OSError:
+        pass
+    snapshot[0] = "snapshot"
+    assert cache.get("jobs", loader, fallback=lambda: snapshot[0])[0] == "snapshot"
+    wait_for(idle(cache, "jobs"))
+    print("✅ A failed cold load is retried once per ttl, and a later snapshot replaces the error")
+
+
+def check_one_fetch_per_key():
+    # A foreground refetch (Refresh after invalidate) waits for a background
+    # refresh of the same key instead of fetching alongside it
+    clock, loader = Clock(), Loader("v1")
+    cache = SheetCache(ttl=TTL, clock=clock)
+    cache.get("roster", loader)
+    clock.now += TTL
+    loader.value = "v2"
+    loader.gate.clear()
+    cache.get("roster", loader)  # background refresh now blocked in the loader
+    wait_for(lambda: loader.active == 1)
+    cache.invalidate()
+    results = []
+    foreground = threading.Thread(target=lambda: results.append(cache.get("roster", loader)[0]))
+    foreground.start()
+    time.sleep(0.05)
+    loader.gate.set()
+    foreground.join(5)
+    wait_for(idle(cache, "roster"))
+    assert results == ["v2"] and loader.max_active == 1
+    print(f"✅ Background and foreground fetches of one key never overlap ({loader.calls} loader calls)")
+
+
+if __name__ == "__main__":
+    check_fresh_and_stale()
+    check_invalidate()
+    check_failed_refetch()
+    check_cold_start()
+    check_failed_cold_load_backoff()
+    check_one_fetch_per_key()
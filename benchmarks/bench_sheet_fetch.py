@@ -0,0 +1,133 @@
+import hashlib
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dashboard_data import ROSTER_SKIPROWS, clean_roster, load_sheet  # noqa: E402
+from sheet_fetch import fetch_csv, read_snapshot, write_snapshot  # noqa: E402
+from sheets_standin import SheetStandIn  # noqa: E402
+
+
+def roster_csv(n, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "MIT Name": [f"Candidate {i}" for i in range(n)],
+        "Training Site": rng.choice(["Dallas", "Seattle", "Atlanta"], size=n),
+        "Week ": rng.integers(0, 12, size=n),
+        "Start date": pd.Timestamp("2025-01-06") + pd.to_timedelta(rng.integers(0, 300, size=n), unit="D"),
+        "Salary": rng.choice(["$70,000", "$72,500", ""], size=n),
+        "Status": rng.choice(["Training", "Unassigned", "Offer Pending"], size=n),
+    })
+    return "Training info\n" + df.to_csv(index=False)
+
+
+# ---------------- SCENARIOS ----------------
+def check_scenarios():
+    with SheetStandIn() as server, tempfile.TemporaryDirectory() as snapshots:
+        url = server.url("/roster.csv")
+
+        # Cold start with the server down and nothing on disk -> error
+        server.fail_with = 503
+        try:
+            fetch_csv(url, "roster", snapshots)
+            raise AssertionError("expected an error with no snapshot")
+        except OSError:
+            pass
+
+        # 200 stores the snapshot, then 304 reuses it
+        server.fail_with = None
+        server.set_sheet("/roster.csv", roster_csv(100))
+        first = fetch_csv(url, "roster", snapshots)
+        assert (first.source, first.changed) == ("network", True)
+        second = fetch_csv(url, "roster", snapshots)
+        assert (second.source, second.changed) == ("not modified", False)
+        assert second.body == first.body and server.log[-1] == ("/roster.csv", 304)
+
+        # New content -> 200 with a new hash
+        server.set_sheet("/roster.csv", roster_csv(101))
+        third = fetch_csv(url, "roster", snapshots)
+        assert third.changed and third.sha256 != first.sha256
+
+        # Without validators the hash still detects unchanged bytes
+        server.send_validators = False
+        fourth = fetch_csv(url, "roster", snapshots)
+        assert (fourth.source, fourth.changed) == ("network", False)
+        server.send_validators = True
+
+        # Server errors and outages fall back to the snapshot on disk
+        server.fail_with = 500
+        offline = fetch_csv(url, "roster", snapshots)
+        assert offline.source == "snapshot" and offline.error is not None and offline.body == third.body
+
+        # Cold start from disk only, no network
+        cold = load_sheet("roster", url, ROSTER_SKIPROWS, clean_roster, snapshot_only=True,
+                          snapshot_dir=snapshots, cache_dir=Path(snapshots) / "frames")
+        assert len(cold) == 101
+    print("✅ Fetch scenarios OK (200 / 304 / unchanged hash / error fallback / cold start)")
+
+
+def check_concurrent_writes(writers=4, writes=200):
+    # Writers sharing one snapshot dir (background refresh, foreground fetch,
+    # report CLI) never fail, leave no temp files, and the snapshot read back
+    # is always one writer's whole body + meta
+    with tempfile.TemporaryDirectory() as snapshots:
+        failures = []
+
+        def write(worker):
+            for i in range(writes):
+                body = f"worker {worker} write {i}\n".encode() * 50
+                meta = {"sha256": hashlib.sha256(body).hexdigest()}
+                if not write_snapshot("roster", body, meta, snapshots):
+                    failures.append((worker, i))
+
+        threads = [threading.Thread(target=write, args=(w,)) for w in range(writers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert not failures, f"{len(failures)} of {writers * writes} writes failed"
+        assert sorted(p.name for p in Path(snapshots).iterdir()) == ["roster.csv", "roster.json"]
+        read_snapshot("roster", snapshots)  # a mismatched body/meta pair reads as "no snapshot", never raises
+
+    # A snapshot dir that can't be written is logged; the fetched bytes still come back
+    with SheetStandIn() as server, tempfile.TemporaryDirectory() as tmp:
+        server.set_sheet("/roster.csv", roster_csv(10))
+        blocked = Path(tmp) / "not-a-dir"
+        blocked.write_text("")
+        result = fetch_csv(server.url("/roster.csv"), "roster", blocked)
+        assert result.source == "network" and result.body
+    print(f"✅ {writers} concurrent snapshot writers × {writes} writes, none failed; an unwritable dir doesn't fail the fetch")
+
+
+# ---------------- BENCHMARK ----------------
+def bench(n_rows):
+    with SheetStandIn() as server, tempfile.TemporaryDirectory() as snapshots:
+        server.set_sheet("/roster.csv", roster_csv(n_rows))
+        url = server.url("/roster.csv")
+
+        frames = Path(snapshots) / "frames"
+
+        start = time.perf_counter()
+        clean_roster(pd.read_csv(url, skiprows=ROSTER_SKIPROWS))
+        plain = time.perf_counter() - start
+
+        load_sheet("roster", url, ROSTER_SKIPROWS, clean_roster, snapshot_dir=snapshots, cache_dir=frames)  # prime
+        start = time.perf_counter()
+        load_sheet("roster", url, ROSTER_SKIPROWS, clean_roster, snapshot_dir=snapshots, cache_dir=frames)
+        conditional = time.perf_counter() - start
+
+    print(f"{n_rows:>7} rows  read_csv(url) + clean {plain * 1000:8.1f} ms | conditional + cached frame {conditional * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    check_scenarios()
+    check_concurrent_writes()
+    for n in [1_000, 10_000, 100_000]:
+        bench(n)
@@ -0,0 +1,282 @@
+import argparse
+import ast
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dashboard_data import (  # noqa: E402
+    JOBS_SKIPROWS,
+    ROSTER_SKIPROWS,
+    clean_jobs,
+    clean_roster,
+    compute_weeks,
+    parse_sheet,
+)
+from match_scoring import top_k_matches  # noqa: E402
+from salary import parse_salaries  # noqa: E402
+from segments import (  # noqa: E402
+    IN_TRAINING,
+    OFFER_PENDING,
+    OFFER_PENDING_COLUMNS,
+    READY,
+    match_candidates,
+    match_page,
+    match_table,
+    order_matches,
+    pipeline_metrics,
+    search_candidates,
+    segment_roster,
+    stage_rows,
+    stage_table,
+    status_chart_data,
+)
+from synthetic_data import jobs_csv, roster_csv  # noqa: E402
+
+# ==========================================================
+# DASHBOARD STAGE SUITE
+# ----------------------------------------------------------
+# Times every step app.py runs between the sheet bytes and st.dataframe,
+# each on its own, at several synthetic sizes (synthetic_data.py), without
+# Streamlit, plus the dashboard's cold start: importing app.py's modules in a
+# fresh interpreter and the time from the start of its first rerun to the
+# metrics row ("first_paint"). Each run is saved under benchmarks/results/ and compared with
+# the previous one (or --baseline); stages slower than the tolerance are
+# flagged, and --check turns that into a failing exit code.
+#
+#   python benchmarks/bench_suite.py
+#   python benchmarks/bench_suite.py --sizes 1000x200 20000x2000 --check
+# ==========================================================
+
+ROOT = Path(__file__).resolve().parent.parent
+APP_PATH = ROOT / "app.py"
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+AS_OF = pd.Timestamp("2025-06-02")
+SIZES = ["1000x200", "10000x1000", "50000x2000"]  # candidates x jobs
+STARTUP_SIZE = "2000x300"  # sheets served to the cold-start runs
+TOP_K = 3  # app.py's TOP_K_MATCHES
+TOLERANCE = 0.25  # slower than baseline by more than this fraction -> regression
+MIN_FLAG_MS = 1.0  # ignore regressions below this, timer noise
+
+
+# ---------------- STAGES ----------------
+class Inputs:
+    def __init__(self, n_candidates, n_jobs, seed=0):
+        # Everything a stage starts from, built once per size
+        self.roster_body = roster_csv(n_candidates, seed, AS_OF)
+        self.jobs_body = jobs_csv(n_jobs, seed + 1)
+        self.raw_roster = parse_sheet(self.roster_body, ROSTER_SKIPROWS)
+        self.raw_jobs = parse_sheet(self.jobs_body, JOBS_SKIPROWS)
+        self.roster = clean_roster(self.raw_roster, AS_OF)
+        self.jobs = clean_jobs(self.raw_jobs)
+        self.segmented = segment_roster(self.roster)
+        self.candidates = match_candidates(self.segmented)
+        self.matches = top_k_matches(self.candidates, self.jobs, TOP_K)
+
+
+def render(inputs):
+    # The data work behind the metrics row, chart and tables
+    seg = inputs.segmented
+    status_chart_data(pipeline_metrics(seg))
+    stage_table(stage_rows(seg, READY))
+    stage_table(stage_rows(seg, IN_TRAINING))
+    stage_table(stage_rows(seg, OFFER_PENDING), OFFER_PENDING_COLUMNS)
+    ordered = order_matches(inputs.matches)
+    match_table(ordered)
+    for _ in match_page(ordered, search_candidates(ordered), 1).groupby("Candidate", sort=False):
+        pass
+
+
+STAGES = {
+    "parse": lambda i: (parse_sheet(i.roster_body, ROSTER_SKIPROWS), parse_sheet(i.jobs_body, JOBS_SKIPROWS)),
+    "clean": lambda i: (clean_roster(i.raw_roster, AS_OF), clean_jobs(i.raw_jobs)),
+    "weeks": lambda i: compute_weeks(i.raw_roster["Start date"], AS_OF),
+    "segment": lambda i: pipeline_metrics(segment_roster(i.roster)),
+    "salary": lambda i: (parse_salaries(i.raw_roster["Salary"]), parse_salaries(i.raw_jobs["Salary"])),
+    "score": lambda i: top_k_matches(i.candidates, i.jobs, TOP_K),
+    "render": render,
+}
+
+
+def time_stage(fn, inputs, repeat):
+    # Milliseconds per call, one warm-up call first
+    fn(inputs)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(inputs)
+        times.append(1000 * (time.perf_counter() - start))
+    return {"min_ms": min(times), "median_ms": statistics.median(times)}
+
+
+def run_suite(sizes=SIZES, repeat=5, stages=None, log=print, startup=STARTUP_SIZE):
+    results = {}
+    if startup:
+        results[f"startup {startup}"] = measure_startup(*(int(x) for x in startup.split("x")))
+        for name, timing in results[f"startup {startup}"].items():
+            log(f"{'startup':>12} {name:<11} {timing['min_ms']:9.2f} ms")
+    for size in sizes:
+        n_candidates, n_jobs = (int(x) for x in size.split("x"))
+        inputs = Inputs(n_candidates, n_jobs)
+        results[size] = {}
+        for name, fn in STAGES.items():
+            if stages and name not in stages:
+                continue
+            results[size][name] = time_stage(fn, inputs, repeat)
+            log(f"{size:>12} {name:<8} {results[size][name]['min_ms']:9.2f} ms")
+    return results
+
+
+# ---------------- STARTUP ----------------
+STARTUP_CHILD = """
+import json, logging, sys, time
+start = time.perf_counter()
+{imports}
+imports = time.perf_counter() - start
+eager = sorted(set(sys.modules) & {{"plotly.express"}})  # streamlit itself loads plotly's core
+start = time.perf_counter()
+import plotly.express
+plotly = time.perf_counter() - start
+
+from streamlit.testing.v1 import AppTest
+events = []
+class Collect(logging.Handler):
+    def emit(self, record):
+        events.append(json.loads(record.getMessage()))
+logging.getLogger("mit_dashboard.timing").addHandler(Collect())
+at = AppTest.from_file({app!r}, default_timeout=600).run()
+marks = {{e["stage"]: e["ms"] for e in events if e["event"] == "mark"}}
+reruns = [e["ms"] for e in events if e["event"] == "rerun"]
+print(json.dumps({{"imports": 1000 * imports, "plotly": 1000 * plotly, "first_paint": marks["first_paint"],
+                  "rerun": reruns[0] if reruns else None, "eager": eager,
+                  "error": at.exception[0].message if at.exception else None}}))
+"""
+
+
+def app_imports(app_path=APP_PATH):
+    # app.py's top-level import statements, as source lines
+    tree = ast.parse(Path(app_path).read_text())
+    return [ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+
+
+def measure_startup(n_candidates, n_jobs, repeat=3):
+    # Each sample is a fresh interpreter serving synthetic local sheets:
+    #   imports      app.py's top-level imports
+    #   plotly       plotly.express, now deferred to the chart section (streamlit
+    #                already imports plotly's core for its chart theme)
+    #   first_paint  rerun start -> header and metrics drawn
+    #   rerun        the whole first rerun
+    #   cold_start   imports + first_paint
+    child = STARTUP_CHILD.format(imports="\n".join(app_imports()), app=str(APP_PATH))
+    samples = []
+    with tempfile.TemporaryDirectory() as tmp:
+        roster, jobs = Path(tmp) / "roster.csv", Path(tmp) / "jobs.csv"
+        roster.write_bytes(roster_csv(n_candidates, 0))
+        jobs.write_bytes(jobs_csv(n_jobs, 1))
+        env = {**os.environ, "ROSTER_SHEET_SOURCE": str(roster), "JOBS_SHEET_SOURCE": str(jobs)}
+        for _ in range(repeat):
+            out = subprocess.run([sys.executable, "-c", child], cwd=ROOT, env=env,
+                                 capture_output=True, text=True, check=True).stdout
+            samples.append(json.loads(out.strip().splitlines()[-1]))
+    if samples[0]["eager"]:
+        print(f"⚠️ app.py imports {', '.join(samples[0]['eager'])} at startup")
+    if samples[0]["error"]:
+        print(f"⚠️ the rerun raised: {samples[0]['error']} (no rerun total)")
+    timings = {}
+    for name in ["imports", "plotly", "first_paint", "rerun", "cold_start"]:
+        values = [s["imports"] + s["first_paint"] if name == "cold_start" else s[name] for s in samples]
+        if None not in values:
+            timings[name] = {"min_ms": min(values), "median_ms": statistics.median(values)}
+    return timings
+
+
+# ---------------- RESULTS ----------------
+def environment():
+    return {
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def save_results(results, results_dir=RESULTS_DIR):
+    results_dir = Path(results_dir)
+    results_dir.mkdir(parents=True, exist_ok=True)
+    path = results_dir / f"suite-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    path.write_text(json.dumps({"created": time.time(), "environment": environment(), "results": results},
+                               indent=2))
+    return path
+
+
+def latest_results(results_dir=RESULTS_DIR):
+    runs = sorted(Path(results_dir).glob("suite-*.json"))
+    return runs[-1] if runs else None
+
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    # Rows of (size, stage, baseline ms, current ms, ratio, regressed) for the
+    # stages both runs timed; min times are compared, they are the least noisy
+    rows = []
+    for size, stages in results.items():
+        for name, timing in stages.items():
+            before = baseline.get(size, {}).get(name)
+            if before is None:
+                continue
+            ratio = timing["min_ms"] / max(before["min_ms"], 1e-9)
+            regressed = ratio > 1 + tolerance and timing["min_ms"] - before["min_ms"] >= MIN_FLAG_MS
+            rows.append((size, name, before["min_ms"], timing["min_ms"], ratio, regressed))
+    return rows
+
+
+def format_comparison(rows, baseline_path):
+    lines = [f"vs {baseline_path.name}", f"{'size':>16} {'stage':<11} {'before':>10} {'now':>10} {'ratio':>7}"]
+    for size, name, before, now, ratio, regressed in rows:
+        flag = "  ⚠️ slower" if regressed else ""
+        lines.append(f"{size:>16} {name:<11} {before:8.2f}ms {now:8.2f}ms {ratio:6.2f}×{flag}")
+    return "\n".join(lines)
+
+
+# ---------------- CLI ----------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time each dashboard data stage at several synthetic sizes")
+    parser.add_argument("--sizes", nargs="+", default=SIZES, help="CANDIDATESxJOBS (default: %(default)s)")
+    parser.add_argument("--stages", nargs="+", choices=list(STAGES), default=None)
+    parser.add_argument("--repeat", type=int, default=5, help="timed calls per stage (default: 5)")
+    parser.add_argument("--startup", default=STARTUP_SIZE, metavar="CANDIDATESxJOBS",
+                        help="sheet size for the cold-start runs, 'none' to skip (default: %(default)s)")
+    parser.add_argument("--baseline", type=Path, default=None, help="results file to compare with (default: latest)")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    parser.add_argument("--no-save", action="store_true", help="don't write this run to benchmarks/results/")
+    parser.add_argument("--check", action="store_true", help="exit 1 when a stage regressed")
+    args = parser.parse_args(argv)
+
+    baseline_path = args.baseline or latest_results()
+    startup = None if args.startup.lower() == "none" or args.stages else args.startup
+    results = run_suite(args.sizes, args.repeat, args.stages, startup=startup)
+    if not args.no_save:
+        print(f"\n💾 Saved {save_results(results)}")
+    if baseline_path is None:
+        print("No earlier results to compare with")
+        return 0
+    rows = compare(results, json.loads(baseline_path.read_text())["results"], args.tolerance)
+    print(format_comparison(rows, baseline_path))
+    regressed = [f"{size} {name}" for size, name, *_, flag in rows if flag]
+    if regressed:
+        print(f"⚠️ {len(regressed)} stage(s) slower than {args.tolerance:.0%} over baseline: {', '.join(regressed)}")
+    return 1 if regressed and args.check else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import dashboard_data  # noqa: E402
+from sheets_standin import SheetStandIn  # noqa: E402
+from segments import segment_roster  # noqa: E402
+from synthetic_data import STATUSES, jobs_csv, make_roster, roster_csv  # noqa: E402
+
+AS_OF = pd.Timestamp("2025-06-02")
+
+
+# ---------------- LAYOUT ----------------
+def check_layout(n=4_000, m=600):
+    # The generated bodies parse with the loaders' skiprows into the columns
+    # the dashboard reads, with the configured Status mix
+    roster = dashboard_data.clean_roster(dashboard_data.parse_sheet(roster_csv(n, as_of=AS_OF),
+                                                                    dashboard_data.ROSTER_SKIPROWS), AS_OF)
+    jobs = dashboard_data.clean_jobs(dashboard_data.parse_sheet(jobs_csv(m), dashboard_data.JOBS_SKIPROWS))
+    assert len(roster) == n and len(jobs) == m
+    for col in ["MIT Name", "Training Site", "Location", "Week", "Start Date", "Salary", "Level", "Status", "VERT"]:
+        assert col in roster.columns, f"roster lacks {col}"
+    for col in ["Account", "Job Title", "City", "State", "VERT", "Salary"]:
+        assert col in jobs.columns, f"jobs lack {col}"
+    assert not any(c.startswith("Unnamed") or c in ("JV ID", "JV Link") for c in jobs.columns)
+
+    shares = roster["Status"].astype(str).value_counts(normalize=True)
+    for status, share in STATUSES:
+        assert abs(shares[status.lower()] - share) < 0.03, f"{status}: {shares[status.lower()]:.2f} vs {share}"
+    assert roster["Week"].dropna().between(1, 14).all(), "training weeks outside 1-14"
+    pd.testing.assert_frame_equal(make_roster(50, seed=3, as_of=AS_OF), make_roster(50, seed=3, as_of=AS_OF))
+    stages = segment_roster(roster)["Stage"].value_counts()
+    print(f"✅ Synthetic sheets parse with skiprows {dashboard_data.ROSTER_SKIPROWS} / "
+          f"{dashboard_data.JOBS_SKIPROWS}; stages: " + ", ".join(f"{k} {v}" for k, v in stages.items()))
+
+
+def check_sources():
+    # Each loader follows its environment variable, to a URL or a local path
+    with SheetStandIn() as server, tempfile.TemporaryDirectory() as tmp:
+        roster_url, jobs_url = server.serve_synthetic(300, 40)
+        local = Path(tmp) / "exports" / "roster.csv"  # not the snapshot file of the same name
+        local.parent.mkdir()
+        local.write_bytes(roster_csv(120))
+        os.environ["JOBS_SHEET_SOURCE"] = jobs_url
+        host = roster_url.split("/")[2]
+        for source, n, origin, label in [(roster_url, 300, "network", host),
+                                         (str(local), 120, "file", "local CSV roster.csv")]:
+            os.environ["ROSTER_SHEET_SOURCE"] = source
+            roster = dashboard_data.load_sheet("roster", dashboard_data.ROSTER_SOURCE.location(),
+                                               dashboard_data.ROSTER_SOURCE.skiprows, dashboard_data.clean_roster,
+                                               snapshot_dir=tmp, cache_dir=tmp)
+            assert len(roster) == n and roster.attrs["snapshot"]["source"] == origin
+            assert dashboard_data.source_label(dashboard_data.ROSTER_SOURCE, roster) == label
+
+        # The cold-start snapshot is only served for the url it was fetched from
+        snapshot = dashboard_data.fetch_sheet("roster", roster_url, snapshot_only=True, snapshot_dir=tmp)
+        assert snapshot is not None and snapshot[2]["source"] == "snapshot"
+        assert dashboard_data.fetch_sheet("roster", str(local), snapshot_only=True, snapshot_dir=tmp) is None
+        jobs = dashboard_data.load_sheet("jobs", dashboard_data.JOBS_SOURCE.location(),
+                                         dashboard_data.JOBS_SOURCE.skiprows, dashboard_data.clean_jobs,
+                                         snapshot_dir=tmp, cache_dir=tmp)
+        assert len(jobs) == 40
+        del os.environ["ROSTER_SHEET_SOURCE"], os.environ["JOBS_SHEET_SOURCE"]
+        assert dashboard_data.ROSTER_SOURCE.location() == dashboard_data.ROSTER_URL
+        assert dashboard_data.source_label(dashboard_data.ROSTER_SOURCE, pd.DataFrame()) == "Google Sheets"
+    print("✅ ROSTER_SHEET_SOURCE / JOBS_SHEET_SOURCE redirect the loaders to the stand-in or a local CSV, "
+          "and the banner label follows")
+
+
+# ---------------- BENCHMARK ----------------
+def bench(n, m):
+    # Cold load (fetch + parse + clean) and warm load (304 + frame cache)
+    # through the stand-in
+    with SheetStandIn() as server, tempfile.TemporaryDirectory() as tmp:
+        roster_url, jobs_url = server.serve_synthetic(n, m)
+        line = [f"{n:>7} candidates / {m:>5} jobs"]
+        for label in ["cold", "warm"]:
+            start = time.perf_counter()
+            dashboard_data.load_sheet("roster", roster_url, dashboard_data.ROSTER_SKIPROWS,
+                                      lambda df: dashboard_data.clean_roster(df, AS_OF), AS_OF.isoformat(),
+                                      snapshot_dir=tmp, cache_dir=tmp)
+            dashboard_data.load_sheet("jobs", jobs_url, dashboard_data.JOBS_SKIPROWS, dashboard_data.clean_jobs,
+                                      snapshot_dir=tmp, cache_dir=tmp)
+            line.append(f"{label} {1000 * (time.perf_counter() - start):7.1f} ms")
+        size = sum(len(body) for body, _, _ in server.sheets.values()) / 2**20
+        print(" | ".join(line) + f" | {size:5.1f} MiB served")
+
+
+if __name__ == "__main__":
+    check_layout()
+    check_sources()
+    for n, m in [(1_000, 200), (10_000, 2_000), (100_000, 10_000)]:
+        bench(n, m)
@@ -0,0 +1,74 @@
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_match_scoring import make_candidates, make_jobs, with_salary_mid  # noqa: E402
+from match_scoring import match_table, score_matrix, top_k_matches  # noqa: E402
+
+
+# ---------------- APPROACHES ----------------
+def full_table_top_k(candidates, jobs, k):
+    # The dashboard's approach before top_k_matches: every pair, sort, nlargest
+    match_df = match_table(candidates, jobs)
+    match_df = match_df.sort_values("Total Score", ascending=False)
+    return match_df.groupby("Candidate", sort=False).apply(lambda g: g.nlargest(k, "Total Score"))
+
+
+def measure(fn, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1e6
+
+
+# ---------------- PARITY ----------------
+def check_parity(n_candidates=400, n_jobs=120, k=3):
+    candidates = with_salary_mid(make_candidates(n_candidates))
+    jobs = with_salary_mid(make_jobs(n_jobs))
+    top = top_k_matches(candidates, jobs, k=k, chunk_pairs=5_000)
+
+    # Same jobs as a full stable sort (ties -> earlier job row first)
+    scores = score_matrix(candidates, jobs)
+    expected_idx = np.argsort(-scores["Total Score"], axis=1, kind="stable")[:, :k]
+    expected = np.take_along_axis(scores["Total Score"], expected_idx, axis=1).ravel()
+    np.testing.assert_array_equal(top["Total Score"].to_numpy(), expected)
+    for name in ["Vertical", "Salary", "Geo"]:
+        np.testing.assert_array_equal(
+            top[name].to_numpy(), np.take_along_axis(scores[name], expected_idx, axis=1).ravel()
+        )
+    whole = top[["Vertical", "Salary", "Geo", "Confidence"]].astype(int).sum(axis=1)
+    summed = [round(w + r, 1) for w, r in zip(whole.tolist(), top["Readiness"].tolist())]
+    np.testing.assert_array_equal(summed, top["Total Score"].to_numpy())
+    print(f"✅ Top-{k} parity OK on {n_candidates}×{n_jobs} pairs")
+
+
+# ---------------- BENCHMARK ----------------
+def bench(n_candidates, n_jobs, k, run_full=True):
+    candidates = with_salary_mid(make_candidates(n_candidates))
+    jobs = with_salary_mid(make_jobs(n_jobs))
+    elapsed, peak = measure(top_k_matches, candidates, jobs, k)
+    line = f"{n_candidates:>6}×{n_jobs:<5} k={k}  top-k {elapsed:7.3f}s {peak:8.1f} MB peak"
+    if run_full:
+        elapsed, peak = measure(full_table_top_k, candidates, jobs, k)
+        line += f" | full table {elapsed:7.3f}s {peak:8.1f} MB peak"
+    print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark top-k match retrieval against the full match table")
+    parser.add_argument("-k", type=int, default=3, help="jobs kept per candidate")
+    args = parser.parse_args()
+
+    check_parity(k=args.k)
+    bench(1_000, 1_000, args.k)
+    bench(5_000, 2_000, args.k)
+    bench(10_000, 2_000, args.k, run_full=False)
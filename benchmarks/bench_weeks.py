@@ -0,0 +1,54 @@
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import legacy  # noqa: E402
+from dashboard_data import compute_weeks  # noqa: E402
+
+AS_OF = pd.Timestamp("2025-06-02")
+
+
+def make_roster(n, seed=0):
+    rng = np.random.default_rng(seed)
+    start = AS_OF + pd.to_timedelta(rng.integers(-400, 120, size=n), unit="D")
+    start = pd.Series(start).where(rng.random(n) > 0.05)  # some blank start dates
+    return pd.DataFrame({"Start Date": start})
+
+
+def check_parity(n=5_000):
+    df = make_roster(n)
+    week, until = compute_weeks(df["Start Date"], AS_OF)
+    expected = legacy.calc_weeks_column(df, AS_OF)
+    pd.testing.assert_series_equal(week, expected, check_names=False, check_dtype=False)
+
+    future = df["Start Date"] > AS_OF
+    expected_until = ((df["Start Date"] - AS_OF).dt.days / 7).where(future).map(
+        lambda d: float(int(d)) if pd.notna(d) else np.nan
+    )
+    pd.testing.assert_series_equal(until, expected_until, check_names=False)
+    assert week[future].isna().all() and until[~future].isna().all()
+    print(f"✅ Week parity OK on {n} rows ({int(future.sum())} future starts)")
+
+
+def bench(n):
+    df = make_roster(n)
+    start = time.perf_counter()
+    compute_weeks(df["Start Date"], AS_OF)
+    vectorized = (time.perf_counter() - start) * 1000
+    line = f"{n:>9} rows  vectorized {vectorized:9.1f} ms"
+    if n <= 100_000:
+        start = time.perf_counter()
+        legacy.calc_weeks_column(df, AS_OF)
+        line += f" | apply(axis=1) {(time.perf_counter() - start) * 1000:9.1f} ms"
+    print(line)
+
+
+if __name__ == "__main__":
+    check_parity()
+    for n in [1_000, 10_000, 100_000, 1_000_000]:
+        bench(n)
@@ -0,0 +1,121 @@
+import datetime as dt
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import legacy  # noqa: E402
+from workbook_ingest import WORKBOOK_PATH, read_placement_workbook  # noqa: E402
+
+warnings.filterwarnings("ignore", module="openpyxl")  # unsupported extension notices
+
+ROSTER_HEADER = ["MIT Count", "MIT Name", "Week", "Start date", "VERT", "Training Site", "Location", "Level",
+                 "Status", "Confidence", "Notes", "Placement Site", "Title", "New Start Date"]
+REQS_HEADER = ["JV", "New Candidate Name", None, "Start Date", "VERT", "Training Site", "Location", "Level",
+               "Status", None, "Notes"]
+STATUSES = ["Training", "Placed", "Placed with OL", "HM Interview", "Unassigned", "Free Agent"]
+REQ_STATUSES = ["Offer Accepted", "Offer Pending", "Open"]
+
+
+# ---------------- SYNTHETIC WORKBOOK ----------------
+def make_workbook(path, n_roster, n_reqs, seed=0):
+    # Same layout as the tracker: three empty leading columns, a group label
+    # row, the roster header on row 1, blank spacer rows, then the reqs section
+    rng = np.random.default_rng(seed)
+    book = openpyxl.Workbook(write_only=True)
+    ws = book.create_sheet("Active_Roster")
+    pad = [None] * 3
+    ws.append(pad + [None, "Training info"] + [None] * 6 + ["Placement Info"])
+    ws.append(pad + ROSTER_HEADER)
+    start = dt.datetime(2024, 1, 1)
+    for i in range(n_roster):
+        day = start + dt.timedelta(days=int(rng.integers(0, 600)))
+        ws.append(pad + [
+            i + 1, f"Trainee {i}", round(float(rng.uniform(-1, 40)), 6), day, rng.choice(["AVI", "MANU", "FIN"]),
+            rng.choice(["Delta", "Intel", "Tesla"]), f"City {i % 97}, ST", rng.choice(["OM", "AOM"]),
+            rng.choice(STATUSES), None, "note" if i % 5 == 0 else None, None, None,
+            day + dt.timedelta(days=90) if i % 7 == 0 else None,
+        ])
+    for _ in range(3):
+        ws.append([])
+    ws.append(pad + ["MIT Reqs Open"])
+    ws.append(pad + REQS_HEADER)
+    for i in range(n_reqs):
+        has_date = i % 3 != 0
+        ws.append(pad + [
+            None, f"Candidate {i}", None, start + dt.timedelta(days=i % 400) if has_date else None,
+            rng.choice(["AUTO", "TECH"]), rng.choice(["Ford", "Google"]), "Detroit, MI", rng.choice(["OM", "SMIT"]),
+            rng.choice(REQ_STATUSES), None, "#N/A" if i % 11 == 0 else None,
+        ])
+    book.save(path)
+
+
+# ---------------- PARITY ----------------
+def assert_same_values(new, old, label):
+    # Section frames are typed on their own rows, the old slices were object
+    # columns of the whole sheet: compare cell by cell
+    assert new.shape == old.shape, f"{label}: shape {new.shape} != {old.shape}"
+    assert new.index.tolist() == old.index.tolist(), f"{label}: rows differ"
+    assert [str(c) for c in new.columns] == [str(c) for c in old.columns], f"{label}: headers differ"
+    for k in range(new.shape[1]):
+        a, b = new.iloc[:, k].tolist(), old.iloc[:, k].tolist()
+        for x, y in zip(a, b):
+            assert (pd.isna(x) and pd.isna(y)) or x == y, f"{label} column {k}: {x!r} != {y!r}"
+
+
+def check_parity(path):
+    workbook = read_placement_workbook(path)
+    raw, roster, reqs = legacy.placement_sections(path)
+    assert workbook.n_rows == len(raw)
+    assert_same_values(workbook.roster, roster, "roster")
+    assert_same_values(workbook.reqs, reqs, "reqs")
+    assert read_placement_workbook(path, reqs=False).roster.shape[0] == roster.shape[0]
+
+
+def check_bundled():
+    # The bundled tracker keeps its roster header further down than row 1,
+    # which the old scripts assumed, so only the reqs section is compared
+    path = ROOT / WORKBOOK_PATH
+    workbook = read_placement_workbook(path)
+    _, _, reqs = legacy.placement_sections(path)
+    assert_same_values(workbook.reqs, reqs, "bundled reqs")
+    assert "Status" in workbook.roster.columns and workbook.roster["MIT Name"].notna().any()
+    print(f"✅ Bundled workbook: reqs section identical, roster header found on row {workbook.roster_header_row}")
+
+
+# ---------------- BENCHMARK ----------------
+def bench(path, label):
+    start = time.perf_counter()
+    legacy.placement_sections(path)
+    old = time.perf_counter() - start
+
+    start = time.perf_counter()
+    read_placement_workbook(path)
+    new = time.perf_counter() - start
+    start = time.perf_counter()
+    read_placement_workbook(path, reqs=False)
+    roster_only = time.perf_counter() - start
+    # The four scripts each read and scanned the whole sheet
+    print(f"{label:>22}  read_excel + full scan {old:6.2f}s (×4 scripts {4 * old:6.2f}s) | "
+          f"streamed once {new:6.2f}s | roster only {roster_only:6.2f}s")
+
+
+if __name__ == "__main__":
+    check_bundled()
+    with tempfile.TemporaryDirectory() as tmp:
+        small = Path(tmp) / "small.xlsx"
+        make_workbook(small, 300, 120)
+        check_parity(small)
+        print("✅ Sections match the old read_excel slices on a 300 + 120 row workbook")
+        for n_roster, n_reqs in [(5_000, 2_000), (50_000, 20_000)]:
+            path = Path(tmp) / f"tracker_{n_roster}.xlsx"
+            make_workbook(path, n_roster, n_reqs)
+            bench(path, f"{n_roster} + {n_reqs} rows")
@@ -0,0 +1,256 @@
+import pandas as pd
+
+# ==========================================================
+# ORIGINAL ROW-BY-ROW IMPLEMENTATIONS
+# ----------------------------------------------------------
+# Copied from app.py and the offline scripts before the vectorized rewrites.
+# Kept only so the benchmarks can check parity and time the old code paths.
+# ==========================================================
+
+
+def parse_salary(s):
+    if pd.isna(s):
+        return None
+    if isinstance(s, (int, float)):
+        return float(s)
+
+    # Clean string
+    s = str(s).replace("$", "").replace(",", "").strip()
+
+    # Normalize formats like "70,000 - 75,000" or "70k-75k"
+    s = s.lower().replace("k", "000").replace("–", "-").replace("—", "-").replace("_", "-")
+
+    if "-" in s:
+        try:
+            low, high = s.split("-")
+            return (float(low.strip()), float(high.strip()))
+        except ValueError:
+            return None
+    else:
+        try:
+            return float(s)
+        except ValueError:
+            return None
+
+
+def midpoint(val):
+    if isinstance(val, tuple):
+        return (val[0] + val[1]) / 2
+    return val if isinstance(val, (int, float)) else None
+
+
+def match_results(candidates_df, jobs_df):
+    match_results = []
+    for _, c in candidates_df.iterrows():
+        for _, j in jobs_df.iterrows():
+            subscores = {}
+
+            # 1) Vertical Alignment
+            vert_score = 0
+            c_vert = str(c.get("VERT", "")).strip().upper()
+            j_vert = str(j.get("VERT", j.get("Vertical", ""))).strip().upper()
+            if c_vert == j_vert:
+                vert_score += 30
+            exp_str = " ".join(
+                str(c.get(k, "")).lower()
+                for k in c.index if any(x in k.lower() for x in ["experience", "notes", "background"])
+            )
+            if "amazon" in exp_str or "aviation" in exp_str:
+                vert_score += 10
+            subscores["Vertical"] = vert_score
+
+            # 2) Salary Trajectory
+            c_sal, j_sal = c.get("SalaryMid"), j.get("SalaryMid")
+            if j_sal and c_sal:
+                if j_sal >= 1.05 * c_sal:
+                    sal_score = 25
+                elif abs(j_sal - c_sal) / c_sal <= 0.05:
+                    sal_score = 15
+                elif j_sal < 0.95 * c_sal:
+                    sal_score = -10
+                else:
+                    sal_score = 0
+            else:
+                sal_score = 0
+            subscores["Salary"] = sal_score
+
+            # 3) Geographic Fit
+            geo_score = 5
+            cand_loc = str(c.get("Location", "")).strip().lower()
+            job_city = str(j.get("City", "")).strip().lower()
+            job_state = str(j.get("State", "")).strip().upper()
+            if cand_loc == job_city:
+                geo_score = 20
+            elif cand_loc.endswith(job_state.lower()):
+                geo_score = 10
+            subscores["Geo"] = geo_score
+
+            # 4) Confidence
+            conf = str(c.get("Confidence", "")).lower()
+            if "high" in conf:
+                conf_score = 15
+            elif "mod" in conf:
+                conf_score = 10
+            elif "low" in conf:
+                conf_score = 5
+            else:
+                conf_score = 10
+            subscores["Confidence"] = conf_score
+
+            # 5) Readiness
+            week = c.get("Week")
+            if isinstance(week, (int, float)):
+                if week >= 6:
+                    ready_score = 10
+                elif 1 <= week <= 5:
+                    ready_score = week * 1.5
+                else:
+                    ready_score = 5
+            else:
+                ready_score = 5
+            subscores["Readiness"] = ready_score
+
+            total = sum(subscores.values())
+
+            # Safe access for fields that may vary by sheet
+            title_val = j.get("Title") or j.get("Job Title") or "—"
+            vert_val = j.get("VERT") or j.get("Vertical") or "—"
+            acct_val = j.get("Account") or j.get("Job Account") or "—"
+
+            match_results.append({
+                "Candidate": c["MIT Name"],
+                "Job Account": acct_val,
+                "Title": title_val,
+                "City": j.get("City", ""),
+                "State": j.get("State", ""),
+                "VERT": vert_val,
+                "Total Score": round(total, 1),
+                "Week": c.get("Week"),
+                "Status": c.get("Status")
+            })
+
+    return pd.DataFrame(match_results)
+
+
+def calc_weeks_column(df, today):
+    # The per-row Week fallback from load_data(), with "today" pinned
+    def calc_weeks(row):
+        start = row["Start Date"]
+        if pd.isna(start):
+            return None
+        if start > today:
+            return f"-{int((start - today).days / 7)} weeks from start"
+        return int(((today - start).days // 7) + 1)
+
+    return pd.to_numeric(df.apply(calc_weeks, axis=1), errors="coerce")
+
+
+def dashboard_segments(df):
+    # The METRICS block and section filters from app.py
+    offer_pending = len(df[df["Status"] == "offer pending"])
+    offer_accepted = len(df[df["Status"] == "offer accepted"])
+    non_identified = len(df[df["Status"].isin(["free agent discussing opportunity", "unassigned", "training"])])
+    total_candidates = non_identified + offer_accepted
+
+    ready_for_placement = df[
+        df["Week"].apply(lambda x: isinstance(x, (int, float)) and x > 6)
+        & (~df["Status"].isin(["position identified", "offer pending", "offer accepted"]))
+    ]
+    ready = len(ready_for_placement)
+
+    in_training = len(
+        df[df["Status"].eq("training") & df["Week"].apply(lambda x: isinstance(x, (int, float)) and x <= 6 and x >= 0)]
+    )
+
+    ready_df = df[
+        df["Week"].apply(lambda x: isinstance(x, (int, float)) and x > 6)
+        & (~df["Status"].isin(["position identified", "offer pending", "offer accepted"]))
+        & (df["Status"].notna())
+    ]
+    in_training_df = df[
+        df["Status"].eq("training")
+        & df["Week"].apply(lambda x: isinstance(x, (int, float)) and x <= 6 and x >= 0)
+    ]
+    candidates_df = df[
+        df["Status"].isin(["training", "unassigned", "free agent discussing opportunity"])
+    ].copy()
+    candidates_df = candidates_df.dropna(subset=["MIT Name"])
+    offer_pending_df = df[df["Status"].str.lower() == "offer pending"]
+
+    return {
+        "metrics": {
+            "total_candidates": total_candidates,
+            "ready": ready,
+            "in_training": in_training,
+            "offer_pending": offer_pending,
+            "offer_accepted": offer_accepted,
+        },
+        "ready_df": ready_df,
+        "in_training_df": in_training_df,
+        "candidates_df": candidates_df,
+        "offer_pending_df": offer_pending_df,
+    }
+
+
+def clean_roster(df, today):
+    # load_data() cleaning before the schema layer, with "today" pinned
+    df = df.dropna(how="all")
+    df.columns = [c.strip() if isinstance(c, str) else c for c in df.columns]
+    df = df.rename(columns={"Week ": "Week", "Start date": "Start Date"})
+    if "Start Date" in df.columns:
+        df["Start Date"] = pd.to_datetime(df["Start Date"], errors="coerce")
+    df["Week"] = pd.to_numeric(df["Week"], errors="coerce")
+    mask = df["Week"].isna()
+    if mask.any():
+        df.loc[mask, "Week"] = calc_weeks_column(df.loc[mask], today)
+    if "Salary" in df.columns:
+        df["Salary"] = (
+            df["Salary"]
+            .astype(str)
+            .str.replace("$", "")
+            .str.replace(",", "")
+            .str.replace(" ", "")
+        )
+        df["Salary"] = pd.to_numeric(df["Salary"], errors="coerce")
+    df["Status"] = df["Status"].astype(str).str.strip().str.lower()
+    return df
+
+
+def clean_jobs(jobs_df):
+    # load_jobs_data() cleaning before the schema layer
+    jobs_df = jobs_df.loc[:, ~jobs_df.columns.str.contains("^Unnamed")]
+    jobs_df = jobs_df.drop(columns=[c for c in ["JV Link", "JV ID"] if c in jobs_df.columns], errors="ignore")
+    return jobs_df.dropna(how="all").fillna("")
+
+
+def date_equalish(d1, d2):
+    # compare_active_mit_only.py fuzzy-match confirmation, one pair at a time
+    try:
+        d1 = pd.to_datetime(d1)
+        d2 = pd.to_datetime(d2)
+        return d1.date() == d2.date()
+    except Exception:
+        return False
+
+
+def site_equalish(s1, s2):
+    if pd.isna(s1) or pd.isna(s2):
+        return False
+    s1, s2 = str(s1).strip().lower(), str(s2).strip().lower()
+    return s1 in s2 or s2 in s1
+
+
+def placement_sections(file_path):
+    # What extract_active_roster.py / extract_offer_accepted.py sliced out of
+    # the whole sheet: (raw frame, roster section, reqs section or None)
+    df_raw = pd.read_excel(file_path, sheet_name=0, header=None)
+    reqs_index = df_raw[df_raw.astype(str).apply(lambda x: x.str.contains("MIT Reqs Open", case=False, na=False)).any(axis=1)].index
+    end_row = len(df_raw) if len(reqs_index) == 0 else reqs_index[0]
+    top_df = df_raw[2:end_row].copy()
+    top_df.columns = df_raw.iloc[1].tolist()
+    if len(reqs_index) == 0:
+        return df_raw, top_df, None
+    reqs_row = reqs_index[0]
+    df_reqs = df_raw[reqs_row + 2:].copy()
+    df_reqs.columns = df_raw.iloc[reqs_row + 1].tolist()
+    return df_raw, top_df, df_reqs
@@ -1,11 +1,22 @@
+import argparse
+import numpy as np
 import pandas as pd
 import re
-from difflib import SequenceMatcher
+from pathlib import Path
+from pandas.api.types import is_datetime64_any_dtype
+
+from name_matching import match_names, match_names_parallel
+from pipeline_io import read_frame
+from workbook_ingest import MIT_PROGRAMS, read_header, read_roster
 
 # ---------------- CONFIG ----------------
 COMBINED_PATH = "combined_mit_data.csv"
 EXCEL_PATH = "Copy of 2025 Leadership Development (NLT + MIT) Program Master Roster.xlsx"
 ACTIVE_SHEET = "Active Roster"
+FUZZY_THRESHOLD = 0.78  # minimum SequenceMatcher ratio for a fuzzy name match
+
+_ISO_DAY = r"\d{4}-\d{2}-\d{2}"
+_ISO_SECOND = r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}"
 
 # ---------------- HELPERS ----------------
 def clean_name(name: str) -> str:
@@ -15,132 +26,238 @@ def clean_name(name: str) -> str:
     name = re.sub(r"[^\w\s]", " ", name.lower())
     return re.sub(r"\s+", " ", name).strip()
 
-def similarity(a, b):
-    return SequenceMatcher(None, a, b).ratio()
-
-def date_equalish(d1, d2):
+def _to_day(value):
+    # The date pd.to_datetime() gives for one value, or NaT if it can't parse
     try:
-        d1 = pd.to_datetime(d1)
-        d2 = pd.to_datetime(d2)
-        return d1.date() == d2.date()
+        return np.datetime64(pd.to_datetime(value).date(), "D")
     except Exception:
-        return False
+        return np.datetime64("NaT", "D")
+
+def normalize_dates(values):
+    # datetime64[D] per value, same day as _to_day(value). Datetime columns
+    # (Excel dates) are floored directly; otherwise each distinct value is
+    # parsed once, with plain "YYYY-MM-DD[ HH:MM:SS]" strings in bulk.
+    values = pd.Series(values)
+    if is_datetime64_any_dtype(values.dtype):
+        if values.dt.tz is not None:
+            values = values.dt.tz_localize(None)  # keep the local calendar day
+        return values.to_numpy().astype("datetime64[D]")
+
+    codes, uniques = pd.factorize(values.astype(object))
+    uniques = pd.Series(uniques, dtype=object)
+    days = np.full(len(uniques) + 1, np.datetime64("NaT"), dtype="datetime64[D]")  # last: missing
+    is_text = uniques.map(lambda v: isinstance(v, str)).to_numpy(dtype=bool)
+    text = uniques.where(is_text, "").astype(str)
+    done = np.zeros(len(uniques), dtype=bool)
+    for pattern, fmt in [(_ISO_DAY, "%Y-%m-%d"), (_ISO_SECOND, "%Y-%m-%d %H:%M:%S")]:
+        hit = is_text & text.str.fullmatch(pattern).to_numpy(dtype=bool)
+        days[np.flatnonzero(hit)] = pd.to_datetime(text[hit], format=fmt, errors="coerce").to_numpy()
+        done |= hit
+    for i in np.flatnonzero(~done):
+        days[i] = _to_day(uniques[i])
+    return days[codes]
+
+def normalize_sites(values):
+    # Stripped, lowercased site names; missing sites become None
+    values = pd.Series(values, dtype=object)
+    sites = values.map(str).str.strip().str.lower()
+    return sites.where(values.notna(), None).to_numpy(dtype=object)
+
+def sites_overlap(sites_a, sites_b):
+    # One site name contains the other; a missing site never matches.
+    # The containment test runs once per distinct pair of sites.
+    codes_a, uniques_a = pd.factorize(pd.Series(sites_a, dtype=object))
+    codes_b, uniques_b = pd.factorize(pd.Series(sites_b, dtype=object))
+    uniques_a, uniques_b = list(uniques_a), list(uniques_b)
+    width = len(uniques_b) + 1
+    distinct, inverse = np.unique((codes_a + 1) * width + (codes_b + 1), return_inverse=True)
+    overlap = []
+    for key in distinct.tolist():
+        a, b = key // width - 1, key % width - 1
+        overlap.append(a >= 0 and b >= 0 and (uniques_a[a] in uniques_b[b] or uniques_b[b] in uniques_a[a]))
+    return np.array(overlap, dtype=bool)[inverse.ravel()]
 
-def site_equalish(s1, s2):
-    if pd.isna(s1) or pd.isna(s2):
-        return False
-    s1, s2 = str(s1).strip().lower(), str(s2).strip().lower()
-    return s1 in s2 or s2 in s1
+def column_or_blank(df, col):
+    # Same as row.get(col, "") for every row
+    return df[col] if col in df.columns else pd.Series("", index=df.index, dtype=object)
+
+def name_index(df):
+    # CleanName -> first row with that name. A clean name shared by several
+    # rows keeps its first row, as before; all rows involved are returned
+    # for review.
+    first = df.drop_duplicates("CleanName", keep="first").set_index("CleanName", drop=False)
+    duplicates = df[df["CleanName"].duplicated(keep=False)]
+    return first, duplicates
 
 # ---------------- LOAD FILES ----------------
-combined = pd.read_csv(COMBINED_PATH)
-active = pd.read_excel(EXCEL_PATH, sheet_name=ACTIVE_SHEET)
-active.columns = active.columns.str.strip().str.lower()
-
-# Detect key columns
-name_col = next((c for c in active.columns if "trainee" in c and "name" in c), None)
-program_col = next((c for c in active.columns if "training program" in c), None)
-start_col = next((c for c in active.columns if "start" in c and "date" in c), None)
-site_col = next((c for c in active.columns if "site" in c), None)
-
-if not all([name_col, program_col]):
-    raise ValueError("Missing 'Trainee Name' or 'Training Program' columns in Active Roster.")
-
-# Filter only MIT / SMIT
-active_mit = active[active[program_col].astype(str).str.upper().isin(["MIT", "SMIT"])].copy()
-
-# Clean names
-combined["CleanName"] = combined["MIT Name"].apply(clean_name)
-active_mit["CleanName"] = active_mit[name_col].apply(clean_name)
-
-# ---------------- EXACT MATCH ----------------
-combined_names = set(combined["CleanName"])
-active_names = set(active_mit["CleanName"])
-
-exact_matches = sorted(combined_names & active_names)
-only_in_combined = [n for n in combined_names if n not in active_names]
-only_in_active = [n for n in active_names if n not in combined_names]
-
-# ---------------- FUZZY MATCH (DATE + SITE VALIDATION) ----------------
-confirmed_fuzzy = []
-possible_matches = []
-
-for c_name in only_in_combined:
-    c_row = combined[combined["CleanName"] == c_name].iloc[0]
-    for a_name in only_in_active:
-        score = similarity(c_name, a_name)
-        if score >= 0.78:
-            a_row = active_mit[active_mit["CleanName"] == a_name].iloc[0]
-            c_date = c_row.get("Start date", "")
-            a_date = a_row.get(start_col, "")
-            c_site = c_row.get("Training Site", "")
-            a_site = a_row.get(site_col, "")
-
-            same_date = date_equalish(c_date, a_date)
-            same_site = site_equalish(c_site, a_site)
-            confirmed = same_date or same_site
-
-            if confirmed:
-                confirmed_fuzzy.append((c_name, a_name))
-            else:
-                possible_matches.append({
-                    "Combined Name": c_row["MIT Name"],
-                    "Active Name": a_row[name_col],
-                    "Similarity": round(score, 3),
-                    "Same Start Date": same_date,
-                    "Same Site": same_site,
-                    "Confirmed Same Person": confirmed,
-                    "Combined Start Date": c_date,
-                    "Active Start Date": a_date,
-                    "Combined Site": c_site,
-                    "Active Site": a_site,
-                })
-
-# ---------------- MERGE CONFIRMED MATCHES ----------------
-# Build a mapping for quick lookup
-confirmed_map = dict(confirmed_fuzzy)
-exact_map = {n: n for n in exact_matches}
-all_matches = {**exact_map, **confirmed_map}
-
-matched_rows = []
-for c_name, a_name in all_matches.items():
-    c_row = combined[combined["CleanName"] == c_name].iloc[0]
-    a_row = active_mit[active_mit["CleanName"] == a_name].iloc[0]
-    merged_row = {
-        "MIT Name": c_row["MIT Name"],
-        "Start date": c_row.get("Start date", ""),
-        "Training Site": c_row.get("Training Site", ""),
-        "Location": c_row.get("Location", ""),
-        "Status": c_row.get("Status", ""),
-        "Level": c_row.get("Level", ""),
-        "Vert": c_row.get("Vert", ""),
-        "Source": c_row.get("Source", ""),
-        "Training Program": a_row.get(program_col, ""),
-        "Active Start Date": a_row.get(start_col, ""),
-        "Active Site": a_row.get(site_col, ""),
+def load_inputs(combined_path=COMBINED_PATH, excel_path=EXCEL_PATH):
+    combined = read_frame(combined_path)
+    # Headers come back stripped and lowercased
+    header = read_header(excel_path, ACTIVE_SHEET)
+
+    # Detect key columns
+    cols = {
+        "name": next((c for c in header if "trainee" in c and "name" in c), None),
+        "program": next((c for c in header if "training program" in c), None),
+        "start": next((c for c in header if "start" in c and "date" in c), None),
+        "site": next((c for c in header if "site" in c), None),
     }
-    matched_rows.append(merged_row)
+    if not all([cols["name"], cols["program"]]):
+        raise ValueError("Missing 'Trainee Name' or 'Training Program' columns in Active Roster.")
+
+    # Stream only MIT / SMIT rows and the detected columns
+    active_mit = read_roster(excel_path, ACTIVE_SHEET, programs=MIT_PROGRAMS,
+                             columns=[c for c in dict.fromkeys(cols.values()) if c])
+    return combined, active_mit, cols
+
+# ---------------- RECONCILE ----------------
+def reconcile(combined, active_mit, cols, threshold=FUZZY_THRESHOLD, workers=1):
+    # Returns {output file name: DataFrame}. workers > 1 shards the fuzzy
+    # matching over that many processes; the outputs are the same.
+    name_col, program_col, start_col, site_col = cols["name"], cols["program"], cols["start"], cols["site"]
+
+    # Clean names
+    combined = combined.copy()
+    active_mit = active_mit.copy()
+    combined["CleanName"] = combined["MIT Name"].apply(clean_name)
+    active_mit["CleanName"] = active_mit[name_col].apply(clean_name)
+
+    # One lookup table per roster instead of a full-frame scan per name
+    combined_first, combined_dupes = name_index(combined)
+    active_first, active_dupes = name_index(active_mit)
+
+    # Start dates and sites normalized once per roster for the confirmation
+    # step: same calendar day, or one site name contains the other
+    combined_days = normalize_dates(column_or_blank(combined_first, "Start date"))
+    active_days = normalize_dates(column_or_blank(active_first, start_col))
+    combined_sites = normalize_sites(column_or_blank(combined_first, "Training Site"))
+    active_sites = normalize_sites(column_or_blank(active_first, site_col))
 
-merged_df = pd.DataFrame(matched_rows)
+    # ---- Exact match ----
+    combined_names = set(combined["CleanName"])
+    active_names = set(active_mit["CleanName"])
+
+    exact_matches = sorted(combined_names & active_names)
+    only_in_combined = [n for n in combined_names if n not in active_names]
+    only_in_active = [n for n in active_names if n not in combined_names]
+
+    # ---- Fuzzy match (date + site validation) ----
+    # Only pairs at or above the threshold come back, in the same order as a
+    # loop over only_in_combined × only_in_active
+    if workers > 1:
+        name_pairs = match_names_parallel(only_in_combined, only_in_active, threshold=threshold, workers=workers)
+    else:
+        name_pairs = match_names(only_in_combined, only_in_active, threshold=threshold)
+    c_names = [only_in_combined[i] for i in name_pairs["Left"]]
+    a_names = [only_in_active[j] for j in name_pairs["Right"]]
+    c_pos = combined_first.index.get_indexer(c_names)
+    a_pos = active_first.index.get_indexer(a_names)
+
+    same_date = combined_days[c_pos] == active_days[a_pos]  # NaT never equals anything
+    same_site = sites_overlap(combined_sites[c_pos], active_sites[a_pos])
+    confirmed = same_date | same_site
+
+    confirmed_fuzzy = [(c_names[k], a_names[k]) for k in np.flatnonzero(confirmed)]
+
+    review = np.flatnonzero(~confirmed)
+    possible_matches = pd.DataFrame()
+    if len(review):
+        c_rows = combined_first.iloc[c_pos[review]]
+        a_rows = active_first.iloc[a_pos[review]]
+        possible_matches = pd.DataFrame({
+            "Combined Name": c_rows["MIT Name"].to_numpy(),
+            "Active Name": a_rows[name_col].to_numpy(),
+            "Similarity": [round(float(s), 3) for s in name_pairs["Similarity"].to_numpy()[review]],
+            "Same Start Date": same_date[review],
+            "Same Site": same_site[review],
+            "Confirmed Same Person": confirmed[review],
+            "Combined Start Date": column_or_blank(c_rows, "Start date").to_numpy(),
+            "Active Start Date": column_or_blank(a_rows, start_col).to_numpy(),
+            "Combined Site": column_or_blank(c_rows, "Training Site").to_numpy(),
+            "Active Site": column_or_blank(a_rows, site_col).to_numpy(),
+        })
+
+    # ---- Merge confirmed matches ----
+    # Build a mapping for quick lookup
+    confirmed_map = dict(confirmed_fuzzy)
+    exact_map = {n: n for n in exact_matches}
+    all_matches = {**exact_map, **confirmed_map}
+
+    combined_rows = combined_first.to_dict("index")
+    active_rows = active_first.to_dict("index")
+    matched_rows = []
+    for c_name, a_name in all_matches.items():
+        c_row = combined_rows[c_name]
+        a_row = active_rows[a_name]
+        merged_row = {
+            "MIT Name": c_row["MIT Name"],
+            "Start date": c_row.get("Start date", ""),
+            "Training Site": c_row.get("Training Site", ""),
+            "Location": c_row.get("Location", ""),
+            "Status": c_row.get("Status", ""),
+            "Level": c_row.get("Level", ""),
+            "Vert": c_row.get("Vert", ""),
+            "Source": c_row.get("Source", ""),
+            "Training Program": a_row.get(program_col, ""),
+            "Active Start Date": a_row.get(start_col, ""),
+            "Active Site": a_row.get(site_col, ""),
+        }
+        matched_rows.append(merged_row)
+
+    # Same clean name on several rows of one roster: only the first row is
+    # matched and merged, so list every such row for a manual check
+    duplicates = pd.concat([
+        pd.DataFrame({"Roster": "Combined", "Clean Name": combined_dupes["CleanName"],
+                      "Name": combined_dupes["MIT Name"], "Row": combined_dupes.index}),
+        pd.DataFrame({"Roster": "Active", "Clean Name": active_dupes["CleanName"],
+                      "Name": active_dupes[name_col], "Row": active_dupes.index}),
+    ], ignore_index=True)
+
+    return {
+        "merged_dashboard_ready.csv": pd.DataFrame(matched_rows),
+        "exact_matches.csv": pd.DataFrame({"Exact Matches": exact_matches}),
+        "confirmed_fuzzy.csv": pd.DataFrame({"Confirmed Fuzzy": [f"{x[0]} <-> {x[1]}" for x in confirmed_fuzzy]}),
+        "possible_matches_review.csv": possible_matches,
+        "only_in_combined.csv": pd.DataFrame({"Only in Combined": only_in_combined}),
+        "only_in_active.csv": pd.DataFrame({"Only in Active": only_in_active}),
+        "duplicate_names_review.csv": duplicates,
+    }
 
 # ---------------- OUTPUTS ----------------
-merged_df.to_csv("merged_dashboard_ready.csv", index=False)
-pd.DataFrame({"Exact Matches": exact_matches}).to_csv("exact_matches.csv", index=False)
-pd.DataFrame({"Confirmed Fuzzy": [f"{x[0]} <-> {x[1]}" for x in confirmed_fuzzy]}).to_csv("confirmed_fuzzy.csv", index=False)
-pd.DataFrame(possible_matches).to_csv("possible_matches_review.csv", index=False)
-pd.DataFrame({"Only in Combined": only_in_combined}).to_csv("only_in_combined.csv", index=False)
-pd.DataFrame({"Only in Active": only_in_active}).to_csv("only_in_active.csv", index=False)
-
-# ---------------- SUMMARY ----------------
-print("✅ Exact matches:", len(exact_matches))
-print("🤝 Confirmed fuzzy matches:", len(confirmed_fuzzy))
-print("❌ Only in combined:", len(only_in_combined))
-print("⚠️ Only in active:", len(only_in_active))
-print(f"🔍 Possible (unconfirmed) fuzzy matches: {len(possible_matches)}")
-print("\n📁 Outputs created:")
-print(" - merged_dashboard_ready.csv (for dashboard)")
-print(" - exact_matches.csv")
-print(" - confirmed_fuzzy.csv")
-print(" - possible_matches_review.csv (manual check)")
-print(" - only_in_combined.csv")
-print(" - only_in_active.csv")
+def write_outputs(outputs, out_dir="."):
+    for name, df in outputs.items():
+        df.to_csv(Path(out_dir) / name, index=False)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reconcile combined_mit_data.csv with the master Active Roster")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes for the fuzzy name matching (default: 1, no pool)")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    combined, active_mit, cols = load_inputs()
+    outputs = reconcile(combined, active_mit, cols, workers=args.workers)
+    write_outputs(outputs)
+
+    # ---------------- SUMMARY ----------------
+    print("✅ Exact matches:", len(outputs["exact_matches.csv"]))
+    print("🤝 Confirmed fuzzy matches:", len(outputs["confirmed_fuzzy.csv"]))
+    print("❌ Only in combined:", len(outputs["only_in_combined.csv"]))
+    print("⚠️ Only in active:", len(outputs["only_in_active.csv"]))
+    print(f"🔍 Possible (unconfirmed) fuzzy matches: {len(outputs['possible_matches_review.csv'])}")
+    duplicates = outputs["duplicate_names_review.csv"]
+    if len(duplicates):
+        print(f"👥 {duplicates['Clean Name'].nunique()} names appear on more than one roster row "
+              f"(first row used; see duplicate_names_review.csv)")
+    print("\n📁 Outputs created:")
+    print(" - merged_dashboard_ready.csv (for dashboard)")
+    print(" - exact_matches.csv")
+    print(" - confirmed_fuzzy.csv")
+    print(" - possible_matches_review.csv (manual check)")
+    print(" - only_in_combined.csv")
+    print(" - only_in_active.csv")
+    print(" - duplicate_names_review.csv (manual check)")
+
+if __name__ == "__main__":
+    main()
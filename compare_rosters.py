@@ -1,37 +1,29 @@
 import pandas as pd
 
+from pipeline_io import read_frame
+from workbook_ingest import MIT_PROGRAMS, iter_roster_batches
+
 # ==== Load files ====
 combined_path = "combined_mit_data.csv"
 excel_path = "Copy of 2025 Leadership Development (NLT + MIT) Program Master Roster.xlsx"
 
 # Read combined CSV
-combined_df = pd.read_csv(combined_path)
+combined_df = read_frame(combined_path)
 combined_df["MIT Name"] = combined_df["MIT Name"].str.strip().str.lower()
 
-# Read Excel file sheets
-xl = pd.ExcelFile(excel_path)
-active = xl.parse("Active Roster")
-graduated = xl.parse("Graduated Roster")
-
-# Normalize column names
-active.columns = active.columns.str.strip().str.lower()
-graduated.columns = graduated.columns.str.strip().str.lower()
-
-# Filter only MIT / SMIT programs
-def filter_mit(df):
-    if "training program" in df.columns:
-        df = df[df["training program"].astype(str).str.upper().isin(["MIT", "SMIT"])]
-    return df
-
-active_mit = filter_mit(active)
-graduated_mit = filter_mit(graduated)
-
-# Extract trainee names
+# Stream both Excel sheets in batches, keeping only MIT / SMIT rows and the
+# trainee name column (headers come back stripped and lowercased)
 def clean_names(df, col_name="trainee name"):
-    return df[col_name].dropna().str.strip().str.lower().tolist()
+    return df[col_name].dropna().astype(str).str.strip().str.lower().tolist()
+
+def mit_names(sheet):
+    names = []
+    for batch in iter_roster_batches(excel_path, sheet, programs=MIT_PROGRAMS, columns=["trainee name"]):
+        names += clean_names(batch)
+    return names
 
-active_names = clean_names(active_mit)
-grad_names = clean_names(graduated_mit)
+active_names = mit_names("Active Roster")
+grad_names = mit_names("Graduated Roster")
 all_excel_names = set(active_names + grad_names)
 
 # Compare to combined CSV names
@@ -55,10 +47,11 @@ for n in sorted(missing_in_combined):
     print(" -", n.title())
 
 # Optional: save results
+# (columns have different lengths, so each is its own Series)
 summary = pd.DataFrame({
-    "Matched": sorted(matched),
-    "Only in Combined CSV": sorted(missing_in_excel),
-    "Only in Excel": sorted(missing_in_combined)
+    "Matched": pd.Series(sorted(matched), dtype=object),
+    "Only in Combined CSV": pd.Series(sorted(missing_in_excel), dtype=object),
+    "Only in Excel": pd.Series(sorted(missing_in_combined), dtype=object)
 })
 summary.to_csv("name_comparison_summary.csv", index=False)
 print("\n📁 Saved detailed comparison to name_comparison_summary.csv")
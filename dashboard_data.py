@@ -0,0 +1,208 @@
+import hashlib
+import io
+import os
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import numpy as np
+import pandas as pd
+
+import frame_cache
+from salary import SALARY_MID, add_salary_columns
+from schema import JOBS_SCHEMA, ROSTER_SCHEMA, apply_schema
+from sheet_fetch import SNAPSHOT_DIR, fetch_csv, read_snapshot
+
+# ==========================================================
+# DASHBOARD DATA LOADING
+# ----------------------------------------------------------
+# Plain functions (no Streamlit) that fetch and clean the two published
+# Google Sheets. Fetches are conditional and backed by on-disk snapshots
+# (sheet_fetch.py), cleaned frames are cached by content hash
+# (frame_cache.py), and errors with no snapshot to fall back on are raised
+# to the caller. Each sheet can be pointed at another URL (sheets_standin.py)
+# or a local CSV through its environment variable, e.g.
+#   ROSTER_SHEET_SOURCE=/tmp/sheets/roster.csv streamlit run app.py
+# ==========================================================
+
+ROSTER_URL = (
+    "https://docs.google.com/spreadsheets/d/e/"
+    "2PACX-1vTAdbdhuieyA-axzb4aLe8c7zdAYXBLPNrIxKRder6j1ZAlj2g4U1k0YzkZbm_dEcSwBik4CJ57FROJ/"
+    "pub?gid=813046237&single=true&output=csv"
+)
+
+# ✅ Your real Open Jobs Google Sheets URL
+JOBS_URL = (
+    "https://docs.google.com/spreadsheets/d/e/"
+    "2PACX-1vSbD6wUrZEt9kuSQpUT2pw0FMOb7h1y8xeX-hDTeiiZUPjtV0ohK_WcFtCSt_4nuxdtn9zqFS8z8aGw/"
+    "pub?gid=116813539&single=true&output=csv"
+)
+
+
+ROSTER_SKIPROWS = 1  # Skip only the first row with "Training info"
+JOBS_SKIPROWS = 5
+CLEANING_VERSION = 4  # bump whenever clean_roster/clean_jobs change their output
+
+
+# ---- SOURCES ----
+class SheetSource:
+    def __init__(self, name, url, skiprows, env):
+        self.name = name
+        self.url = url  # the published sheet
+        self.skiprows = skiprows  # rows above the header
+        self.env = env  # variable overriding the URL with another URL or a CSV path
+
+    def location(self):
+        return os.environ.get(self.env) or self.url
+
+
+ROSTER_SOURCE = SheetSource("roster", ROSTER_URL, ROSTER_SKIPROWS, "ROSTER_SHEET_SOURCE")
+JOBS_SOURCE = SheetSource("jobs", JOBS_URL, JOBS_SKIPROWS, "JOBS_SHEET_SOURCE")
+
+
+def is_url(location):
+    return str(location).startswith(("http://", "https://", "file://"))
+
+
+def source_label(source, df):
+    # Where a loaded frame came from, for the dashboard banner, from the
+    # location load_sheet recorded (the source's current one if none):
+    # "Google Sheets" for the published sheet, the host of any other URL
+    # (e.g. the stand-in), the file name of a local CSV. Frames served from
+    # the on-disk snapshot are marked as such.
+    info = df.attrs.get("snapshot", {})
+    location = info.get("location") or source.location()
+    if location == source.url:
+        label = "Google Sheets"
+    elif is_url(location):
+        label = urlsplit(location).netloc or location
+    else:
+        label = f"local CSV {Path(location).name}"
+    if info.get("source") == "snapshot":
+        label += " (saved snapshot)"
+    return label
+
+
+# ---- FETCH + PARSE ----
+def fetch_sheet(name, url, snapshot_only=False, snapshot_dir=SNAPSHOT_DIR):
+    # (raw bytes, sha256, info) where info records where the bytes came from
+    # and when the server last confirmed them; None if snapshot_only and
+    # there is nothing on disk for this url (a snapshot left by another
+    # source, e.g. before ROSTER_SHEET_SOURCE changed, isn't served).
+    if snapshot_only:
+        body, meta = read_snapshot(name, snapshot_dir)
+        if body is None or meta.get("url") != url:
+            return None
+        return body, meta["sha256"], {"source": "snapshot", "location": url,
+                                      "fetched_at": meta.get("fetched_at", 0), "error": None}
+    if not is_url(url):  # local CSV: read as is, no snapshot
+        path = Path(url)
+        body = path.read_bytes()
+        return body, hashlib.sha256(body).hexdigest(), {"source": "file", "location": str(path),
+                                                        "fetched_at": path.stat().st_mtime, "error": None}
+    result = fetch_csv(url, name, snapshot_dir)
+    info = {
+        "source": result.source,
+        "location": url,
+        "fetched_at": result.fetched_at,
+        "error": str(result.error) if result.error else None,
+    }
+    return result.body, result.sha256, info
+
+
+def parse_sheet(body, skiprows):
+    return pd.read_csv(io.BytesIO(body), skiprows=skiprows, header=0)
+
+
+def load_sheet(name, url, skiprows, clean, depends_on="", snapshot_only=False,
+               snapshot_dir=SNAPSHOT_DIR, cache_dir=frame_cache.CACHE_DIR):
+    # Cleaned frame for one sheet. Unchanged bytes come straight from the
+    # frame cache; `depends_on` adds anything else the cleaning reads (the
+    # roster's Week column depends on today's date).
+    fetched = fetch_sheet(name, url, snapshot_only, snapshot_dir)
+    if fetched is None:
+        return None
+    body, sha256, info = fetched
+
+    key = frame_cache.cache_key(sha256, CLEANING_VERSION, depends_on)
+    df = frame_cache.get(name, key, cache_dir)
+    if df is None:
+        df = clean(parse_sheet(body, skiprows))
+        frame_cache.put(name, key, df, cache_dir)
+    df.attrs["snapshot"] = {**info, "version": key}
+    return df
+
+
+def frame_version(df):
+    # Identifies the data in a loaded frame: the frame cache key of its sheet
+    # bytes, cleaning and date. Frames built some other way are hashed.
+    version = df.attrs.get("snapshot", {}).get("version")
+    if version is None:
+        digest = hashlib.sha256(repr(list(df.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        version = digest.hexdigest()
+    return version
+
+
+# ---- ROSTER ----
+def load_data(url=None, snapshot_only=False, as_of=None):
+    # `url` defaults to ROSTER_SOURCE (the published sheet unless overridden)
+    as_of = pd.Timestamp.now().normalize() if as_of is None else pd.Timestamp(as_of)
+    return load_sheet(
+        "roster", url or ROSTER_SOURCE.location(), ROSTER_SOURCE.skiprows, lambda df: clean_roster(df, as_of),
+        as_of.isoformat(), snapshot_only
+    )
+
+
+def compute_weeks(start_dates, as_of):
+    # Training week for each start date, plus whole weeks until start for
+    # dates after `as_of`. Week is counted from 1 on the start date and left
+    # NaN for future starts; "Weeks Until Start" is NaN for everyone else.
+    start_dates = pd.to_datetime(start_dates, errors="coerce")
+    future = start_dates > as_of
+    week = ((as_of - start_dates).dt.days // 7 + 1).where(~future)
+    until = np.trunc((start_dates - as_of).dt.days / 7).where(future)
+    return week.astype(float), until.astype(float)
+
+
+def clean_roster(df, as_of=None):
+    # `as_of` fixes "today" for the Week calculation (defaults to today)
+    as_of = pd.Timestamp.now().normalize() if as_of is None else pd.Timestamp(as_of)
+
+    df = df.dropna(how="all")
+    df.columns = [c.strip() if isinstance(c, str) else c for c in df.columns]
+    df = df.rename(columns={"Week ": "Week", "Start date": "Start Date"})
+    if "Start Date" in df.columns:
+        df["Start Date"] = pd.to_datetime(df["Start Date"], errors="coerce")
+        weeks, weeks_until_start = compute_weeks(df["Start Date"], as_of)
+    else:
+        weeks = weeks_until_start = pd.Series(np.nan, index=df.index)
+
+    # Use Week from Google Sheet if available, otherwise calculate
+    if "Week" in df.columns:
+        # Keep the sheet's values; only fill rows where Week is missing or invalid
+        df["Week"] = pd.to_numeric(df["Week"], errors="coerce").fillna(weeks)
+    else:
+        df["Week"] = weeks
+    df["Weeks Until Start"] = weeks_until_start
+
+    # Salary Low / High / Mid from the shared parser; Salary keeps the midpoint
+    df = add_salary_columns(df)
+    if "Salary" in df.columns:
+        df["Salary"] = df[SALARY_MID]
+
+    if "Status" in df.columns:
+        df["Status"] = df["Status"].astype(str).str.strip().str.lower()
+    return apply_schema(df, ROSTER_SCHEMA, "roster")
+
+
+# ---- OPEN JOBS ----
+def load_jobs_data(url=None, snapshot_only=False):
+    return load_sheet("jobs", url or JOBS_SOURCE.location(), JOBS_SOURCE.skiprows, clean_jobs,
+                      snapshot_only=snapshot_only)
+
+
+def clean_jobs(jobs_df):
+    jobs_df = jobs_df.loc[:, ~jobs_df.columns.str.contains("^Unnamed")]
+    jobs_df = jobs_df.drop(columns=[c for c in ["JV Link", "JV ID"] if c in jobs_df.columns], errors="ignore")
+    jobs_df = add_salary_columns(jobs_df.dropna(how="all"))
+    return apply_schema(jobs_df, JOBS_SCHEMA, "jobs")
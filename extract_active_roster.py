@@ -1,24 +1,16 @@
-import pandas as pd
+from pipeline_io import CSV_DATE_FORMAT, write_frame
+from workbook_ingest import WORKBOOK_PATH, read_placement_workbook
 
-# === Load Excel file ===
-file_path = "MIT Tracking for Placement(Active_Roster) (1).xlsx"  # adjust if needed
-df_raw = pd.read_excel(file_path, sheet_name=0, header=None)
+# === Load the active roster section (stops reading at "MIT Reqs Open") ===
+file_path = WORKBOOK_PATH  # adjust if needed
+workbook = read_placement_workbook(file_path, reqs=False)
 
-# === Find where "MIT Reqs Open" starts ===
-reqs_index = df_raw[df_raw.astype(str).apply(lambda x: x.str.contains("MIT Reqs Open", case=False, na=False)).any(axis=1)].index
-
-# If found, cut the top section up to that row
-if len(reqs_index) == 0:
-    end_row = len(df_raw)
+if workbook.reqs_row is None:
     print("⚠️ 'MIT Reqs Open' not found. Reading entire file as top section.")
 else:
-    end_row = reqs_index[0]
-    print(f"📍 Top section ends before row {end_row}")
+    print(f"📍 Top section ends before row {workbook.reqs_row}")
 
-# === Extract headers and top section ===
-headers = df_raw.iloc[1].tolist()
-top_df = df_raw[2:end_row].copy()
-top_df.columns = headers
+top_df = workbook.roster
 
 # === Filter logic: only rows where Status does NOT contain "placed" ===
 if "Status" not in top_df.columns:
@@ -37,8 +29,8 @@ filtered_top = filtered_top[columns_present]
 # === Drop empty names ===
 filtered_top = filtered_top.dropna(subset=["MIT Name"])
 
-# === Save to CSV ===
-filtered_top.to_csv("active_roster_unplaced.csv", index=False)
+# === Save (CSV export, plus the typed file merge_mit_datasets.py reads) ===
+write_frame(filtered_top, "active_roster_unplaced.csv", date_format=CSV_DATE_FORMAT)
 
 # === Print preview ===
 print("\n✅ Saved active_roster_unplaced.csv")
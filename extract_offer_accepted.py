@@ -1,23 +1,19 @@
-import pandas as pd
+from pipeline_io import CSV_DATE_FORMAT, write_frame
+from workbook_ingest import WORKBOOK_PATH, read_placement_workbook
 
-file_path = "MIT Tracking for Placement(Active_Roster) (1).xlsx"
-df_raw = pd.read_excel(file_path, sheet_name=0, header=None)
+file_path = WORKBOOK_PATH
+workbook = read_placement_workbook(file_path)
 
 # --- Locate the 'MIT Reqs Open' section ---
-reqs_index = df_raw[df_raw.astype(str).apply(lambda x: x.str.contains("MIT Reqs Open", case=False, na=False)).any(axis=1)].index
-
-if len(reqs_index) == 0:
+if workbook.reqs is None:
     print("⚠️ 'MIT Reqs Open' section not found.")
     exit()
 
-reqs_row = reqs_index[0]
-print(f"📍 Found 'MIT Reqs Open' starting at row {reqs_row}")
+print(f"📍 Found 'MIT Reqs Open' starting at row {workbook.reqs_row}")
 
 # --- Extract headers and data ---
-headers = df_raw.iloc[reqs_row + 1].tolist()
-headers = [str(h).strip().replace('\xa0', ' ') for h in headers]  # clean weird spaces
-df_reqs = df_raw[reqs_row + 2:].copy()
-df_reqs.columns = headers
+df_reqs = workbook.reqs.copy()
+df_reqs.columns = [str(h).strip().replace('\xa0', ' ') for h in df_reqs.columns]  # clean weird spaces
 
 print("\n🧩 Cleaned Headers Detected:")
 print(df_reqs.columns.tolist())
@@ -48,7 +44,7 @@ keep_cols = [c for c in keep_cols if c in offer_df.columns]
 filtered = offer_df[keep_cols]
 
 # --- Save ---
-filtered.to_csv("offer_accepted_candidates.csv", index=False)
+write_frame(filtered, "offer_accepted_candidates.csv", date_format=CSV_DATE_FORMAT)
 
 print("\n✅ Saved offer_accepted_candidates.csv")
 print("🔍 Preview:")
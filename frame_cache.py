@@ -0,0 +1,162 @@
+import argparse
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # no pyarrow -> only the in-memory layer is used
+    pa = feather = None
+
+# ==========================================================
+# CLEANED-FRAME CACHE
+# ----------------------------------------------------------
+# Cleaned, typed DataFrames stored as uncompressed Feather (Arrow IPC)
+# files so they can be read back memory-mapped. Keys are built from the
+# sha256 of the raw CSV plus anything else the cleaning depends on, so an
+# unchanged sheet never goes through read_csv or the cleaning code again.
+# Least recently used files are evicted once the directory exceeds
+# MAX_CACHE_BYTES.
+#
+#   python frame_cache.py list
+#   python frame_cache.py purge [--name roster]
+#   python frame_cache.py evict --max-mb 64
+# ==========================================================
+
+CACHE_DIR = Path(__file__).resolve().parent / ".frame_cache"
+MAX_CACHE_BYTES = int(os.environ.get("FRAME_CACHE_MAX_MB", "256")) * 1024 * 1024
+
+_memory = {}  # name -> (key, DataFrame) for the last frame used in this process
+
+
+def cache_key(*parts):
+    return hashlib.sha256("|".join(str(p) for p in parts).encode()).hexdigest()[:32]
+
+
+def _path(name, key, cache_dir):
+    return Path(cache_dir) / f"{name}-{key}.arrow"
+
+
+# ---------------- READ / WRITE ----------------
+def get(name, key, cache_dir=CACHE_DIR):
+    memo = _memory.get(name)
+    if memo is not None and memo[0] == key:
+        return memo[1].copy()
+    if feather is None:
+        return None
+
+    path = _path(name, key, cache_dir)
+    if not path.exists():
+        return None
+    try:
+        df = feather.read_table(path, memory_map=True).to_pandas()
+    except (OSError, pa.ArrowException):
+        path.unlink(missing_ok=True)  # truncated or unreadable; rebuild it
+        return None
+    os.utime(path)  # mark as recently used
+    _memory[name] = (key, df)
+    return df.copy()
+
+
+def put(name, key, df, cache_dir=CACHE_DIR, max_bytes=MAX_CACHE_BYTES):
+    # Returns True when the frame was written to disk. Only a cache fill: a
+    # write that fails (disk full, a concurrent evict/purge) leaves the frame
+    # in memory and the load carries on.
+    df = df.copy()
+    df.attrs = {}
+    _memory[name] = (key, df)
+    if feather is None:
+        return False
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=True)
+    except (pa.ArrowException, TypeError, ValueError):
+        return False  # e.g. object columns mixing numbers and strings
+
+    path = _path(name, key, cache_dir)
+    tmp = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A temp file per writer: concurrent loads of the same version each
+        # replace the (identical) file whole
+        with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp",
+                                         delete=False) as tmp:
+            pass
+        feather.write_feather(table, tmp.name, compression="uncompressed")
+        os.replace(tmp.name, path)
+    except (OSError, pa.ArrowException):
+        if tmp is not None:
+            Path(tmp.name).unlink(missing_ok=True)
+        return False
+    evict(cache_dir, max_bytes, keep=path)
+    return True
+
+
+# ---------------- HOUSEKEEPING ----------------
+def entries(cache_dir=CACHE_DIR):
+    # [(path, size, last used)], least recently used first
+    found = []
+    for path in Path(cache_dir).glob("*.arrow"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        found.append((path, stat.st_size, stat.st_mtime))
+    return sorted(found, key=lambda e: e[2])
+
+
+def evict(cache_dir=CACHE_DIR, max_bytes=MAX_CACHE_BYTES, keep=None):
+    removed = []
+    found = entries(cache_dir)
+    total = sum(size for _, size, _ in found)
+    for path, size, _ in found:
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        path.unlink(missing_ok=True)
+        total -= size
+        removed.append(path)
+    return removed
+
+
+def purge(cache_dir=CACHE_DIR, name=None):
+    removed = []
+    for path, _, _ in entries(cache_dir):
+        if name is None or path.name.startswith(f"{name}-"):
+            path.unlink(missing_ok=True)
+            removed.append(path)
+    if name is None:
+        _memory.clear()
+    else:
+        _memory.pop(name, None)
+    return removed
+
+
+# ---------------- CLI ----------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect or purge the cleaned-frame cache")
+    parser.add_argument("--dir", type=Path, default=CACHE_DIR, help="cache directory")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="show cached frames, least recently used first")
+    purge_cmd = sub.add_parser("purge", help="delete cached frames")
+    purge_cmd.add_argument("--name", help="only frames for this sheet (e.g. roster, jobs)")
+    evict_cmd = sub.add_parser("evict", help="apply the size limit now")
+    evict_cmd.add_argument("--max-mb", type=float, default=MAX_CACHE_BYTES / 1024 / 1024)
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        found = entries(args.dir)
+        for path, size, used in found:
+            print(f"{path.name:<50} {size / 1024:10.1f} KB  last used {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(used))}")
+        print(f"📦 {len(found)} frames, {sum(s for _, s, _ in found) / 1024 / 1024:.1f} MB in {args.dir}")
+    elif args.command == "purge":
+        print(f"🗑️ Removed {len(purge(args.dir, args.name))} cached frames")
+    elif args.command == "evict":
+        print(f"🗑️ Evicted {len(evict(args.dir, int(args.max_mb * 1024 * 1024)))} cached frames")
+
+
+if __name__ == "__main__":
+    main()
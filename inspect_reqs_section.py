@@ -1,28 +1,21 @@
-import pandas as pd
+from workbook_ingest import WORKBOOK_PATH, read_placement_workbook
 
 # --- Load Excel file ---
-file_path = "MIT Tracking for Placement(Active_Roster) (1).xlsx"  # adjust name if needed
-df_raw = pd.read_excel(file_path, sheet_name=0, header=None)
+file_path = WORKBOOK_PATH  # adjust name if needed
+workbook = read_placement_workbook(file_path)
 
 # --- Find where 'MIT Reqs Open' starts ---
-reqs_index = df_raw[df_raw.astype(str).apply(lambda x: x.str.contains("MIT Reqs Open", case=False, na=False)).any(axis=1)].index
-
-if len(reqs_index) == 0:
+if workbook.reqs is None:
     print("⚠️ Could not find 'MIT Reqs Open' automatically.")
 else:
-    reqs_row = reqs_index[0]
-    print(f"📍 'MIT Reqs Open' starts at row {reqs_row}")
+    print(f"📍 'MIT Reqs Open' starts at row {workbook.reqs_row}")
 
-    # --- Extract headers (row after the label) ---
-    headers = df_raw.iloc[reqs_row + 1].tolist()
+    # --- Headers (row after the label) and the data below them ---
+    df_reqs = workbook.reqs
     print("\n📋 Headers in this section:")
-    for h in headers:
+    for h in df_reqs.columns:
         print("-", h)
 
-    # --- Extract data below the headers ---
-    df_reqs = df_raw[reqs_row + 2:].copy()
-    df_reqs.columns = headers
-
     # --- Filter rows that have a Start Date ---
     if "Start Date" in df_reqs.columns:
         filtered = df_reqs[df_reqs["Start Date"].notna() & (df_reqs["Start Date"].astype(str).str.strip() != "")]
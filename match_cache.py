@@ -0,0 +1,180 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from match_scoring import (
+    CHUNK_PAIRS,
+    candidate_features,
+    job_display,
+    job_features,
+    pack_totals,
+    pair_scores,
+    slice_features,
+    top_k_frame,
+    top_k_matches,
+    top_k_packed,
+)
+
+# ==========================================================
+# INCREMENTAL MATCH SCORING
+# ----------------------------------------------------------
+# Keeps the candidate × job totals from the previous snapshot and, on the
+# next one, only rescores candidates and jobs whose rows changed.
+# Candidates are keyed on "MIT Name", jobs on account / title / city, and a
+# per-row hash of every column detects edits. A new or retyped column (the
+# scoring reads whole columns) falls back to a full recompute. Results are
+# identical to top_k_matches() on the same frames; see
+# benchmarks/bench_match_cache.py.
+#
+# Memory: the cache holds one int16 matrix (pack_totals, 2 bytes a pair,
+# ~40 MB at 10k × 2k) plus each candidate's top-k, and scores in chunks of
+# CHUNK_PAIRS like top_k_matches. Subscores are rebuilt for the picked jobs
+# only. Above MAX_CACHED_PAIRS nothing is kept and every call is a plain
+# top_k_matches().
+# ==========================================================
+
+JOB_KEY_COLUMNS = ["Job Account", "Title", "City"]
+MAX_CACHED_PAIRS = 50_000_000  # 100 MB of packed totals
+
+
+# ---------------- DIFF ----------------
+def base_keys(df, kind):
+    if kind == "jobs":
+        display = job_display(df)
+        parts = [display[col].astype(object).map(str) for col in JOB_KEY_COLUMNS]
+        return parts[0] + "|" + parts[1] + "|" + parts[2]
+    if "MIT Name" not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    return df["MIT Name"].astype(object).map(str)
+
+
+def row_hashes(df):
+    # Object columns can hold 5 and "5", which hash alike but score differently
+    # (see numeric_values), so each value's type is hashed alongside it
+    parts = {}
+    for i, col in enumerate(df.columns):
+        parts[str(i)] = df[col]
+        if df[col].dtype == object:
+            parts[f"{i}:type"] = df[col].map(lambda v: type(v).__name__)
+    return pd.util.hash_pandas_object(pd.DataFrame(parts, index=df.index), index=False).to_numpy()
+
+
+class Snapshot:
+    def __init__(self, df, kind):
+        # Row identity is key + contents. Repeated keys (two openings with the
+        # same account/title/city) are told apart by contents first and then by
+        # how many identical rows came before, so reordering them is free.
+        self.columns = [(col, str(dtype)) for col, dtype in df.dtypes.items()]
+        keys = base_keys(df, kind) + "#" + pd.Series(row_hashes(df), index=df.index).astype(str)
+        self.keys = pd.Index(keys + "#" + keys.groupby(keys, sort=False).cumcount().astype(str))
+
+    def positions_in(self, previous):
+        # Position of each row in `previous`, or -1 when it must be rescored
+        if previous is None or previous.columns != self.columns:
+            return np.full(len(self.keys), -1)
+        return previous.keys.get_indexer(self.keys)
+
+
+def _same_order(pos, n_previous):
+    return len(pos) == n_previous and bool((pos == np.arange(n_previous)).all())
+
+
+def _packed_totals(cf, jf, chunk_pairs):
+    # pack_totals() for every candidate × job pair, scored chunk_pairs at a time
+    n_c, n_j = len(cf["readiness"]), len(jf["salary"])
+    packed = np.empty((n_c, n_j), dtype=np.int16)
+    chunk_rows = max(1, chunk_pairs // max(n_j, 1))
+    for start in range(0, n_c, chunk_rows):
+        rows = slice(start, min(start + chunk_rows, n_c))
+        packed[rows] = pack_totals(pair_scores(slice_features(cf, rows), jf)["Total Score"])
+    return packed
+
+
+# ---------------- CACHE ----------------
+class MatchCache:
+    def __init__(self, max_pairs=MAX_CACHED_PAIRS):
+        self.max_pairs = max_pairs
+        self.full_recomputes = 0
+        self.last_update = {}
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._candidates = None
+        self._jobs = None
+        self._packed = None  # candidates × jobs pack_totals() values
+        self._top = None  # candidates × k job positions from the last call
+
+    def top_k(self, candidates, jobs, k=3, chunk_pairs=CHUNK_PAIRS):
+        # Same frame as top_k_matches(candidates, jobs, k)
+        n_c, n_j = len(candidates), len(jobs)
+        k = min(k, n_j)
+        if n_c == 0 or k <= 0:
+            return top_k_matches(candidates, jobs, k)
+
+        with self._lock:
+            if n_c * n_j > self.max_pairs:
+                self._reset()
+                self.last_update = {"pairs rescored": n_c * n_j, "pairs total": n_c * n_j, "cached": False}
+                return top_k_matches(candidates, jobs, k, chunk_pairs)
+
+            cf = candidate_features(candidates)
+            jf = job_features(jobs)
+            cand_pos, jobs_same = self._update(candidates, jobs, cf, jf, chunk_pairs)
+            if jobs_same and self._top is not None and self._top.shape[1] == k:
+                # Unchanged jobs keep their top-k; only rescored candidates pick again
+                job_idx = self._top.take(np.maximum(cand_pos, 0), axis=0)
+                redo = np.flatnonzero(cand_pos < 0)
+                job_idx[redo] = top_k_packed(self._packed[redo], k)
+            else:
+                chunk_rows = max(1, chunk_pairs // n_j)
+                job_idx = np.concatenate([
+                    top_k_packed(self._packed[start:start + chunk_rows], k)
+                    for start in range(0, n_c, chunk_rows)
+                ])
+            self._top = job_idx
+        return top_k_frame(candidates, jobs, job_idx, pair_scores(cf, jf, job_idx))
+
+    def _update(self, candidates, jobs, cf, jf, chunk_pairs):
+        # Brings the cached totals up to date with the current frames,
+        # reusing every unchanged pair. Returns the previous position of each
+        # candidate (-1 = rescored) and whether the job columns are unchanged.
+        cand_snap = Snapshot(candidates, "candidates")
+        job_snap = Snapshot(jobs, "jobs")
+        cand_pos = cand_snap.positions_in(self._candidates)
+        job_pos = job_snap.positions_in(self._jobs)
+        kept_c, new_c = np.flatnonzero(cand_pos >= 0), np.flatnonzero(cand_pos < 0)
+        kept_j, new_j = np.flatnonzero(job_pos >= 0), np.flatnonzero(job_pos < 0)
+        jobs_same = False
+
+        if len(kept_c) == 0 or len(kept_j) == 0:
+            self._packed = None  # free the old matrix before building the new one
+            self._packed = _packed_totals(cf, jf, chunk_pairs)
+            self.full_recomputes += 1
+        else:
+            # Edits in place when nothing moved; new rows/columns start as
+            # copies of row/column 0 and are overwritten below
+            n_c_old, n_j_old = self._packed.shape
+            jobs_same = _same_order(job_pos, n_j_old)
+            rows_same = _same_order(np.where(cand_pos < 0, np.arange(len(cand_pos)), cand_pos), n_c_old)
+            if not rows_same:
+                self._packed = self._packed.take(np.maximum(cand_pos, 0), axis=0)
+            if not jobs_same:
+                self._packed = self._packed.take(np.maximum(job_pos, 0), axis=1)
+            if len(new_c):
+                self._packed[new_c] = _packed_totals(slice_features(cf, new_c), jf, chunk_pairs)
+            if len(new_j):
+                self._packed[np.ix_(kept_c, new_j)] = _packed_totals(
+                    slice_features(cf, kept_c), slice_features(jf, new_j), chunk_pairs
+                )
+
+        self._candidates, self._jobs = cand_snap, job_snap
+        self.last_update = {
+            "candidates rescored": len(new_c),
+            "jobs rescored": len(new_j),
+            "pairs rescored": len(new_c) * len(jobs) + len(kept_c) * len(new_j),
+            "pairs total": len(candidates) * len(jobs),
+            "cached": True,
+        }
+        return cand_pos, jobs_same
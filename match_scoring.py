@@ -0,0 +1,297 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+from salary import SALARY_MID
+
+# ==========================================================
+# CANDIDATE × JOB MATCH SCORING (vectorized)
+# ----------------------------------------------------------
+# Same rules as the original row-by-row loop in app.py, computed as
+# candidates × jobs matrices instead of one dict per pair.
+# ==========================================================
+
+SUBSCORES = ["Vertical", "Salary", "Geo", "Confidence", "Readiness"]
+EXPERIENCE_KEYS = ["experience", "notes", "background"]
+MATCH_COLUMNS = ["Candidate", "Job Account", "Title", "City", "State", "VERT", "Total Score", "Week", "Status"]
+TOP_K_COLUMNS = ["Candidate", "Rank", "Job Account", "Title", "City", "State", "VERT",
+                 *SUBSCORES, "Total Score", "Week", "Status"]
+CHUNK_PAIRS = 2_000_000  # candidate×job pairs scored at once by top_k_matches
+
+
+# ---------------- HELPERS ----------------
+def _text(df, col, default=""):
+    # Same as str(row.get(col, default)) for every row
+    if col not in df.columns:
+        return pd.Series(str(default), index=df.index, dtype=object)
+    return df[col].astype(object).map(str)
+
+
+def _job_side(values, job_idx):
+    # Per-job values laid out against the candidates: every job (1 × jobs), or
+    # only each candidate's picked jobs (candidates × k) when job_idx is given
+    return values[None, :] if job_idx is None else values[job_idx]
+
+
+def _equal_matrix(left, right, job_idx=None):
+    # Pairwise string equality through shared integer codes
+    codes, _ = pd.factorize(pd.concat([left, right], ignore_index=True))
+    return codes[: len(left), None] == _job_side(codes[len(left):], job_idx)
+
+
+def numeric_values(series):
+    # Only real int/float values count as numbers (the loop used isinstance)
+    if is_numeric_dtype(series.dtype):
+        return series.to_numpy(dtype=float, na_value=np.nan)
+    return series.map(lambda v: float(v) if isinstance(v, (int, float)) else np.nan).to_numpy(dtype=float)
+
+
+def _first_truthy(df, cols, default="—"):
+    # Same as `row.get(a) or row.get(b) or default`
+    out = pd.Series(default, index=df.index, dtype=object)
+    for col in reversed(cols):
+        if col in df.columns:
+            values = df[col].astype(object)
+            out = values.where(values.map(bool), out)
+    return out
+
+
+def _round1(whole, readiness):
+    # Totals are whole-number subscores plus the readiness bonus. When that
+    # bonus is a multiple of 0.5 the sum is already exact at one decimal; other
+    # rows go through a small lookup table built with Python's round() so the
+    # results match the original loop exactly.
+    total = whole + readiness[:, None]
+    irregular = np.flatnonzero(readiness * 2 != np.floor(readiness * 2))
+    if len(irregular) and whole.size:
+        lo, hi = int(whole.min()), int(whole.max())
+        bonuses, bonus_idx = np.unique(readiness[irregular], return_inverse=True)
+        lut = np.array([[round(k + r, 1) for k in range(lo, hi + 1)] for r in bonuses.tolist()])
+        total[irregular] = lut[bonus_idx[:, None], whole[irregular] - lo]
+    return total
+
+
+# ---------------- SUBSCORES ----------------
+def candidate_features(candidates):
+    # Per-candidate inputs, computed once and reused against every job
+    exp_cols = [
+        k for k in candidates.columns
+        if isinstance(k, str) and any(x in k.lower() for x in EXPERIENCE_KEYS)
+    ]
+    has_exp = np.zeros(len(candidates), dtype=bool)
+    for col in exp_cols:
+        text = _text(candidates, col).str.lower()
+        has_exp |= (text.str.contains("amazon", regex=False) | text.str.contains("aviation", regex=False)).to_numpy()
+
+    conf = _text(candidates, "Confidence").str.lower()
+    conf_score = np.select(
+        [
+            conf.str.contains("high", regex=False).to_numpy(),
+            conf.str.contains("mod", regex=False).to_numpy(),
+            conf.str.contains("low", regex=False).to_numpy(),
+        ],
+        [15, 10, 5],
+        10,
+    ).astype(np.int8)
+
+    week = numeric_values(candidates["Week"]) if "Week" in candidates.columns else np.full(len(candidates), np.nan)
+    ready_score = np.where(week >= 6, 10.0, np.where((week >= 1) & (week <= 5), week * 1.5, 5.0))
+
+    salary = candidates[SALARY_MID] if SALARY_MID in candidates.columns else pd.Series(np.nan, index=candidates.index)
+
+    return {
+        "vert": _text(candidates, "VERT").str.strip().str.upper(),
+        "exp_bonus": np.where(has_exp, 10, 0).astype(np.int8),
+        "salary": pd.to_numeric(salary, errors="coerce").to_numpy(dtype=float, na_value=np.nan),
+        "location": _text(candidates, "Location").str.strip().str.lower(),
+        "confidence": conf_score,
+        "readiness": ready_score,
+    }
+
+
+def job_features(jobs):
+    # Per-job inputs, computed once and reused against every candidate
+    vert = _text(jobs, "VERT") if "VERT" in jobs.columns else _text(jobs, "Vertical")
+    salary = jobs[SALARY_MID] if SALARY_MID in jobs.columns else pd.Series(np.nan, index=jobs.index)
+    return {
+        "vert": vert.str.strip().str.upper(),
+        "salary": pd.to_numeric(salary, errors="coerce").to_numpy(dtype=float, na_value=np.nan),
+        "city": _text(jobs, "City").str.strip().str.lower(),
+        "state": _text(jobs, "State").str.strip().str.upper().str.lower(),
+    }
+
+
+def vertical_scores(cf, jf, job_idx=None):
+    same = _equal_matrix(cf["vert"], jf["vert"], job_idx)
+    return (np.where(same, 30, 0) + cf["exp_bonus"][:, None]).astype(np.int8)
+
+
+def salary_scores(cf, jf, job_idx=None):
+    c_sal = cf["salary"][:, None]
+    j_sal = _job_side(jf["salary"], job_idx)
+    # Missing or zero salaries score 0; NaN also falls through every comparison
+    with np.errstate(divide="ignore", invalid="ignore"):
+        valid = (c_sal != 0) & (j_sal != 0)
+        conditions = [
+            valid & (j_sal >= 1.05 * c_sal),
+            valid & (np.abs(j_sal - c_sal) / c_sal <= 0.05),
+            valid & (j_sal < 0.95 * c_sal),
+        ]
+    return np.select(conditions, [25, 15, -10], 0).astype(np.int8)
+
+
+def geo_scores(cf, jf, job_idx=None):
+    same_city = _equal_matrix(cf["location"], jf["city"], job_idx)
+    state_codes, states = pd.factorize(jf["state"])
+    ends_with = np.zeros((len(cf["location"]), len(states)), dtype=bool)
+    for k, state in enumerate(states):
+        ends_with[:, k] = cf["location"].str.endswith(state).to_numpy()
+    if job_idx is None:
+        in_state = ends_with[:, state_codes]
+    else:
+        in_state = np.take_along_axis(ends_with, state_codes[job_idx], axis=1)
+    return np.where(same_city, 20, np.where(in_state, 10, 5)).astype(np.int8)
+
+
+# ---------------- MATRIX ----------------
+def slice_features(features, rows):
+    return {k: (v.iloc[rows] if isinstance(v, pd.Series) else v[rows]) for k, v in features.items()}
+
+
+def pair_scores(cf, jf, job_idx=None):
+    # Every candidate × job pair, or with job_idx (candidates × k job
+    # positions) only those picked pairs, laid out like job_idx
+    n_jobs = len(jf["salary"]) if job_idx is None else job_idx.shape[1]
+    shape = (len(cf["readiness"]), n_jobs)
+    scores = {
+        "Vertical": vertical_scores(cf, jf, job_idx),
+        "Salary": salary_scores(cf, jf, job_idx),
+        "Geo": geo_scores(cf, jf, job_idx),
+        "Confidence": np.broadcast_to(cf["confidence"][:, None], shape),
+        "Readiness": np.broadcast_to(cf["readiness"][:, None], shape),
+    }
+    whole = (
+        scores["Vertical"].astype(np.int16)
+        + scores["Salary"]
+        + scores["Geo"]
+        + cf["confidence"][:, None]
+    )
+    scores["Total Score"] = _round1(whole, cf["readiness"])
+    return scores
+
+
+def score_matrix(candidates, jobs):
+    # Returns {subscore: candidates × jobs array, "Total Score": rounded totals}.
+    # Confidence and Readiness only depend on the candidate, so they are
+    # broadcast views rather than full copies.
+    return pair_scores(candidate_features(candidates), job_features(jobs))
+
+
+def job_display(jobs):
+    # Display fields for each job, with the same fallbacks the loop used
+    return pd.DataFrame({
+        "Job Account": _first_truthy(jobs, ["Account", "Job Account"]),
+        "Title": _first_truthy(jobs, ["Title", "Job Title"]),
+        "City": jobs["City"] if "City" in jobs.columns else "",
+        "State": jobs["State"] if "State" in jobs.columns else "",
+        "VERT": _first_truthy(jobs, ["VERT", "Vertical"]),
+    }, index=jobs.index)
+
+
+def match_table(candidates, jobs):
+    # One row per candidate/job pair, candidate-major, same columns and order
+    # as the original `match_results` list.
+    n_c, n_j = len(candidates), len(jobs)
+    if n_c == 0 or n_j == 0:
+        return pd.DataFrame(columns=MATCH_COLUMNS)
+
+    total = score_matrix(candidates, jobs)["Total Score"]
+    display = job_display(jobs)
+
+    def per_candidate(col):
+        if col not in candidates.columns:
+            return np.full(n_c * n_j, None, dtype=object)
+        return np.repeat(candidates[col].to_numpy(), n_j)
+
+    out = {"Candidate": per_candidate("MIT Name")}
+    for col in ["Job Account", "Title", "City", "State", "VERT"]:
+        out[col] = np.tile(display[col].to_numpy(), n_c)
+    out["Total Score"] = total.ravel()
+    out["Week"] = per_candidate("Week")
+    out["Status"] = per_candidate("Status")
+    return pd.DataFrame(out, columns=MATCH_COLUMNS)
+
+
+# ---------------- TOP-K ----------------
+def pack_totals(total):
+    # Totals sit on a 0.1 grid between 0 and 110, so ten times the total is
+    # an exact int16 (2 bytes a pair instead of 8)
+    return np.rint(total * 10).astype(np.int16)
+
+
+def top_k_indices(total, k):
+    return top_k_packed(pack_totals(total), k)
+
+
+def top_k_packed(packed, k):
+    # Best k jobs per row of pack_totals() values, highest score first and
+    # earlier job rows first on ties. Score and job position pack into one
+    # integer key, so argpartition only has to look at each pair once.
+    n_jobs = packed.shape[1]
+    key = packed.astype(np.int64) * n_jobs + np.arange(n_jobs - 1, -1, -1)
+    if k < n_jobs:
+        top = np.argpartition(-key, k - 1, axis=1)[:, :k]
+    else:
+        top = np.broadcast_to(np.arange(n_jobs), key.shape).copy()
+    order = np.argsort(-np.take_along_axis(key, top, axis=1), axis=1)
+    return np.take_along_axis(top, order, axis=1)
+
+
+def top_k_matches(candidates, jobs, k=3, chunk_pairs=CHUNK_PAIRS):
+    # Top-k jobs per candidate with their subscores, scored in candidate chunks
+    # so only chunk × jobs pairs are held in memory at any time.
+    n_c, n_j = len(candidates), len(jobs)
+    k = min(k, n_j)
+    if n_c == 0 or k <= 0:
+        return pd.DataFrame(columns=TOP_K_COLUMNS)
+
+    cf = candidate_features(candidates)
+    jf = job_features(jobs)
+    chunk_rows = max(1, chunk_pairs // n_j)
+
+    job_idx = np.empty((n_c, k), dtype=np.int64)
+    picked = {name: np.empty((n_c, k), dtype=np.int8) for name in ["Vertical", "Salary", "Geo", "Confidence"]}
+    picked.update({name: np.empty((n_c, k)) for name in ["Readiness", "Total Score"]})
+    for start in range(0, n_c, chunk_rows):
+        rows = slice(start, min(start + chunk_rows, n_c))
+        scores = pair_scores(slice_features(cf, rows), jf)
+        top = top_k_indices(scores["Total Score"], k)
+        job_idx[rows] = top
+        for name, values in picked.items():
+            values[rows] = np.take_along_axis(scores[name], top, axis=1)
+
+    return top_k_frame(candidates, jobs, job_idx, picked)
+
+
+def top_k_frame(candidates, jobs, job_idx, picked):
+    # TOP_K_COLUMNS rows from picked job positions (candidates × k) and the
+    # subscores at those positions
+    n_c, k = job_idx.shape
+    display = job_display(jobs)
+
+    def per_candidate(col):
+        if col not in candidates.columns:
+            return np.full(n_c * k, None, dtype=object)
+        return np.repeat(candidates[col].to_numpy(), k)
+
+    out = {
+        "Candidate": per_candidate("MIT Name"),
+        "Rank": np.tile(np.arange(1, k + 1), n_c),
+    }
+    for col in ["Job Account", "Title", "City", "State", "VERT"]:
+        out[col] = display[col].to_numpy()[job_idx.ravel()]
+    for name, values in picked.items():
+        out[name] = values.ravel()
+    out["Week"] = per_candidate("Week")
+    out["Status"] = per_candidate("Status")
+    return pd.DataFrame(out, columns=TOP_K_COLUMNS)
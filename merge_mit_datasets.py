@@ -1,8 +1,10 @@
 import pandas as pd
 
-# === STEP 1: Load both CSVs ===
-roster = pd.read_csv("active_roster_unplaced.csv")
-offers = pd.read_csv("offer_accepted_candidates.csv")
+from pipeline_io import CSV_DATE_FORMAT, read_frame, write_frame
+
+# === STEP 1: Load both extracts (typed files when PIPELINE_FORMAT has them) ===
+roster = read_frame("active_roster_unplaced.csv")
+offers = read_frame("offer_accepted_candidates.csv")
 
 # === STEP 2: Clean & normalize columns ===
 # Clean headers
@@ -45,7 +47,7 @@ offers = offers[columns]
 combined = pd.concat([roster, offers], ignore_index=True)
 
 # === STEP 4: Save result ===
-combined.to_csv("combined_mit_data.csv", index=False)
+write_frame(combined, "combined_mit_data.csv", date_format=CSV_DATE_FORMAT)
 
 print("✅ Combined file created successfully: combined_mit_data.csv")
 print(f"📊 Total rows: {len(combined)}")
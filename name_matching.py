@@ -0,0 +1,304 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from difflib import SequenceMatcher
+
+import numpy as np
+import pandas as pd
+
+# ==========================================================
+# FUZZY NAME MATCHING
+# ----------------------------------------------------------
+# Finds every (left, right) pair of names whose SequenceMatcher ratio is at
+# least `threshold`, without scoring all left × right pairs:
+#   1. blocking: a prefix-filtered index over each name's characters proposes
+#      pairs that can still reach the threshold
+#   2. bounds: a length bound, a character-count bound (the same bound as
+#      SequenceMatcher.quick_ratio) and a longest-common-subsequence bound
+#      are checked in numpy on those pairs
+#   3. SequenceMatcher.ratio() runs only on the pairs that pass
+# Steps 1 and 2 never drop a pair that would pass step 3, so the result is
+# exactly what the all-pairs loop gives. match_names_parallel() splits the
+# left names into contiguous shards over a process pool. The right-name
+# index is built once and every worker gets its own copy; shards are
+# stitched back in order, so the result is the same frame as match_names().
+# ==========================================================
+
+DEFAULT_THRESHOLD = 0.78
+CHUNK_PAIRS = 2_000_000  # candidate pairs generated and bounded at once
+SHARDS_PER_WORKER = 4  # smaller shards even out workers that draw slow names
+
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def similarity(a, b):
+    return SequenceMatcher(None, a, b).ratio()
+
+
+# ---------------- INDEX ----------------
+def _char_counts(names, alphabet):
+    counts = np.zeros((len(names), len(alphabet)), dtype=np.int64)
+    for i, name in enumerate(names):
+        for ch in name:
+            counts[i, alphabet[ch]] += 1
+    # Small dtype: the bound gathers a row of counts for every candidate pair
+    return counts.astype(np.uint8) if counts.max(initial=0) < 256 else counts
+
+
+def _length_range(lengths, threshold, longest):
+    # Lengths a partner can have: 2 * min(la, lb) / (la + lb) >= t, 0 < t <= 1
+    low = np.ceil(lengths * threshold / (2 - threshold) - 1e-9)
+    high = np.floor(lengths * (2 - threshold) / threshold + 1e-9)
+    return np.minimum(low, longest).astype(np.int64), np.minimum(high, longest).astype(np.int64)
+
+
+def _min_overlap(lengths, threshold):
+    # Characters a name of this length must share with any name it matches:
+    # ratio = 2M / (la + lb) >= t and M <= lb give M >= t * la / (2 - t).
+    # The small slack keeps rounding from ever dropping a real match.
+    return np.maximum(np.ceil(threshold * lengths / (2 - threshold) - 1e-9), 1).astype(np.int64)
+
+
+def _prefix_tokens(counts, rank, threshold):
+    # Each character occurrence is a token ("n" twice -> n#1, n#2); tokens are
+    # ordered rarest first. Two names sharing M characters must share a token
+    # within the first len - M + 1 tokens of each, so only those are indexed.
+    # Returns parallel (token, row, position in the row) arrays.
+    max_count = int(counts.max(initial=0))
+    lengths = counts.sum(axis=1)
+    keep = lengths - _min_overlap(lengths, threshold) + 1
+    rows, tokens = [], []
+    for occurrence in range(1, max_count + 1):
+        r, c = np.nonzero(counts >= occurrence)
+        rows.append(r)
+        tokens.append(rank[c, occurrence - 1])
+    rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+    tokens = np.concatenate(tokens) if tokens else np.empty(0, dtype=np.int64)
+
+    order = np.lexsort((tokens, rows))
+    rows, tokens = rows[order], tokens[order]
+    position = np.arange(len(rows)) - np.searchsorted(rows, rows)
+    prefix = position < keep[rows]
+    return tokens[prefix], rows[prefix], position[prefix]
+
+
+def _token_ranks(left_counts, right_counts):
+    # rank[char, occurrence - 1]: global position of that token, rarest first
+    max_count = int(max(left_counts.max(initial=0), right_counts.max(initial=0)))
+    occurrence = np.arange(1, max_count + 1)
+    freq = sum((c[:, :, None] >= occurrence).sum(axis=0) for c in (left_counts, right_counts))
+    rank = np.empty(freq.size, dtype=np.int64)
+    rank[np.argsort(freq, axis=None, kind="stable")] = np.arange(freq.size)
+    return rank.reshape(freq.shape)
+
+
+class RightIndex:
+    # Everything matching needs from the right-hand names, built once and
+    # shared by every batch (or worker shard) of left names. `left` is every
+    # left name that will be matched, so the alphabet and token order cover
+    # both sides.
+    def __init__(self, right, threshold, left=()):
+        left = [str(n) for n in left]
+        self.names = [str(n) for n in right]
+        self.threshold = threshold
+        self.alphabet = {ch: k for k, ch in enumerate(sorted(set("".join(left)) | set("".join(self.names))))}
+        self.counts = _char_counts(self.names, self.alphabet)
+        self.lengths = self.counts.sum(axis=1, dtype=np.int64)
+        left_counts = _char_counts(left, self.alphabet)
+        self.rank = _token_ranks(left_counts, self.counts)
+        self.span = int(max(self.lengths.max(initial=0), left_counts.sum(axis=1).max(initial=0))) + 1
+        self.chars = _char_codes(self.names, self.alphabet)
+
+        # Prefix tokens sorted by (token, length) so each left token only
+        # reaches partners within the length bound
+        if 0 < threshold <= 1:
+            r_tok, r_row, r_pos = _prefix_tokens(self.counts, self.rank, threshold)
+            key = r_tok * self.span + self.lengths[r_row]
+            order = np.argsort(key, kind="stable")
+            self.key, self.row, self.pos = key[order], r_row[order], r_pos[order]
+
+
+def _candidate_pairs(left_counts, index, chunk_pairs=CHUNK_PAIRS):
+    # Yields (left rows, right rows) pairs sharing a prefix token, each pair
+    # once, in chunks of whole left rows holding about `chunk_pairs` joins
+    threshold, span, r_len = index.threshold, index.span, index.lengths
+    r_key, r_row, r_pos = index.key, index.row, index.pos
+    n_right = len(index.names)
+    l_tok, l_row, l_pos = _prefix_tokens(left_counts, index.rank, threshold)
+    l_len = left_counts.sum(axis=1, dtype=np.int64)
+    low, high = _length_range(l_len[l_row], threshold, span - 1)
+    start = np.searchsorted(r_key, l_tok * span + low, side="left")
+    sizes = np.searchsorted(r_key, l_tok * span + high, side="right") - start
+
+    per_row = np.bincount(l_row, weights=sizes, minlength=len(left_counts))
+    bounds = np.searchsorted(l_row, np.flatnonzero(np.diff(np.cumsum(per_row) // chunk_pairs, prepend=0)))
+    for lo, hi in zip(np.r_[0, bounds], np.r_[bounds, len(l_row)]):
+        if lo == hi:
+            continue
+        n = sizes[lo:hi]
+        left = np.repeat(l_row[lo:hi], n)
+        pos_a = np.repeat(l_pos[lo:hi], n)
+        offsets = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)
+        matched = np.repeat(start[lo:hi], n) + offsets
+        right, pos_b = r_row[matched], r_pos[matched]
+
+        # PPJoin positional filter: nothing before the first shared token is
+        # shared, so the overlap is at most 1 + what follows it in either name.
+        # Later shared tokens sit further along in both names and give a
+        # smaller cap, so testing every entry keeps exactly the pairs whose
+        # first shared token passes.
+        la, lb = l_len[left], r_len[right]
+        reachable = 1 + np.minimum(la - pos_a - 1, lb - pos_b - 1)
+        ok = 2 * reachable >= threshold * (la + lb) - 1e-9
+        pair = np.sort(left[ok] * n_right + right[ok])
+        first = np.ones(len(pair), dtype=bool)  # may be empty once filtered
+        first[1:] = pair[1:] != pair[:-1]
+        pair = pair[first]
+        left, right = pair // n_right, pair % n_right
+        yield left, right
+
+
+# ---------------- MATCHING ----------------
+def _upper_bound_ok(left_counts, right_counts, left, right, threshold):
+    # Length bound, then shared-character bound; both >= the real ratio
+    la = left_counts.sum(axis=1, dtype=np.int64)[left]
+    lb = right_counts.sum(axis=1, dtype=np.int64)[right]
+    total = la + lb
+    ok = 2 * np.minimum(la, lb) >= threshold * total - 1e-9
+    rows = np.flatnonzero(ok)
+    shared = np.minimum(left_counts[left[rows]], right_counts[right[rows]]).sum(axis=1, dtype=np.int64)
+    ok[rows] = 2 * shared >= threshold * total[rows] - 1e-9
+    return ok
+
+
+def _char_codes(names, alphabet):
+    # Names as rows of alphabet codes, padded with -1
+    max_len = max((len(n) for n in names), default=0)
+    chars = np.full((len(names), max_len), -1, dtype=np.int64)
+    for j, name in enumerate(names):
+        chars[j, :len(name)] = [alphabet[ch] for ch in name]
+    return chars
+
+
+def _lcs_lengths(left, index, l_idx, r_idx):
+    # Longest common subsequence of each pair, bit-parallel (Hyyrö 2004) over
+    # all pairs at once. Matching blocks appear in the same order in both
+    # names, so SequenceMatcher never matches more characters than this.
+    # Pairs with a left name over 64 characters get an unbeatable bound.
+    alphabet, chars = index.alphabet, index.chars
+    width = max(len(alphabet), 1)
+    masks = np.zeros((len(left), width), dtype=np.uint64)
+    for i, name in enumerate(left):
+        for pos, ch in enumerate(name[:64]):
+            masks[i, alphabet[ch]] |= np.uint64(1) << np.uint64(pos)
+
+    v = np.full(len(l_idx), np.iinfo(np.uint64).max, dtype=np.uint64)
+    for pos in range(chars.shape[1]):
+        c = chars[r_idx, pos]
+        live = c >= 0
+        u = v & np.where(live, masks[l_idx, np.maximum(c, 0)], 0)
+        v = np.where(live, (v + u) | (v - u), v)
+
+    la = np.array([len(n) for n in left], dtype=np.int64)[l_idx]
+    low_bits = np.where(la >= 64, np.iinfo(np.uint64).max,
+                        (np.uint64(1) << np.minimum(la, 63).astype(np.uint64)) - np.uint64(1))
+    zeros = _POPCOUNT[(~v & low_bits).view(np.uint8)].reshape(-1, 8).sum(axis=1, dtype=np.int64)
+    return np.where(la > 64, np.iinfo(np.int64).max // 4, zeros)
+
+
+def _empty_matches():
+    return pd.DataFrame({"Left": np.empty(0, dtype=np.int64), "Right": np.empty(0, dtype=np.int64),
+                         "Similarity": np.empty(0)})
+
+
+def match_names(left, right, threshold=DEFAULT_THRESHOLD):
+    # DataFrame of Left / Right (positions in the inputs) and Similarity for
+    # every pair with similarity(left[i], right[j]) >= threshold, ordered like
+    # the nested loop `for i in left: for j in right`.
+    left, right = [str(n) for n in left], [str(n) for n in right]
+    if not left or not right or threshold > 1:
+        return _empty_matches()
+    return match_indexed(left, RightIndex(right, threshold, left))
+
+
+def match_indexed(left, index):
+    # match_names() against a prebuilt RightIndex; every left character must
+    # be in index.alphabet (pass these names as `left` when building it)
+    left, right, threshold = [str(n) for n in left], index.names, index.threshold
+    if not left or not right or threshold > 1:
+        return _empty_matches()
+
+    left_counts = _char_counts(left, index.alphabet)
+    right_counts = index.counts
+    if threshold <= 0:  # every pair passes, including ones sharing no character
+        chunks = [(np.repeat(np.arange(len(left)), len(right)), np.tile(np.arange(len(right)), len(left)))]
+    else:
+        # Empty names share no characters, but "" vs "" scores 1.0
+        l_empty = np.flatnonzero(left_counts.sum(axis=1) == 0)
+        r_empty = np.flatnonzero(index.lengths == 0)
+        chunks = [(np.repeat(l_empty, len(r_empty)), np.tile(r_empty, len(l_empty)))]
+        chunks = itertools.chain(chunks, _candidate_pairs(left_counts, index))
+
+    kept = []
+    for l_idx, r_idx in chunks:
+        ok = _upper_bound_ok(left_counts, right_counts, l_idx, r_idx, threshold)
+        kept.append((l_idx[ok], r_idx[ok]))
+    l_idx = np.concatenate([l for l, _ in kept])
+    r_idx = np.concatenate([r for _, r in kept])
+    total = np.array([len(n) for n in left])[l_idx] + np.array([len(n) for n in right])[r_idx]
+    ok = 2 * _lcs_lengths(left, index, l_idx, r_idx) >= threshold * total - 1e-9
+    l_idx, r_idx = l_idx[ok], r_idx[ok]
+
+    # SequenceMatcher caches its analysis of the second string, so group by it
+    scores = np.empty(len(l_idx))
+    order = np.argsort(r_idx, kind="stable")
+    matcher = SequenceMatcher(None)
+    current = None
+    for k in order:
+        if r_idx[k] != current:
+            current = r_idx[k]
+            matcher.set_seq2(right[current])
+        matcher.set_seq1(left[l_idx[k]])
+        scores[k] = matcher.ratio()
+
+    hit = scores >= threshold
+    out = pd.DataFrame({"Left": l_idx[hit], "Right": r_idx[hit], "Similarity": scores[hit]})
+    return out.sort_values(["Left", "Right"], ignore_index=True)
+
+
+# ---------------- PARALLEL ----------------
+_worker_index = None  # RightIndex, set once per worker process
+
+
+def _init_worker(index):
+    global _worker_index
+    _worker_index = index
+
+
+def _match_shard(shard):
+    offset, left = shard
+    out = match_indexed(left, _worker_index)
+    out["Left"] += offset
+    return out
+
+
+def match_names_parallel(left, right, threshold=DEFAULT_THRESHOLD, workers=None,
+                         shards_per_worker=SHARDS_PER_WORKER):
+    # match_names() with the left names split over `workers` processes
+    # (None: one per CPU). The right-name index is built once here and copied
+    # to each worker when it starts. Pairs never span shards, so concatenating
+    # the shards in order gives the same rows in the same order.
+    left, right = [str(n) for n in left], [str(n) for n in right]
+    workers = workers or os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    if not left or not right or threshold > 1:
+        return _empty_matches()
+
+    index = RightIndex(right, threshold, left)
+    n_shards = max(1, min(len(left), workers * shards_per_worker))
+    bounds = np.linspace(0, len(left), n_shards + 1).astype(int)
+    shards = [(lo, left[lo:hi]) for lo, hi in zip(bounds[:-1], bounds[1:])]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(index,)) as pool:
+        parts = list(pool.map(_match_shard, shards))
+    return pd.concat(parts, ignore_index=True)
@@ -0,0 +1,105 @@
+import os
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:  # no pyarrow -> only the csv format is available
+    pa = feather = pq = None
+
+# ==========================================================
+# PIPELINE INTERMEDIATES
+# ----------------------------------------------------------
+# The offline scripts hand frames to each other through files named after
+# their CSVs (active_roster_unplaced.csv, offer_accepted_candidates.csv,
+# combined_mit_data.csv). With PIPELINE_FORMAT=feather or parquet each of
+# these is also written as a typed Arrow file next to the CSV
+# (.arrow / .parquet) and the next stage reads that instead, so dates and
+# numbers keep their dtypes instead of being re-inferred from text. The CSV
+# is always written too, as the export for human review.
+#
+#   PIPELINE_FORMAT=feather python run_pipeline.py
+#   python run_pipeline.py --format parquet
+# ==========================================================
+
+FORMAT_ENV = "PIPELINE_FORMAT"
+SUFFIXES = {"csv": None, "feather": ".arrow", "parquet": ".parquet"}
+CSV_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"  # how the extract scripts have always written dates
+
+
+def pipeline_format(fmt=None):
+    # csv unless asked otherwise; an explicit feather/parquet needs pyarrow
+    fmt = (fmt or os.environ.get(FORMAT_ENV) or "csv").lower()
+    if fmt not in SUFFIXES:
+        raise ValueError(f"Unknown pipeline format {fmt!r}; use one of {', '.join(SUFFIXES)}")
+    if fmt != "csv" and pa is None:
+        raise ValueError(f"Pipeline format {fmt!r} needs pyarrow (pip install pyarrow), or use csv")
+    return fmt
+
+
+def typed_path(csv_path, fmt=None):
+    # Arrow file that stands in for csv_path, or None in CSV mode
+    suffix = SUFFIXES[pipeline_format(fmt)]
+    return None if suffix is None else Path(csv_path).with_suffix(suffix)
+
+
+def typed_paths(csv_names, fmt=None):
+    # Typed files standing in for these CSVs (none in CSV mode)
+    paths = [typed_path(name, fmt) for name in csv_names]
+    return [str(path) for path in paths if path is not None]
+
+
+# ---------------- WRITE ----------------
+def _arrow_table(df):
+    # Object columns mixing numbers and text (e.g. "N/A" next to 0) have no
+    # Arrow type; they are stored as text, which is what the CSV holds anyway
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowException, TypeError, ValueError):
+        pass
+    df = df.copy()
+    for col in df.columns:
+        if df[col].dtype != object:
+            continue
+        try:
+            pa.array(df[col], from_pandas=True)
+        except (pa.ArrowException, TypeError, ValueError):
+            df[col] = df[col].map(lambda v: v if pd.isna(v) else str(v)).astype(object)
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def write_frame(df, csv_path, fmt=None, date_format=None):
+    # Writes the CSV export and, in a typed format, the file the next stage
+    # reads. Typed files of other formats are removed so none goes stale.
+    fmt = pipeline_format(fmt)
+    csv_path = Path(csv_path)
+    df.to_csv(csv_path, index=False, date_format=date_format)
+    for other, suffix in SUFFIXES.items():
+        if suffix is not None and other != fmt:
+            csv_path.with_suffix(suffix).unlink(missing_ok=True)
+    if fmt == "csv":
+        return csv_path
+
+    path = typed_path(csv_path, fmt)
+    tmp = path.with_name(path.name + ".tmp")
+    table = _arrow_table(df)
+    if fmt == "feather":
+        feather.write_feather(table, tmp, compression="uncompressed")
+    else:
+        pq.write_table(table, tmp)
+    os.replace(tmp, path)
+    return path
+
+
+# ---------------- READ ----------------
+def read_frame(csv_path, fmt=None):
+    # The typed file when this format has one on disk, else the CSV
+    path = typed_path(csv_path, fmt)
+    if path is not None and path.exists():
+        if path.suffix == ".arrow":
+            return feather.read_table(path, memory_map=True).to_pandas()
+        return pq.read_table(path).to_pandas()
+    return pd.read_csv(csv_path)
@@ -0,0 +1,104 @@
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from dashboard_data import load_data, load_jobs_data
+from match_scoring import top_k_matches
+from segments import match_candidates, match_stages, segment_roster
+
+# ==========================================================
+# HEADLESS PLACEMENT MATCH REPORT
+# ----------------------------------------------------------
+# The dashboard's loading, segmentation and top-k matching, run as a batch
+# job: no Streamlit or Plotly import on this path. Reads the roster and
+# jobs sheets from their published URLs (or ROSTER_SHEET_SOURCE /
+# JOBS_SHEET_SOURCE, or --roster / --jobs: a URL or a local CSV in the
+# sheet layout) and writes every seeking candidate's top-k jobs.
+#
+#   python placement_report.py --output matches.csv
+#   python placement_report.py --roster roster.csv --jobs jobs.csv -k 5 --output matches.parquet
+#   python placement_report.py --output matches.json --as-of 2025-06-02
+# ==========================================================
+
+TOP_K = 3  # same default as the dashboard
+FORMATS = {".csv": "csv", ".json": "json", ".parquet": "parquet"}
+CANDIDATE_FIELDS = ["Candidate", "Stage", "Week", "Status"]  # JSON: per candidate, the rest per match
+
+
+# ---------------- REPORT ----------------
+def build_report(roster, jobs, k=TOP_K):
+    # One row per (seeking candidate, rank): the dashboard's top-k frame plus
+    # the candidate's stage as the dashboard's match views label it (Ready
+    # for Placement from MATCH_READY_WEEK, else In Training). Rows come k per
+    # candidate, in roster order.
+    candidates = match_candidates(segment_roster(roster))
+    matches = top_k_matches(candidates, jobs, k)
+    per_candidate = len(matches) // len(candidates) if len(candidates) else 0
+    matches.insert(1, "Stage", np.repeat(match_stages(candidates["Week"]), per_candidate))
+    return matches
+
+
+def report_records(report):
+    # [{"Candidate", "Stage", "Week", "Status", "matches": [...]}, ...]; a
+    # candidate's matches are the run of rows from Rank 1 up
+    rows = report.astype(object).where(report.notna(), None).to_dict(orient="records")
+    records = []
+    for row in rows:
+        if row["Rank"] == 1:
+            records.append({**{field: row[field] for field in CANDIDATE_FIELDS}, "matches": []})
+        records[-1]["matches"].append({key: value for key, value in row.items() if key not in CANDIDATE_FIELDS})
+    return records
+
+
+def write_report(report, path, fmt=None):
+    path = Path(path)
+    fmt = fmt or FORMATS.get(path.suffix.lower())
+    if fmt is None:
+        raise ValueError(f"Can't tell the output format of {path}; use --format {'/'.join(FORMATS.values())}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if fmt == "csv":
+        report.to_csv(path, index=False)
+    elif fmt == "parquet":
+        report.to_parquet(path, index=False)  # needs pyarrow
+    elif fmt == "json":
+        path.write_text(json.dumps(report_records(report)))
+    else:
+        raise ValueError(f"Unknown output format {fmt!r}")
+    return path
+
+
+# ---------------- CLI ----------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write every seeking candidate's top-k job matches")
+    parser.add_argument("--roster", default=None, help="roster sheet URL or CSV path (default: ROSTER_SOURCE)")
+    parser.add_argument("--jobs", default=None, help="open jobs sheet URL or CSV path (default: JOBS_SOURCE)")
+    parser.add_argument("-k", "--top-k", type=int, default=TOP_K, help="jobs per candidate (default: %(default)s)")
+    parser.add_argument("--output", type=Path, required=True, help="report file (.csv, .json or .parquet)")
+    parser.add_argument("--format", choices=sorted(set(FORMATS.values())), default=None,
+                        help="output format (default: from the --output suffix)")
+    parser.add_argument("--as-of", default=None, help="date the training weeks are counted to (default: today)")
+    args = parser.parse_args(argv)
+    if args.top_k < 1:
+        parser.error("--top-k must be at least 1")
+
+    start = time.perf_counter()
+    roster = load_data(args.roster, as_of=args.as_of)
+    jobs = load_jobs_data(args.jobs)
+    loaded = time.perf_counter()
+    report = build_report(roster, jobs, args.top_k)
+    scored = time.perf_counter()
+    path = write_report(report, args.output, args.format)
+
+    print(f"✅ {report['Candidate'].nunique()} candidates × top {args.top_k} of {len(jobs)} jobs "
+          f"-> {path} ({len(report)} rows)", file=sys.stderr)
+    print(f"⏱️ load {loaded - start:.2f}s | match {scored - loaded:.2f}s | "
+          f"write {time.perf_counter() - scored:.2f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
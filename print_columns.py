@@ -1,15 +1,15 @@
-import pandas as pd
+from workbook_ingest import WORKBOOK_PATH, read_placement_workbook
 
 # --- Step 1: Load your Excel file ---
-file_path = "MIT Tracking for Placement(Active_Roster) (1).xlsx"  # match your exact file name
+file_path = WORKBOOK_PATH  # match your exact file name
 
-# Load the first sheet (0 = first sheet)
-df_raw = pd.read_excel(file_path, sheet_name=0, header=None)
+# Only the roster section of the first sheet is needed
+workbook = read_placement_workbook(file_path, reqs=False)
 
-# --- Step 2: Extract headers from the second row (row index 1) ---
-headers = df_raw.iloc[1].tolist()
+# --- Step 2: Headers of the roster section ---
+headers = workbook.roster.columns.tolist()
 
 # --- Step 3: Print them ---
-print("\n📋 Column Names Found in Excel:")
+print(f"\n📋 Column Names Found in Excel (row {workbook.roster_header_row}):")
 for h in headers:
     print("-", h)
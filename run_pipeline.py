@@ -0,0 +1,232 @@
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from pipeline_io import FORMAT_ENV, SUFFIXES, pipeline_format, typed_paths
+from workbook_ingest import WORKBOOK_PATH
+
+# ==========================================================
+# OFFLINE PIPELINE RUNNER
+# ----------------------------------------------------------
+# Runs the offline scripts in dependency order inside a working directory:
+#   extract_active_roster.py   -> active_roster_unplaced.csv
+#   extract_offer_accepted.py  -> offer_accepted_candidates.csv
+#   merge_mit_datasets.py      -> combined_mit_data.csv
+#   compare_active_mit_only.py -> merged_dashboard_ready.csv + review files
+# Every input file and every source file of a stage is fingerprinted by
+# sha256. A stage whose fingerprints match its last successful run, and whose
+# outputs are still the files it wrote, is skipped. A stage that reruns but
+# writes identical bytes leaves its dependents skipped too. Stages whose
+# inputs are ready run in parallel (the two extracts), each in its own process.
+# With --format feather / parquet (or PIPELINE_FORMAT) the stages also hand
+# each other typed files next to the CSVs; see pipeline_io.py.
+#
+#   python run_pipeline.py
+#   python run_pipeline.py --format feather
+#   python run_pipeline.py --force merge_mit_datasets
+#   python run_pipeline.py --dir /path/to/data --jobs 1
+# ==========================================================
+
+ROOT = Path(__file__).resolve().parent
+STATE_FILE = ".pipeline_state.json"
+MASTER_ROSTER_PATH = "Copy of 2025 Leadership Development (NLT + MIT) Program Master Roster.xlsx"
+# CSVs one stage hands to the next; outside CSV mode each has a typed file too
+INTERMEDIATES = ["active_roster_unplaced.csv", "offer_accepted_candidates.csv", "combined_mit_data.csv"]
+
+
+class Stage:
+    def __init__(self, name, inputs, outputs, code=()):
+        self.name = name
+        self.script = f"{name}.py"
+        self.inputs = list(inputs)  # files read, relative to the working directory
+        self.outputs = list(outputs)  # files written, relative to the working directory
+        self.code = [self.script, "pipeline_io.py"] + list(code)  # repo modules whose changes rerun the stage
+
+    def inputs_for(self, fmt):
+        return typed_files(self.inputs, fmt)
+
+    def outputs_for(self, fmt):
+        return typed_files(self.outputs, fmt)
+
+
+def typed_files(names, fmt):
+    return names + typed_paths([n for n in names if n in INTERMEDIATES], fmt)
+
+
+STAGES = [
+    Stage("extract_active_roster", [WORKBOOK_PATH], ["active_roster_unplaced.csv"], ["workbook_ingest.py"]),
+    Stage("extract_offer_accepted", [WORKBOOK_PATH], ["offer_accepted_candidates.csv"], ["workbook_ingest.py"]),
+    Stage("merge_mit_datasets", ["active_roster_unplaced.csv", "offer_accepted_candidates.csv"],
+          ["combined_mit_data.csv"]),
+    Stage("compare_active_mit_only", ["combined_mit_data.csv", MASTER_ROSTER_PATH],
+          ["merged_dashboard_ready.csv", "exact_matches.csv", "confirmed_fuzzy.csv",
+           "possible_matches_review.csv", "only_in_combined.csv", "only_in_active.csv",
+           "duplicate_names_review.csv"],
+          ["name_matching.py", "workbook_ingest.py"]),
+]
+
+
+# ---------------- FINGERPRINTS ----------------
+def file_sha256(path):
+    # None for a missing file
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def fingerprint(stage, work_dir, fmt="csv"):
+    return {
+        "format": fmt,
+        "inputs": {name: file_sha256(Path(work_dir) / name) for name in stage.inputs_for(fmt)},
+        "code": {name: file_sha256(ROOT / name) for name in stage.code},
+    }
+
+
+def read_state(work_dir):
+    try:
+        return json.loads((Path(work_dir) / STATE_FILE).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def write_state(work_dir, state):
+    path = Path(work_dir) / STATE_FILE
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(state, indent=2, sort_keys=True))
+    os.replace(tmp, path)
+
+
+def is_fresh(stage, work_dir, previous, current):
+    # Same format, inputs and code as the last successful run, outputs untouched since
+    if not previous or any(previous.get(k) != current[k] for k in ("format", "inputs", "code")):
+        return False
+    outputs = previous.get("outputs", {})
+    return all(outputs.get(name) is not None and outputs.get(name) == file_sha256(Path(work_dir) / name)
+               for name in stage.outputs_for(current["format"]))
+
+
+# ---------------- STAGES ----------------
+def run_stage(stage, work_dir, fmt="csv"):
+    # Returns (ok, seconds, message)
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, str(ROOT / stage.script)], cwd=work_dir,
+                          capture_output=True, text=True, env={**os.environ, FORMAT_ENV: fmt})
+    seconds = time.perf_counter() - start
+    if proc.returncode != 0:
+        return False, seconds, (proc.stderr or proc.stdout).strip().splitlines()[-1:] or ["failed"]
+    # The scripts print a warning and exit(0) when the workbook lacks a section
+    missing = [name for name in stage.outputs_for(fmt) if not (Path(work_dir) / name).exists()]
+    if missing:
+        last = proc.stdout.strip().splitlines()[-1:] or [""]
+        return False, seconds, [f"did not write {', '.join(missing)}"] + last
+    return True, seconds, []
+
+
+def producers(stages):
+    # output file -> stage writing it
+    return {name: stage.name for stage in stages for name in stage.outputs}
+
+
+def run_pipeline(work_dir=ROOT, force=(), jobs=None, stages=STAGES, log=print, fmt=None):
+    # Returns {stage name: {"status", "seconds", "message"}} in stage order;
+    # status is "ran", "skipped", "failed" or "blocked" (an upstream stage failed)
+    work_dir = Path(work_dir)
+    fmt = pipeline_format(fmt)
+    state = read_state(work_dir)
+    made_by = producers(stages)
+    upstream = {s.name: {made_by[i] for i in s.inputs if i in made_by} for s in stages}
+    by_name = {s.name: s for s in stages}
+    unknown = set(force) - set(by_name) - {"all"}
+    if unknown:
+        raise ValueError(f"Unknown stage(s): {', '.join(sorted(unknown))}")
+
+    report = {}
+    pending = [s.name for s in stages]
+    running = {}
+    with ThreadPoolExecutor(max_workers=jobs or len(stages)) as pool:
+        while pending or running:
+            busy = set(pending) | {n for n, _ in running.values()}
+            for name in list(pending):
+                if upstream[name] & busy:
+                    continue
+                pending.remove(name)
+                stage = by_name[name]
+                if any(report[u]["status"] in ("failed", "blocked") for u in upstream[name]):
+                    report[name] = {"status": "blocked", "seconds": 0.0, "message": "upstream stage failed"}
+                    continue
+                start = time.perf_counter()
+                current = fingerprint(stage, work_dir, fmt)
+                if "all" not in force and name not in force and is_fresh(stage, work_dir, state.get(name), current):
+                    report[name] = {"status": "skipped", "seconds": time.perf_counter() - start,
+                                    "message": "inputs unchanged"}
+                    log(f"⏭️  {name}: inputs unchanged")
+                    continue
+                missing = [i for i, sha in current["inputs"].items() if sha is None]
+                if missing:
+                    report[name] = {"status": "failed", "seconds": 0.0,
+                                    "message": f"missing input {', '.join(missing)}"}
+                    log(f"❌ {name}: missing input {', '.join(missing)}")
+                    continue
+                log(f"▶️  {name}")
+                running[pool.submit(run_stage, stage, work_dir, fmt)] = (name, current)
+
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, current = running.pop(future)
+                ok, seconds, message = future.result()
+                if ok:
+                    outputs = {o: file_sha256(work_dir / o) for o in by_name[name].outputs_for(fmt)}
+                    state[name] = {**current, "outputs": outputs, "finished": time.time()}
+                    write_state(work_dir, state)
+                    report[name] = {"status": "ran", "seconds": seconds, "message": ""}
+                    log(f"✅ {name}: {seconds:.2f}s")
+                else:
+                    state.pop(name, None)
+                    write_state(work_dir, state)
+                    report[name] = {"status": "failed", "seconds": seconds, "message": " | ".join(message)}
+                    log(f"❌ {name}: {' | '.join(message)}")
+    return {s.name: report[s.name] for s in stages}
+
+
+def format_report(report, wall):
+    lines = [f"{'stage':<26} {'status':<8} {'seconds':>8}"]
+    for name, row in report.items():
+        lines.append(f"{name:<26} {row['status']:<8} {row['seconds']:8.2f}  {row['message']}")
+    lines.append(f"{'total (wall clock)':<26} {'':<8} {wall:8.2f}")
+    return "\n".join(lines)
+
+
+# ---------------- CLI ----------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the offline roster pipeline, skipping unchanged stages")
+    parser.add_argument("--dir", type=Path, default=ROOT, help="working directory holding the workbooks and CSVs")
+    parser.add_argument("--force", nargs="*", default=None, metavar="STAGE",
+                        help="rerun these stages even if unchanged (no names: every stage)")
+    parser.add_argument("--jobs", type=int, default=None, help="stages run at once (default: all that are ready)")
+    parser.add_argument("--format", choices=list(SUFFIXES), default=None,
+                        help=f"intermediate file format (default: ${FORMAT_ENV} or csv)")
+    args = parser.parse_args(argv)
+    force = [] if args.force is None else (args.force or ["all"])
+
+    start = time.perf_counter()
+    report = run_pipeline(args.dir, force=force, jobs=args.jobs, fmt=args.format)
+    print()
+    print(format_report(report, time.perf_counter() - start))
+    return 1 if any(row["status"] in ("failed", "blocked") for row in report.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
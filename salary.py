@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+# ==========================================================
+# SALARY NORMALIZATION
+# ----------------------------------------------------------
+# One parser for every salary we see in the roster and jobs sheets:
+# "$70,000", "70000", "70k-75k", "70,000 – 75,000", "68_74k"...
+# Each value becomes numeric low / high / mid columns. Parsing runs once per
+# distinct value: well-formed numbers and ranges are matched and converted
+# column-wise, and anything else falls back to parse_salary().
+# ==========================================================
+
+SALARY_LOW = "Salary Low"
+SALARY_HIGH = "Salary High"
+SALARY_MID = "Salary Mid"
+
+# A plain number as float() reads it, without a minus sign ("-" splits ranges)
+_NUMBER = r"\+?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE]\+?[0-9]+)?"
+_SINGLE = rf"\s*({_NUMBER})\s*"
+_RANGE = rf"\s*({_NUMBER})\s*-\s*({_NUMBER})\s*"
+
+
+def _normalize(s):
+    # "$70,000 – 75K" -> "70000-75000"
+    s = s.replace("$", "").replace(",", "").replace(" ", "").strip()
+    return s.lower().replace("k", "000").replace("–", "-").replace("—", "-").replace("_", "-")
+
+
+def parse_salary(s):
+    # Scalar parser: (low, high) or None. A single value gives low == high.
+    if pd.isna(s):
+        return None
+    if isinstance(s, (int, float)):
+        return (float(s), float(s))
+
+    s = _normalize(str(s))
+    if "-" in s:
+        try:
+            low, high = s.split("-")
+            return (float(low.strip()), float(high.strip()))
+        except ValueError:
+            return None
+    try:
+        return (float(s), float(s))
+    except ValueError:
+        return None
+
+
+def parse_salaries(values):
+    # DataFrame of Salary Low / High / Mid, aligned with `values`
+    values = pd.Series(values)
+    out = pd.DataFrame(np.nan, index=values.index, columns=[SALARY_LOW, SALARY_HIGH, SALARY_MID])
+    if is_numeric_dtype(values.dtype):
+        for col in out.columns:
+            out[col] = values.astype(float)
+        return out
+
+    codes, uniques = pd.factorize(values)
+    uniques = pd.Series(uniques, dtype=object)
+    low = np.full(len(uniques), np.nan)
+    high = np.full(len(uniques), np.nan)
+
+    is_number = uniques.map(lambda v: isinstance(v, (int, float))).to_numpy(dtype=bool)
+    low[is_number] = high[is_number] = uniques[is_number].astype(float)
+
+    # Text values: same normalization as _normalize(), then whole-string
+    # regex matches (Arrow kernels when pyarrow is installed)
+    text = uniques[~is_number].astype(str).reset_index(drop=True)
+    text = (
+        text.str.replace("$", "", regex=False).str.replace(",", "", regex=False).str.replace(" ", "", regex=False)
+        .str.strip().str.lower()
+        .str.replace("k", "000", regex=False).str.replace("–", "-", regex=False)
+        .str.replace("—", "-", regex=False).str.replace("_", "-", regex=False)
+    )
+    text_low = np.full(len(text), np.nan)
+    text_high = np.full(len(text), np.nan)
+    single = text.str.fullmatch(_SINGLE).to_numpy(dtype=bool)
+    ranged = text.str.fullmatch(_RANGE).to_numpy(dtype=bool)
+    text_low[single] = text_high[single] = text[single].str.strip().astype(float)
+    text_low[ranged] = text[ranged].str.replace(r"-.*$", "", regex=True).str.strip().astype(float)
+    text_high[ranged] = text[ranged].str.replace(r"^[^-]*-", "", regex=True).str.strip().astype(float)
+
+    # Odd spellings float() still accepts ("nan", "inf", unicode digits...)
+    for i in np.flatnonzero(~single & ~ranged):
+        parsed = parse_salary(text.iloc[i])
+        if parsed is not None:
+            text_low[i], text_high[i] = parsed
+    low[~is_number], high[~is_number] = text_low, text_high
+
+    with np.errstate(invalid="ignore", over="ignore"):
+        mid = np.where(low == high, low, (low + high) / 2)
+    # Missing values have code -1, which picks the trailing NaN
+    for col, parsed in [(SALARY_LOW, low), (SALARY_HIGH, high), (SALARY_MID, mid)]:
+        out[col] = np.append(parsed, np.nan)[codes]
+    return out
+
+
+def add_salary_columns(df, col="Salary"):
+    df = df.copy()
+    if col in df.columns:
+        parsed = parse_salaries(df[col])
+    else:
+        parsed = pd.DataFrame(np.nan, index=df.index, columns=[SALARY_LOW, SALARY_HIGH, SALARY_MID])
+    for name in parsed.columns:
+        df[name] = parsed[name]
+    return df
+
+
+def format_salaries(low, high, missing="TBD"):
+    # "$70,000", "$70,000–$75,000" or `missing`, for display tables
+    def fmt(lo, hi):
+        if pd.isna(lo) or pd.isna(hi):
+            return missing
+        return f"${lo:,.0f}" if lo == hi else f"${lo:,.0f}–${hi:,.0f}"
+
+    return pd.Series([fmt(lo, hi) for lo, hi in zip(low, high)], index=low.index, dtype=object)
@@ -0,0 +1,73 @@
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype, is_string_dtype
+
+from salary import SALARY_HIGH, SALARY_LOW, SALARY_MID
+
+# ==========================================================
+# ROSTER / JOBS SCHEMA
+# ----------------------------------------------------------
+# Explicit column types for the two cleaned sheets: low-cardinality text
+# columns become `category`, numbers stay numeric, and required columns are
+# checked up front. Every Streamlit session holds its own copies of these
+# frames, so the dtypes matter for server memory.
+# ==========================================================
+
+ROSTER_SCHEMA = {
+    "required": ["MIT Name", "Status"],
+    "category": ["Status", "Location", "Training Site", "Level", "VERT"],
+    "numeric": ["Week", "Weeks Until Start", "Salary", SALARY_LOW, SALARY_HIGH, SALARY_MID],
+    "datetime": ["Start Date"],
+    "text": [],
+    "fill_text": False,
+}
+
+JOBS_SCHEMA = {
+    "required": ["Job Title"],
+    "category": ["VERT", "Vertical", "City", "State", "Account", "Job Account"],
+    "numeric": [SALARY_LOW, SALARY_HIGH, SALARY_MID],
+    "datetime": [],
+    # Always text, even when the sheet column happens to be empty or numeric
+    "text": ["Job Title", "Title", "Salary"],
+    # Blank text cells become "" (the scoring treats "" and NaN differently)
+    "fill_text": True,
+}
+
+
+def apply_schema(df, schema, name="sheet"):
+    missing = [c for c in schema["required"] if c not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required {name} columns: {', '.join(missing)}")
+
+    df = df.copy()
+    for col in schema["numeric"]:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+    for col in schema["datetime"]:
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], errors="coerce")
+
+    if schema["fill_text"]:
+        declared = set(schema["text"]) | set(schema["category"])
+        for col in df.columns:
+            dtype = df[col].dtype
+            if is_string_dtype(dtype):
+                df[col] = df[col].fillna("")
+            elif col in declared or not (is_numeric_dtype(dtype) or is_datetime64_any_dtype(dtype)):
+                df[col] = df[col].astype(object).fillna("")
+
+    for col in schema["category"]:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def memory_report(before, after):
+    # Bytes per column (deep) before and after the schema, plus a total row
+    report = pd.DataFrame({
+        "dtype before": before.dtypes.astype(str),
+        "bytes before": before.memory_usage(deep=True, index=False),
+        "dtype after": after.dtypes.astype(str),
+        "bytes after": after.memory_usage(deep=True, index=False),
+    })
+    report.loc["TOTAL"] = ["", report["bytes before"].sum(), "", report["bytes after"].sum()]
+    return report
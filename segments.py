@@ -0,0 +1,188 @@
+import numpy as np
+import pandas as pd
+
+from match_scoring import numeric_values
+from salary import SALARY_HIGH, SALARY_LOW, format_salaries
+
+# ==========================================================
+# CANDIDATE PIPELINE SEGMENTS
+# ----------------------------------------------------------
+# One vectorized pass assigns every roster row a single pipeline stage.
+# The metrics, chart and tables in app.py all read from that one "Stage"
+# column instead of rebuilding the same Status/Week filters. The display
+# tables and match ordering are plain functions too, so every step between
+# the cleaned sheets and st.dataframe can run (and be timed) without Streamlit.
+# RosterSections / MatchSections bundle what each dashboard section draws,
+# so app.py builds them once per snapshot and its sections only draw.
+# ==========================================================
+
+READY = "Ready for Placement"
+IN_TRAINING = "In Training"
+OFFER_PENDING = "Offer Pending"
+OFFER_ACCEPTED = "Offer Accepted"
+POSITION_IDENTIFIED = "Position Identified"
+UNASSIGNED = "Unassigned"
+OTHER = "Other"
+STAGES = [READY, IN_TRAINING, OFFER_PENDING, OFFER_ACCEPTED, POSITION_IDENTIFIED, UNASSIGNED, OTHER]
+
+# Statuses of candidates still looking for a placement (these are scored in
+# the match section and counted in "Total Candidates")
+SEEKING_STATUSES = ["training", "unassigned", "free agent discussing opportunity"]
+READY_AFTER_WEEK = 6  # ready once past week 6
+# The match views (breakdown, match table, placement_report.py) call a
+# candidate ready from week 6 on, the stage tables and metrics from week 7
+MATCH_READY_WEEK = 6
+TABLE_COLUMNS = ["MIT Name", "Training Site", "Location", "Week", "Salary", "Level"]
+OFFER_PENDING_COLUMNS = ["MIT Name", "Training Site", "Location", "Level"]
+CHART_STAGES = [READY, IN_TRAINING, OFFER_PENDING]
+MATCH_TABLE_COLUMNS = ["Candidate", "Stage", "Week", "Rank", "Title", "Job Account", "City", "State", "VERT",
+                       "Total Score"]
+MATCH_PAGE_SIZE = 20  # candidates per page of the match breakdown
+TABLE_ROW_PX = 35
+TABLE_HEADER_PX = 60
+TABLE_MAX_ROWS = 12  # taller tables scroll inside st.dataframe
+
+
+def segment_roster(df):
+    # Adds "Stage" (categorical) and "Seeking" (bool) to a cleaned roster.
+    # Order matters: placement statuses win over the week-based stages.
+    # Status checks run once per distinct status and are spread back out
+    # through the factorized codes.
+    codes, uniques = pd.factorize(df["Status"], use_na_sentinel=False)
+    statuses = pd.Index(uniques).astype(str).str.strip().str.lower()
+
+    def status_is(*values):
+        return np.asarray(statuses.isin(values))[codes]
+
+    week = numeric_values(df["Week"]) if "Week" in df.columns else np.full(len(df), np.nan)
+    seeking = status_is(*SEEKING_STATUSES)
+    stage = np.select(
+        [
+            status_is("offer accepted"),
+            status_is("offer pending"),
+            status_is("position identified"),
+            week > READY_AFTER_WEEK,
+            status_is("training") & (week >= 0) & (week <= READY_AFTER_WEEK),
+            seeking,
+        ],
+        [OFFER_ACCEPTED, OFFER_PENDING, POSITION_IDENTIFIED, READY, IN_TRAINING, UNASSIGNED],
+        OTHER,
+    )
+
+    df = df.copy()
+    df["Stage"] = pd.Categorical(stage, categories=STAGES)
+    df["Seeking"] = seeking
+    return df
+
+
+def pipeline_metrics(segmented):
+    # Headline numbers for the METRICS row, from the precomputed columns
+    counts = segmented["Stage"].value_counts()
+    return {
+        "total_candidates": int(segmented["Seeking"].sum() + counts[OFFER_ACCEPTED]),
+        "ready": int(counts[READY]),
+        "in_training": int(counts[IN_TRAINING]),
+        "offer_pending": int(counts[OFFER_PENDING]),
+        "offer_accepted": int(counts[OFFER_ACCEPTED]),
+    }
+
+
+def stage_rows(segmented, stage):
+    return segmented[segmented["Stage"] == stage]
+
+
+def match_candidates(segmented):
+    # Candidates scored against open jobs
+    return segmented[segmented["Seeking"]].dropna(subset=["MIT Name"]).copy()
+
+
+# ---- DISPLAY ----
+def stage_table(rows, columns=TABLE_COLUMNS):
+    # Display copy of some roster rows: the columns present, "—" for blanks
+    # and salaries as "$70,000–$75,000" ranges
+    table = rows[[c for c in columns if c in rows.columns]].astype(object).fillna("—")
+    if "Salary" in table.columns:
+        table["Salary"] = format_salaries(rows[SALARY_LOW], rows[SALARY_HIGH])
+    return table
+
+
+def table_height(n_rows, max_rows=TABLE_MAX_ROWS):
+    # st.dataframe height that fits n_rows up to max_rows, then scrolls
+    return min(n_rows, max_rows) * TABLE_ROW_PX + TABLE_HEADER_PX
+
+
+def status_chart_data(metrics):
+    # Category / Count rows behind the status pie chart
+    counts = {READY: metrics["ready"], IN_TRAINING: metrics["in_training"], OFFER_PENDING: metrics["offer_pending"]}
+    return pd.DataFrame({"Category": CHART_STAGES, "Count": [counts[stage] for stage in CHART_STAGES]})
+
+
+def order_matches(match_df):
+    # Top-k matches grouped for the breakdown: ready candidates (week >=
+    # MATCH_READY_WEEK) first, then by week and score
+    match_df = match_df.sort_values("Total Score", ascending=False)
+    match_df["is_ready"] = (match_df["Week"] >= MATCH_READY_WEEK).astype(int)
+    return match_df.sort_values(["is_ready", "Week", "Total Score"], ascending=[False, False, False])
+
+
+def match_stage(week):
+    # The breakdown's label for a candidate's training week (NaN: In Training)
+    return READY if week >= MATCH_READY_WEEK else IN_TRAINING
+
+
+def match_stages(weeks):
+    # match_stage for a whole Week column
+    return np.where(np.asarray(weeks, dtype=float) >= MATCH_READY_WEEK, READY, IN_TRAINING)
+
+
+def week_label(week):
+    return "Week —" if pd.isna(week) else f"Week {int(week)}"
+
+
+def match_table(ordered):
+    # All top-k matches as one table, a candidate's jobs together by rank and
+    # candidates in breakdown order
+    position = pd.factorize(ordered["Candidate"])[0]  # codes follow first appearance
+    table = ordered.assign(_position=position).sort_values(["_position", "Rank"], kind="stable")
+    table["Stage"] = match_stages(table["Week"])
+    return table[[c for c in MATCH_TABLE_COLUMNS if c in table.columns]].reset_index(drop=True)
+
+
+def search_candidates(ordered, query=""):
+    # Candidate names in breakdown order, narrowed to those containing query
+    names = pd.Series(pd.unique(ordered["Candidate"]), dtype=object)
+    if query.strip():
+        names = names[names.str.contains(query.strip(), case=False, regex=False, na=False)]
+    return names.tolist()
+
+
+def page_count(n_items, page_size=MATCH_PAGE_SIZE):
+    return max(1, -(-n_items // page_size))
+
+
+def match_page(ordered, names, page, page_size=MATCH_PAGE_SIZE):
+    # Match rows of the candidates on one (1-based) page of names
+    shown = names[(page - 1) * page_size:page * page_size]
+    return ordered[ordered["Candidate"].isin(shown)]
+
+
+# ---- PRECOMPUTED SECTIONS ----
+class RosterSections:
+    def __init__(self, roster):
+        # Everything the metrics row, status chart and roster tables draw
+        self.segmented = segment_roster(roster)
+        self.metrics = pipeline_metrics(self.segmented)
+        self.chart = status_chart_data(self.metrics)
+        self.ready = stage_table(stage_rows(self.segmented, READY))
+        self.in_training = stage_table(stage_rows(self.segmented, IN_TRAINING))
+        self.offer_pending = stage_table(stage_rows(self.segmented, OFFER_PENDING), OFFER_PENDING_COLUMNS)
+        self.candidates = match_candidates(self.segmented)
+
+
+class MatchSections:
+    def __init__(self, match_df):
+        # The breakdown's ordered top-k rows, its one-table view and the
+        # candidate names the card pages step through
+        self.ordered = order_matches(match_df)
+        self.table = match_table(self.ordered)
+        self.names = search_candidates(self.ordered)
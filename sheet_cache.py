@@ -0,0 +1,172 @@
+import threading
+import time
+
+# ==========================================================
+# SHARED SHEET CACHE
+# ----------------------------------------------------------
+# One instance is shared by every Streamlit session (see get_sheet_cache in
+# app.py). Entries younger than `ttl` are served as-is. Older entries are
+# still served immediately while a background thread refetches them
+# (stale-while-revalidate), and a failed refetch keeps the last good
+# snapshot instead of surfacing an error. A failed cold load (nothing to
+# serve) is remembered too: its error is re-raised without refetching until
+# another `ttl` has passed.
+# ==========================================================
+
+
+class CacheEntry:
+    def __init__(self, value, fetched_at):
+        self.value = value
+        self.fetched_at = fetched_at
+        self.checked_at = fetched_at
+        self.last_error = None
+        self.refreshing = False
+        self.invalidated = False
+
+    def failed(self):
+        # A cold load that failed: there is only the error to serve
+        return self.value is None and self.last_error is not None
+
+
+class SheetCache:
+    def __init__(self, ttl=60, clock=time.time):
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.refresh_failures = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    # ---------------- READ ----------------
+    def get(self, key, loader, fallback=None):
+        # Returns (copy of the value, entry). Raises only when there is no
+        # snapshot at all and the loader fails.
+        #
+        # `fallback` is tried on a cold start (nothing cached yet). If it
+        # returns a value, e.g. the last snapshot on disk, that value is served
+        # straight away as a stale entry and the loader runs in the background.
+        if fallback is not None:
+            self._seed(key, fallback)
+        with self._lock:
+            entry = self._entries.get(key)
+            if self._backing_off(entry):
+                raise entry.last_error
+            if _servable(entry):
+                self.hits += 1
+                if self.clock() - entry.checked_at >= self.ttl:
+                    self.stale_hits += 1
+                    if not entry.refreshing:
+                        entry.refreshing = True
+                        threading.Thread(target=self._refresh_stale, args=(key, loader), daemon=True).start()
+                return _copy(entry.value), entry
+            self.misses += 1
+
+        # Cold or explicitly invalidated: fetch in the foreground, one fetch per key
+        with self._key_lock(key):
+            with self._lock:
+                entry = self._entries.get(key)
+                if self._backing_off(entry):
+                    raise entry.last_error  # another session's fetch just failed
+                if _servable(entry):
+                    return _copy(entry.value), entry
+            self._refresh(key, loader)
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry.failed():
+                    raise entry.last_error
+                return _copy(entry.value), entry
+
+    def _backing_off(self, entry):
+        # A failed cold load younger than the ttl and not invalidated since
+        return (
+            entry is not None and entry.failed() and not entry.invalidated
+            and self.clock() - entry.checked_at < self.ttl
+        )
+
+    # ---------------- WRITE ----------------
+    def invalidate(self, key=None):
+        # Next get() refetches in the foreground; the old snapshot is kept as a
+        # fallback in case that fetch fails.
+        with self._lock:
+            for k, entry in self._entries.items():
+                if key is None or k == key:
+                    entry.invalidated = True
+
+    def _refresh(self, key, loader):
+        try:
+            value = loader()
+        except Exception as e:
+            with self._lock:
+                self.refresh_failures += 1
+                entry = self._entries.get(key)
+                if entry is None:
+                    entry = self._entries[key] = CacheEntry(None, 0)
+                # Serve the last good snapshot (or, with none, this error)
+                # until the next fetch
+                entry.invalidated = False
+                entry.last_error = e
+                entry.checked_at = self.clock()  # retry after another ttl, not on every rerun
+                entry.refreshing = False
+            return
+        with self._lock:
+            self._entries[key] = CacheEntry(value, self.clock())
+
+    def _refresh_stale(self, key, loader):
+        # Background refetch; waits out a foreground fetch of the same key and
+        # skips its own if that one already brought the entry up to date
+        with self._key_lock(key):
+            with self._lock:
+                entry = self._entries.get(key)
+                if _servable(entry) and self.clock() - entry.checked_at < self.ttl:
+                    entry.refreshing = False
+                    return
+            self._refresh(key, loader)
+
+    def _seed(self, key, fallback):
+        # Also runs while a cold load keeps failing, so a snapshot that shows
+        # up later is served instead of the error
+        if self._has_value(key):
+            return
+        with self._key_lock(key):
+            if self._has_value(key):
+                return
+            try:
+                value = fallback()
+            except Exception:
+                value = None
+            if value is None:
+                return
+            with self._lock:
+                entry = self._entries[key] = CacheEntry(value, self.clock())
+                entry.checked_at = float("-inf")  # revalidate on first read
+
+    def _has_value(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry.value is not None
+
+    def _key_lock(self, key):
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    # ---------------- STATS ----------------
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale_hits": self.stale_hits,
+                "refresh_failures": self.refresh_failures,
+            }
+
+
+def _servable(entry):
+    return entry is not None and not entry.invalidated and not entry.failed()
+
+
+def _copy(value):
+    # Sessions must not mutate the shared snapshot (app.py adds columns)
+    return value.copy() if hasattr(value, "copy") else value
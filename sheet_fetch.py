@@ -0,0 +1,128 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+# ==========================================================
+# CONDITIONAL SHEET FETCHING + ON-DISK SNAPSHOTS
+# ----------------------------------------------------------
+# Each published sheet is stored as <name>.csv (raw bytes) next to
+# <name>.json (ETag, Last-Modified, sha256, fetch time). Requests send
+# If-None-Match / If-Modified-Since, a 304 reuses the bytes on disk, and a
+# failed request falls back to the last snapshot when there is one.
+# Snapshot writes are best effort: a failed write is logged and the fetched
+# bytes are still returned.
+# ==========================================================
+
+SNAPSHOT_DIR = Path(__file__).resolve().parent / ".sheet_snapshots"
+FETCH_TIMEOUT = 15  # seconds
+
+logger = logging.getLogger(__name__)
+
+
+class FetchResult:
+    def __init__(self, body, sha256, fetched_at, source, changed, error=None):
+        self.body = body
+        self.sha256 = sha256
+        self.fetched_at = fetched_at  # when these bytes were last confirmed by the server
+        self.source = source  # "network", "not modified" or "snapshot"
+        self.changed = changed  # bytes differ from the previous snapshot
+        self.error = error  # set when the network failed and the snapshot was used
+
+
+# ---------------- SNAPSHOTS ----------------
+def _paths(name, snapshot_dir):
+    snapshot_dir = Path(snapshot_dir)
+    return snapshot_dir / f"{name}.csv", snapshot_dir / f"{name}.json"
+
+
+def read_snapshot(name, snapshot_dir=SNAPSHOT_DIR):
+    # Returns (body, meta) or (None, {}) when nothing usable is on disk
+    body_path, meta_path = _paths(name, snapshot_dir)
+    try:
+        meta = json.loads(meta_path.read_text())
+        body = body_path.read_bytes()
+    except (OSError, ValueError):
+        return None, {}
+    if hashlib.sha256(body).hexdigest() != meta.get("sha256"):
+        return None, {}
+    return body, meta
+
+
+def _write_atomic(path, data):
+    # Each writer gets its own temp file, so concurrent writers (a background
+    # refresh, a second server, the report CLI) each replace the file whole
+    tmp = tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False)
+    try:
+        with tmp:
+            tmp.write(data)
+        os.replace(tmp.name, path)
+    except BaseException:
+        Path(tmp.name).unlink(missing_ok=True)
+        raise
+
+
+def write_snapshot(name, body, meta, snapshot_dir=SNAPSHOT_DIR):
+    # Returns False (and logs why) when the snapshot couldn't be written
+    body_path, meta_path = _paths(name, snapshot_dir)
+    try:
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        if body is not None:
+            _write_atomic(body_path, body)
+        _write_atomic(meta_path, json.dumps(meta, indent=2).encode())
+    except OSError as e:
+        logger.warning("Couldn't write the %s snapshot to %s: %s", name, snapshot_dir, e)
+        return False
+    return True
+
+
+# ---------------- FETCH ----------------
+def fetch_csv(url, name, snapshot_dir=SNAPSHOT_DIR, timeout=FETCH_TIMEOUT):
+    body, meta = read_snapshot(name, snapshot_dir)
+    if meta.get("url") != url:
+        body, meta = None, {}  # the sheet moved; don't revalidate against old bytes
+
+    headers = {}
+    if body is not None:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=timeout) as resp:
+            new_body = resp.read()
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and body is not None:
+            meta["fetched_at"] = time.time()
+            write_snapshot(name, None, meta, snapshot_dir)
+            return FetchResult(body, meta["sha256"], meta["fetched_at"], "not modified", changed=False)
+        return _offline(body, meta, e)
+    except (urllib.error.URLError, OSError) as e:
+        return _offline(body, meta, e)
+
+    sha256 = hashlib.sha256(new_body).hexdigest()
+    changed = sha256 != meta.get("sha256")
+    meta = {
+        "url": url,
+        "etag": etag,
+        "last_modified": last_modified,
+        "sha256": sha256,
+        "size": len(new_body),
+        "fetched_at": time.time(),
+    }
+    write_snapshot(name, new_body if changed else None, meta, snapshot_dir)
+    return FetchResult(new_body, sha256, meta["fetched_at"], "network", changed=changed)
+
+
+def _offline(body, meta, error):
+    if body is None:
+        raise error
+    return FetchResult(body, meta["sha256"], meta.get("fetched_at", 0), "snapshot", changed=False, error=error)
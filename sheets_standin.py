@@ -0,0 +1,149 @@
+import argparse
+import email.utils
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# ==========================================================
+# LOCAL SHEETS STAND-IN SERVER
+# ----------------------------------------------------------
+# Serves CSV bodies the way the published Google Sheets endpoints do, with
+# ETag / Last-Modified validators, so the fetch layer can be exercised
+# offline: 200 for new content, 304 when the client's validators match, and
+# any error status on demand via `fail_with`. With --synthetic it serves
+# generated roster / jobs sheets (synthetic_data.py) for the dashboard:
+#
+#   python sheets_standin.py --synthetic 5000 800
+#   ROSTER_SHEET_SOURCE=http://127.0.0.1:8765/roster.csv \
+#   JOBS_SHEET_SOURCE=http://127.0.0.1:8765/jobs.csv streamlit run app.py
+# ==========================================================
+
+
+class SheetStandIn:
+    def __init__(self, host="127.0.0.1", port=0):
+        self.sheets = {}  # path -> (body, etag, last_modified)
+        self.fail_with = None  # e.g. 500 or 503 to simulate an outage
+        self.delay = 0.0  # seconds to wait before answering (slow sheet)
+        self.send_validators = True
+        self.log = []  # (path, status) for every request served
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._thread = None
+
+    # ---------------- CONTENT ----------------
+    def set_sheet(self, path, body):
+        if isinstance(body, str):
+            body = body.encode()
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        self.sheets[path] = (body, etag, email.utils.formatdate(time.time(), usegmt=True))
+
+    def serve_synthetic(self, n_candidates, n_jobs, seed=0):
+        # Generated sheets at /roster.csv and /jobs.csv; returns their URLs
+        from synthetic_data import jobs_csv, roster_csv
+
+        self.set_sheet("/roster.csv", roster_csv(n_candidates, seed))
+        self.set_sheet("/jobs.csv", jobs_csv(n_jobs, seed + 1))
+        return self.url("/roster.csv"), self.url("/jobs.csv")
+
+    def url(self, path):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{path}"
+
+    # ---------------- LIFECYCLE ----------------
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ---------------- HANDLER ----------------
+    def _handler(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if standin.delay:
+                    time.sleep(standin.delay)
+                path = self.path
+                if standin.fail_with:
+                    return self._reply(path, standin.fail_with)
+                if path not in standin.sheets:
+                    return self._reply(path, 404)
+
+                body, etag, last_modified = standin.sheets[path]
+                if standin.send_validators and self._not_modified(etag, last_modified):
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    standin.log.append((path, 304))
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/csv; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                if standin.send_validators:
+                    self.send_header("ETag", etag)
+                    self.send_header("Last-Modified", last_modified)
+                self.end_headers()
+                self.wfile.write(body)
+                standin.log.append((path, 200))
+
+            def _not_modified(self, etag, last_modified):
+                if_none_match = self.headers.get("If-None-Match")
+                if if_none_match is not None:
+                    return if_none_match == etag
+                since = self.headers.get("If-Modified-Since")
+                if since is None:
+                    return False
+                try:
+                    return email.utils.parsedate_to_datetime(since) >= email.utils.parsedate_to_datetime(last_modified)
+                except (TypeError, ValueError):
+                    return False
+
+            def _reply(self, path, status):
+                self.send_error(status)
+                standin.log.append((path, status))
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+# ---------------- CLI ----------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve local CSV files like published Google Sheets")
+    parser.add_argument("csv", nargs="*", type=Path, help="CSV files, served at /<file name>")
+    parser.add_argument("--synthetic", nargs=2, type=int, metavar=("CANDIDATES", "JOBS"),
+                        help="also serve generated /roster.csv and /jobs.csv sheets")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    if not args.csv and not args.synthetic:
+        parser.error("give CSV files and/or --synthetic CANDIDATES JOBS")
+
+    server = SheetStandIn(port=args.port)
+    for path in args.csv:
+        server.set_sheet(f"/{path.name}", path.read_bytes())
+        print("📄", server.url(f"/{path.name}"))
+    if args.synthetic:
+        roster_url, jobs_url = server.serve_synthetic(*args.synthetic, seed=args.seed)
+        print(f"ROSTER_SHEET_SOURCE={roster_url}")
+        print(f"JOBS_SHEET_SOURCE={jobs_url}")
+    print("Serving — Ctrl+C to stop")
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,126 @@
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from dashboard_data import JOBS_SKIPROWS, ROSTER_SKIPROWS
+
+# ==========================================================
+# SYNTHETIC ROSTER / OPEN JOBS SHEETS
+# ----------------------------------------------------------
+# Generates N candidates and M open jobs laid out exactly like the two
+# published Google Sheets: the roster has one "Training info" banner row
+# above its header (ROSTER_SKIPROWS), the jobs sheet five title rows
+# (JOBS_SKIPROWS), and cells are written as the sheets write them ("Week "
+# with its trailing space, "$72,500" / "70k-75k" salaries, m/d/Y dates).
+# Used with sheets_standin.py to load-test the dashboard offline.
+#
+#   python synthetic_data.py --candidates 5000 --jobs 800 --out /tmp/sheets
+# ==========================================================
+
+# (value as typed in the sheet, share of rows)
+STATUSES = [
+    ("Training", 0.42), ("Unassigned", 0.08), ("Free Agent Discussing Opportunity", 0.05),
+    ("Offer Pending", 0.12), ("Offer Accepted", 0.10), ("Position Identified", 0.08), ("Placed", 0.15),
+]
+VERTS = [("AVI", 0.25), ("M&D", 0.25), ("EDU", 0.15), ("RBC", 0.1), ("DEF", 0.1), ("", 0.15)]
+LEVELS = [("MIT", 0.75), ("SMIT", 0.2), ("", 0.05)]
+CONFIDENCE = [("High", 0.3), ("Moderate", 0.35), ("Low", 0.15), ("", 0.2)]
+CANDIDATE_SALARIES = [("$70,000", 0.3), ("$72,500", 0.25), ("75000", 0.15), ("$80,000", 0.1),
+                      ("$68,000 - $72,000", 0.1), ("", 0.1)]
+JOB_SALARIES = [("$70,000", 0.2), ("70k-75k", 0.2), ("72,000 – 80,000", 0.15), ("85000", 0.1),
+                ("90k—95k", 0.05), ("TBD", 0.1), ("", 0.2)]
+CITIES = [("Dallas", "TX"), ("Austin", "TX"), ("Seattle", "WA"), ("Atlanta", "GA"), ("Chicago", "IL"),
+          ("Phoenix", "AZ"), ("Denver", "CO"), ("Miami", "FL"), ("Detroit", "MI"), ("Fremont", "CA")]
+ACCOUNTS = ["Boeing", "Amazon", "Delta", "Intel", "Tesla", "Ford", "Pfizer", "Nike"]
+TITLES = ["Site Manager", "Operations Manager", "Assistant Site Manager", "Facilities Manager"]
+NOTES = ["Amazon site lead", "prefers aviation", "retail background", "open to relocation", ""]
+
+
+def _pick(rng, choices, n):
+    values, weights = zip(*choices)
+    return np.asarray(values, dtype=object)[rng.choice(len(values), size=n, p=np.divide(weights, sum(weights)))]
+
+
+# ---------------- FRAMES ----------------
+def make_roster(n, seed=0, as_of=None):
+    # Raw roster rows. Start dates run from two months ahead of `as_of` to
+    # 14 weeks into training; Week is the training week the sheet would show,
+    # blank for future starts and for a fifth of rows (the loader computes those).
+    rng = np.random.default_rng(seed)
+    as_of = pd.Timestamp.now().normalize() if as_of is None else pd.Timestamp(as_of)
+    offset = rng.integers(-60, 98, size=n)  # days since start; negative = starts later
+    start = as_of - pd.to_timedelta(offset, unit="D")
+    week = (offset // 7 + 1).astype(object)
+    week[(offset < 0) | (rng.random(n) < 0.2)] = ""
+    city = rng.integers(len(CITIES), size=n)
+    site = rng.integers(len(CITIES), size=n)
+    location = [f"{CITIES[k][0]}, {CITIES[k][1]}" if r < 0.6 else CITIES[k][0] if r < 0.9 else ""
+                for k, r in zip(city, rng.random(n))]
+    return pd.DataFrame({
+        "MIT Name": [f"Candidate {i:06d}" for i in range(n)],
+        "Training Site": [f"{ACCOUNTS[k % len(ACCOUNTS)]} {CITIES[k][0]}" for k in site],
+        "Location": location,
+        "Week ": week,
+        "Start date": np.where(rng.random(n) < 0.03, "", start.strftime("%m/%d/%Y")),
+        "Salary": _pick(rng, CANDIDATE_SALARIES, n),
+        "Level": _pick(rng, LEVELS, n),
+        "Status": _pick(rng, STATUSES, n),
+        "VERT": _pick(rng, VERTS, n),
+        "Confidence": _pick(rng, CONFIDENCE, n),
+        "Notes": _pick(rng, [(note, 1) for note in NOTES], n),
+    })
+
+
+def make_jobs(m, seed=1):
+    # Raw open-jobs rows, with the link / ID columns and the unnamed spacer
+    # column the loader drops
+    rng = np.random.default_rng(seed)
+    city = rng.integers(len(CITIES), size=m)
+    return pd.DataFrame({
+        "JV ID": [f"JV{100000 + j}" for j in range(m)],
+        "JV Link": [f"https://jobs.example.com/JV{100000 + j}" for j in range(m)],
+        "Account": np.asarray(ACCOUNTS, dtype=object)[rng.integers(len(ACCOUNTS), size=m)],
+        "Job Title": _pick(rng, [(t, 1) for t in TITLES] + [("", 0.2)], m),
+        "City": [CITIES[k][0] for k in city],
+        "State": [CITIES[k][1] if r > 0.1 else "" for k, r in zip(city, rng.random(m))],
+        "VERT": _pick(rng, VERTS, m),
+        "Salary": _pick(rng, JOB_SALARIES, m),
+        "": "",
+    })
+
+
+# ---------------- SHEET CSV BODIES ----------------
+def _sheet_body(df, banner):
+    # CSV export of a sheet whose header sits below len(banner) rows
+    width = len(df.columns)
+    rows = "".join(",".join([title] + [""] * (width - 1)) + "\n" for title in banner)
+    return (rows + df.to_csv(index=False)).encode()
+
+
+def roster_csv(n, seed=0, as_of=None):
+    banner = ["Training info"] + [""] * (ROSTER_SKIPROWS - 1)
+    return _sheet_body(make_roster(n, seed, as_of), banner)
+
+
+def jobs_csv(m, seed=1):
+    banner = ["Open Jobs", f"{m} open positions", "", "Updated weekly", ""][:JOBS_SKIPROWS]
+    banner += [""] * (JOBS_SKIPROWS - len(banner))
+    return _sheet_body(make_jobs(m, seed), banner)
+
+
+# ---------------- CLI ----------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write synthetic roster.csv and jobs.csv in the published sheet layouts")
+    parser.add_argument("--candidates", type=int, default=1000)
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, default=Path("."))
+    args = parser.parse_args()
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    (args.out / "roster.csv").write_bytes(roster_csv(args.candidates, args.seed))
+    (args.out / "jobs.csv").write_bytes(jobs_csv(args.jobs, args.seed + 1))
+    print(f"✅ Wrote {args.candidates} candidates to {args.out / 'roster.csv'} "
+          f"and {args.jobs} jobs to {args.out / 'jobs.csv'}")
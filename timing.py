@@ -0,0 +1,135 @@
+import cProfile
+import json
+import logging
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+# ==========================================================
+# RERUN TIMING SPANS
+# ----------------------------------------------------------
+# A RerunTimer is created at the top of every app.py rerun. Each stage is
+# wrapped in a span; finished spans are logged as one JSON line each on the
+# "mit_dashboard.timing" logger and kept for the admin timing expander:
+#
+#   {"event": "span", "rerun": "3f2a9c1e", "stage": "load_data", "ms": 41.2, "rows": 39}
+#
+# A fragment rerunning on its own (app.py's sections are st.fragment) logs
+# its spans under "<page rerun>/<fragment>" instead, see RerunTimer.section.
+# Set DASHBOARD_TIMING_LOG=off to silence the log lines. Profiling one rerun
+# (the ?profile=1 switch in app.py) writes a cProfile dump to PROFILE_DIR.
+# ==========================================================
+
+LOGGER_NAME = "mit_dashboard.timing"
+PROFILE_DIR = Path(os.environ.get("DASHBOARD_PROFILE_DIR", Path(__file__).resolve().parent / ".profiles"))
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+def configure_logging():
+    # One stderr handler, added once per process; Streamlit only sets up
+    # handlers for its own loggers
+    level = os.environ.get("DASHBOARD_TIMING_LOG", "INFO").upper()
+    if level == "OFF":
+        logger.disabled = True
+        return logger
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(message)s"))
+        logger.addHandler(handler)
+        logger.propagate = False
+    logger.setLevel(level)
+    return logger
+
+
+class Span:
+    def __init__(self, timer, stage):
+        self.timer = timer
+        self.stage = stage
+        self.rows = None
+        self.ms = None
+        self._start = time.perf_counter()
+
+    def stop(self, rows=None):
+        if self.ms is None:
+            self.ms = 1000 * (time.perf_counter() - self._start)
+            self.rows = rows
+            self.timer._finished(self)
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.stop(self.rows)
+
+
+class RerunTimer:
+    def __init__(self, rerun_id=None):
+        self.rerun_id = rerun_id or uuid.uuid4().hex[:8]
+        self.spans = []
+        self.marks = {}  # name -> ms since the rerun started
+        self.total_ms = None  # set by finish()
+        self._start = time.perf_counter()
+
+    def start(self, stage):
+        # span = timer.start("metrics"); ...; span.stop(rows=len(df))
+        # or, as a context manager, `with timer.start("chart") as span:`
+        # (set span.rows inside the block)
+        return Span(self, stage)
+
+    def _finished(self, span):
+        self.spans.append(span)
+        logger.info(json.dumps({"event": "span", "rerun": self.rerun_id, "stage": span.stage,
+                                "ms": round(span.ms, 2), "rows": span.rows}))
+
+    def mark(self, name):
+        # A point in the rerun, e.g. "first_paint" once the metrics are drawn
+        self.marks[name] = self.elapsed_ms()
+        logger.info(json.dumps({"event": "mark", "rerun": self.rerun_id, "stage": name,
+                                "ms": round(self.marks[name], 2)}))
+
+    def elapsed_ms(self):
+        return 1000 * (time.perf_counter() - self._start)
+
+    def finish(self):
+        # Logs the rerun total with every stage, returns the total ms
+        self.total_ms = self.elapsed_ms()
+        logger.info(json.dumps({"event": "rerun", "rerun": self.rerun_id, "ms": round(self.total_ms, 2),
+                                "stages": {s.stage: round(s.ms, 2) for s in self.spans}}))
+        return self.total_ms
+
+    @contextmanager
+    def section(self, name):
+        # `with timer.section("match_breakdown") as t:` inside a fragment. On
+        # a page rerun t is this timer; once the page rerun has finished, the
+        # fragment is rerunning on its own and t is a timer for just that run.
+        if self.total_ms is None:
+            yield self
+            return
+        fragment_timer = RerunTimer(f"{self.rerun_id}/{name}")
+        yield fragment_timer
+        fragment_timer.finish()
+
+    def rows(self):
+        # Stage / ms / rows records for the timing table, in finishing order
+        return [{"Stage": s.stage, "ms": round(s.ms, 1), "Rows": s.rows} for s in self.spans]
+
+
+# ---------------- PROFILING ----------------
+def start_profile():
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+
+def stop_profile(profiler, rerun_id, profile_dir=PROFILE_DIR):
+    # Writes the dump (open with `python -m pstats` or snakeviz), returns its path
+    profiler.disable()
+    profile_dir = Path(profile_dir)
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    path = profile_dir / f"rerun-{time.strftime('%Y%m%d-%H%M%S')}-{rerun_id}.prof"
+    profiler.dump_stats(path)
+    return path
@@ -0,0 +1,223 @@
+import openpyxl
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+# ==========================================================
+# PLACEMENT WORKBOOK INGESTION
+# ----------------------------------------------------------
+# The first sheet of the placement tracker holds two sections:
+#   - the active roster: a header row, then one row per MIT
+#   - "MIT Reqs Open": a label row, a header row, then one row per req
+# The workbook is streamed once in openpyxl's read-only mode and the section
+# boundaries are found from the first few cells of each row only. Rows are
+# numbered like pd.read_excel(header=None) and each section is typed on its
+# own rows, the way pd.read_excel types a sheet.
+# ==========================================================
+
+WORKBOOK_PATH = "MIT Tracking for Placement(Active_Roster) (1).xlsx"
+REQS_MARKER = "MIT Reqs Open"
+ROSTER_HEADER_LABEL = "MIT Name"  # a cell of the roster header row
+ROSTER_HEADER_ROW = 1  # used when no row has ROSTER_HEADER_LABEL
+SCAN_COLUMNS = 8  # labels sit in the first columns; later cells are never searched
+
+# Master roster sheets (one header row, one row per trainee) are streamed in
+# batches instead: rows outside the requested programs and cells outside the
+# requested columns are dropped while reading.
+MIT_PROGRAMS = ("MIT", "SMIT")
+PROGRAM_COLUMN = "training program"
+BATCH_ROWS = 5_000
+
+
+class PlacementWorkbook:
+    def __init__(self, roster, reqs, roster_header_row, reqs_row, n_rows):
+        self.roster = roster  # active roster section, columns = header row
+        self.reqs = reqs  # "MIT Reqs Open" section, or None when the marker is missing
+        self.roster_header_row = roster_header_row
+        self.reqs_row = reqs_row  # row of the marker, or None
+        self.n_rows = n_rows  # rows read, same as len(pd.read_excel(header=None))
+
+
+# ---------------- ROWS ----------------
+def _convert(value):
+    # Same cell values pd.read_excel gives: "" for empty, whole numbers as int.
+    # Values alone can't tell an error cell from its text, so errors come
+    # through as text ("#N/A" is then read as missing, like any "#N/A" cell).
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _trimmed(row):
+    row = [_convert(v) for v in row]
+    while row and row[-1] == "":
+        row.pop()
+    return row
+
+
+def _has_label(row, label, exact=False):
+    label = label.lower()
+    for value in row[:SCAN_COLUMNS]:
+        if isinstance(value, str):
+            text = value.strip().lower()
+            if text == label or (not exact and label in text):
+                return True
+    return False
+
+
+def _sheet_values(path, sheet=0, max_col=None):
+    # Raw cell value tuples of one sheet, streamed; the workbook is closed afterwards
+    book = openpyxl.load_workbook(path, read_only=True, data_only=True, keep_links=False)
+    try:
+        ws = book.worksheets[sheet] if isinstance(sheet, int) else book[sheet]
+        ws.reset_dimensions()  # some writers leave a wrong sheet size behind
+        yield from ws.iter_rows(values_only=True, max_col=max_col)
+    finally:
+        book.close()
+
+
+def iter_sheet_rows(path, sheet=0):
+    # Trimmed row lists of one sheet, streamed
+    for row in _sheet_values(path, sheet):
+        yield _trimmed(row)
+
+
+# ---------------- SECTIONS ----------------
+def section_frame(rows, header, first_row, width):
+    # Typed frame of one section; columns are the raw header cells (blank -> NaN)
+    # and the index is the sheet row of each line
+    header = list(header) + [""] * (width - len(header))
+    columns = [float("nan") if h == "" else h for h in header]
+    rows = [r + [""] * (width - len(r)) for r in rows]
+    if rows:
+        df = TextParser(rows, header=None, skip_blank_lines=False).read()
+    else:
+        df = pd.DataFrame(index=range(0), columns=range(width), dtype=object)
+    df.columns = columns
+    df.index = pd.RangeIndex(first_row, first_row + len(df))
+    return df
+
+
+def read_placement_workbook(path=WORKBOOK_PATH, sheet=0, reqs=True):
+    # One pass over the sheet. With reqs=False reading stops at the marker.
+    rows, header_row, reqs_row = [], None, None
+    for row in iter_sheet_rows(path, sheet):
+        i = len(rows)
+        rows.append(row)
+        if reqs_row is None and _has_label(row, REQS_MARKER):
+            reqs_row = i
+            if not reqs:
+                break
+        elif reqs_row is None and header_row is None and _has_label(row, ROSTER_HEADER_LABEL, exact=True):
+            header_row = i
+
+    # pd.read_excel drops trailing empty rows and pads rows to the widest one
+    while rows and not rows[-1]:
+        rows.pop()
+    width = max((len(r) for r in rows), default=0)
+    if header_row is None:
+        header_row = ROSTER_HEADER_ROW
+    if header_row >= len(rows):
+        raise ValueError(f"{path}: no roster header row (looked for a '{ROSTER_HEADER_LABEL}' cell)")
+
+    roster_end = len(rows) if reqs_row is None else reqs_row
+    roster = section_frame(rows[header_row + 1:roster_end], rows[header_row], header_row + 1, width)
+    reqs_df = None
+    if reqs and reqs_row is not None:
+        header = rows[reqs_row + 1] if reqs_row + 1 < len(rows) else []
+        reqs_df = section_frame(rows[reqs_row + 2:], header, reqs_row + 2, width)
+    return PlacementWorkbook(roster, reqs_df, header_row, reqs_row, len(rows))
+
+
+# ---------------- ROSTER SHEETS ----------------
+def header_names(row):
+    # Stripped, lowercased column names as pd.read_excel(header=0) names them
+    # ("Unnamed: k" for blank cells, ".1", ".2" on repeats)
+    names, seen = [], {}
+    for k, value in enumerate(row):
+        name = f"Unnamed: {k}" if value == "" else str(value)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        seen.setdefault(name, 0)
+        names.append(name.strip().lower())
+    return names
+
+
+def read_header(path, sheet):
+    # Column names of a roster sheet; only its first row is read
+    return header_names(next(iter_sheet_rows(path, sheet), []))
+
+
+def _batch_frame(rows, positions, columns):
+    df = TextParser(rows, header=None, skip_blank_lines=False).read() if rows else pd.DataFrame(
+        index=range(0), columns=range(len(columns)), dtype=object)
+    df.columns = columns
+    df.index = pd.Index(positions, dtype="int64")
+    return df
+
+
+def _kept_rows(path, sheet, programs, columns, program_column):
+    # (normalized columns, iterator of (data row, converted cells)) for the
+    # rows and columns asked for
+    values = _sheet_values(path, sheet)
+    header = header_names(_trimmed(next(values, ())))
+    columns = header if columns is None else list(columns)
+    missing = [c for c in columns if c not in header]
+    if missing:
+        values.close()
+        raise ValueError(f"{path} [{sheet}]: no column(s) {missing}; found {header}")
+    picks = [header.index(c) for c in columns]
+    programs = None if programs is None else {str(p).upper() for p in programs}
+    program_at = header.index(program_column) if programs is not None and program_column in header else None
+
+    def rows():
+        blanks = []
+        for position, row in enumerate(values):
+            if program_at is not None:
+                program = row[program_at] if program_at < len(row) else None
+                if program is None or str(_convert(program)).upper() not in programs:
+                    continue
+            cells = [_convert(row[k]) if k < len(row) else "" for k in picks]
+            if program_at is None and all(v is None for v in row):
+                blanks.append((position, cells))  # kept only if data follows, like pd.read_excel
+                continue
+            yield from blanks
+            blanks = []
+            yield position, cells
+
+    return columns, rows()
+
+
+def iter_roster_batches(path, sheet, programs=None, columns=None, batch_rows=BATCH_ROWS,
+                        program_column=PROGRAM_COLUMN):
+    # DataFrames of at most batch_rows rows from a roster sheet, indexed by data
+    # row (row 0 is the one under the header, as with pd.read_excel). With
+    # programs, only rows whose program (upper-cased) is one of them are kept,
+    # unless the sheet has no program column; with columns, only those
+    # (normalized) columns are converted and returned. Each batch is typed on
+    # its own rows.
+    columns, kept = _kept_rows(path, sheet, programs, columns, program_column)
+    rows, positions, yielded = [], [], False
+    for position, cells in kept:
+        positions.append(position)
+        rows.append(cells)
+        if len(rows) >= batch_rows:
+            yield _batch_frame(rows, positions, columns)
+            rows, positions, yielded = [], [], True
+    if rows or not yielded:
+        yield _batch_frame(rows, positions, columns)
+
+
+def read_roster(path, sheet, programs=None, columns=None, program_column=PROGRAM_COLUMN):
+    # Same rows and columns as iter_roster_batches() in one frame, typed once
+    # over all kept rows; only those rows and columns are ever held. Without
+    # programs or columns this is pd.read_excel(path, sheet) with normalized
+    # headers.
+    columns, kept = _kept_rows(path, sheet, programs, columns, program_column)
+    positions, rows = [], []
+    for position, cells in kept:
+        positions.append(position)
+        rows.append(cells)
+    return _batch_frame(rows, positions, columns)